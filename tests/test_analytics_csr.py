@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph
+
+from wgu_osmt_builder.analytics.csr import CSRGraph, build_from_export, from_pairs, project
+from wgu_osmt_builder.graph.build.export import export_neo_csvs
+
+TTL = """
+@prefix :     <https://w3id.org/wgu/osmt/skills#> .
+@prefix rdf:  <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+
+:rsd-a rdf:type :RichSkillDescriptor ; :hasKeyword :kw-1, :kw-2 ; :hasOccupation :bls-1 .
+:rsd-b rdf:type :RichSkillDescriptor ; :hasKeyword :kw-1, :kw-2, :kw-missing .
+:rsd-c rdf:type :RichSkillDescriptor ; :hasKeyword :kw-2 .
+:kw-1 rdf:type :Keyword .
+:kw-2 rdf:type :Keyword .
+:bls-1 rdf:type :Occupation ; :partOf :bls-0 .
+:bls-0 rdf:type :Occupation .
+"""
+
+
+def _csr(tmp_path: Path) -> CSRGraph:
+    g = Graph()
+    g.parse(data=TTL, format="turtle")
+    export_neo_csvs(out_dir=tmp_path / "graph", graph=g)
+    return build_from_export(tmp_path / "graph", out_path=tmp_path / "graph.npz")
+
+
+def test_degree_neighbors_and_cooccurrence(tmp_path: Path) -> None:
+    csr = _csr(tmp_path)
+    kw = csr.rels["HAS_KEYWORD"]
+    assert kw.out_degree().tolist() == [2, 2, 1]      # kw-missing is dropped
+    assert kw.in_degree().tolist() == [2, 3]
+    assert csr.neighbors("HAS_KEYWORD", "rsd-b") == ["kw-1", "kw-2"]
+    assert csr.neighbors("HAS_KEYWORD", "kw-2", reverse=True) == ["rsd-a", "rsd-b", "rsd-c"]
+    assert csr.cooccurrence("HAS_KEYWORD", "rsd-a") == [("rsd-b", 2), ("rsd-c", 1)]
+    assert csr.degree("Occupation").tolist() == [1, 2]  # bls-0: in PART_OF; bls-1: out PART_OF + in HAS_OCCUPATION
+
+
+def test_npz_round_trip(tmp_path: Path) -> None:
+    csr = _csr(tmp_path)
+    loaded = CSRGraph.load(tmp_path / "graph.npz")
+    assert loaded.ids.keys() == csr.ids.keys()
+    for t, adj in csr.rels.items():
+        assert np.array_equal(loaded.rels[t].indptr, adj.indptr)
+        assert np.array_equal(loaded.rels[t].indices, adj.indices)
+    assert loaded.neighbors("PART_OF", "bls-1") == ["bls-0"]
+
+
+def test_projection_matches_dense_product() -> None:
+    rng = np.random.default_rng(0)
+    s, t = rng.integers(0, 40, 300), rng.integers(0, 25, 300)
+    adj = from_pairs("R", "A", "B", s, t, 40, 25)
+    dense = np.zeros((40, 25), dtype=int)
+    dense[s, t] = 1
+    want = dense @ dense.T
+    np.fill_diagonal(want, 0)
+
+    proj, w = project(adj)
+    got = np.zeros_like(want)
+    for i in range(40):
+        got[i, proj.row(i)] = w[proj.indptr[i]:proj.indptr[i + 1]]
+    assert np.array_equal(got, want)
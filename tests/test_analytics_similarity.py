@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from pathlib import Path
+
+import numpy as np
+
+from wgu_osmt_builder.analytics.similarity import (
+    FEATURE_RELS, SimilarityIndex, build_index, synthetic_graph, tfidf_rows, top_k,
+)
+
+
+def _dense_cosine(indptr, indices, data) -> np.ndarray:
+    n = len(indptr) - 1
+    x = np.zeros((n, int(indices.max()) + 1))
+    x[np.repeat(np.arange(n), np.diff(indptr)), indices] = data
+    sim = x @ x.T
+    np.fill_diagonal(sim, 0.0)
+    return sim
+
+
+def test_top_k_matches_exact_cosine() -> None:
+    csr = synthetic_graph(400, seed=3)
+    indptr, indices, data = tfidf_rows([csr.rels[t] for t in FEATURE_RELS])
+    sim = _dense_cosine(indptr, indices, data)
+
+    nbr, score = top_k(indptr, indices, data, k=5, block_pairs=2000)
+    assert np.allclose(score, -np.sort(-sim, axis=1)[:, :5], atol=1e-6)
+    rows = np.arange(400)[:, None]
+    assert np.allclose(sim[rows, nbr], score, atol=1e-6)
+
+
+def test_candidate_pruning_keeps_exact_scores() -> None:
+    csr = synthetic_graph(400, seed=4)
+    indptr, indices, data = tfidf_rows([csr.rels[t] for t in FEATURE_RELS])
+    sim = _dense_cosine(indptr, indices, data)
+
+    nbr, score = top_k(indptr, indices, data, k=5, candidate_df=10, block_pairs=2000)
+    found = nbr >= 0
+    assert found.any()
+    assert np.allclose(sim[np.nonzero(found)[0], nbr[found]], score[found], atol=1e-6)
+    assert (np.diff(score, axis=1) <= 1e-7).all()
+
+
+def test_index_round_trip_and_lookup(tmp_path: Path) -> None:
+    csr = synthetic_graph(200, seed=5)
+    index = build_index(csr, k=4)
+    index.save(tmp_path / "similar.npz")
+    loaded = SimilarityIndex.load(tmp_path / "similar.npz")
+
+    rsd = str(index.ids[0])
+    hits = loaded.similar(rsd)
+    assert hits == index.similar(rsd)
+    assert 0 < len(hits) <= 4 and rsd not in {h for h, _ in hits}
+    assert [s for _, s in hits] == sorted((s for _, s in hits), reverse=True)
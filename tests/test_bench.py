@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+from collections import Counter
+from pathlib import Path
+
+from wgu_osmt_builder.bench.suite import benchmark, compare, run_size
+from wgu_osmt_builder.bench.synthetic import synthetic_rsds, write_corpus
+
+
+def test_corpus_is_deterministic_and_skewed(tmp_path: Path) -> None:
+    a = [p.read_bytes() for p in write_corpus(50, tmp_path / "a", seed=3)]
+    b = [p.read_bytes() for p in write_corpus(50, tmp_path / "b", seed=3)]
+    assert a == b and a != [p.read_bytes() for p in write_corpus(50, tmp_path / "c", seed=4)]
+
+    docs = list(synthetic_rsds(2000))
+    assert len({d["uuid"] for d in docs}) == 2000
+    assert all(1 <= len(d["keywords"]) <= 8 for d in docs)  # 2–8 draws, repeats collapse
+    kw = Counter(k for d in docs for k in d["keywords"])
+    (_, top), = kw.most_common(1)
+    assert top > 20 * sorted(kw.values())[len(kw) // 2]  # Zipf head, not uniform
+    occ = next(o for d in docs for o in d["occupations"])
+    major, minor, broad = (p["code"] for p in occ["parents"])
+    assert major.endswith("-0000") and occ["code"][:4] == minor[:4] and occ["code"][:6] == broad[:6]
+
+
+def test_run_size_times_every_step(tmp_path: Path) -> None:
+    res = run_size(20, tmp_path)
+    assert list(res["steps"]) == [
+        "json2ttl", "merge", "validate.alignments", "validate.bls", "validate.keywords",
+        "validate.rsd", "validate.integrity", "validate.keyword_dupes", "graph",
+    ]
+    assert res["steps"]["json2ttl"]["output"] == 20 and res["steps"]["merge"]["output"] > 0
+    assert all(s["seconds"] > 0 and s["peak_mb"] >= 0 for s in res["steps"].values())
+    assert (tmp_path / "20" / "skills.ttl").exists() and any((tmp_path / "20" / "graph").glob("*.csv"))
+
+
+def test_compare_flags_regressions_past_threshold_and_floor() -> None:
+    def run(seconds: float, peak_mb: float) -> dict:
+        return {"sizes": {"1000": {"steps": {"merge": {"seconds": seconds, "peak_mb": peak_mb}}}}}
+
+    base = run(1.0, 100.0)
+    assert compare(run(1.2, 120.0), base, threshold=0.25) == []
+    (r,) = compare(run(1.5, 110.0), base, threshold=0.25)
+    assert (r["size"], r["step"], r["metric"], r["change"]) == (1000, "merge", "seconds", 0.5)
+    assert compare(run(0.03, 1.0), run(0.01, 0.2)) == []  # 3x, but below the noise floors
+    assert compare(run(9.0, 900.0), {"sizes": {}}) == []
+
+
+def test_baseline_roundtrip(tmp_path: Path, monkeypatch) -> None:
+    from wgu_osmt_builder.bench import suite
+
+    fake = {"sizes": {"10": {"skills": 10, "steps": {"merge": {"seconds": 1.0, "peak_mb": 10.0}}}}}
+    monkeypatch.setattr(suite, "run_suite", lambda *a, **k: json.loads(json.dumps(fake)))
+    assert benchmark([10], tmp_path, save_baseline=True) == 0
+    assert json.loads((tmp_path / "baseline-10.json").read_text())["sizes"] == fake["sizes"]
+    assert benchmark([10], tmp_path) == 0
+
+    fake["sizes"]["10"]["steps"]["merge"]["seconds"] = 2.0
+    assert benchmark([10], tmp_path) == 1
+    assert len(list(tmp_path.glob("results-*.json"))) >= 1
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+from pathlib import Path
+
+from rdflib import Graph
+
+from wgu_osmt_builder.build.assemble import process_directory
+from wgu_osmt_builder.build.changeset import diff_sorted, latest_changeset
+
+
+def _rsd(i: int, keywords: list[str]) -> dict:
+    return {
+        "type": "RichSkillDescriptor",
+        "uuid": f"00000000-0000-0000-0000-{i:012d}",
+        "skillName": f"Skill {i}",
+        "keywords": keywords,
+    }
+
+
+def test_diff_sorted() -> None:
+    assert list(diff_sorted(["a", "c", "d"], ["b", "c", "e"])) == [
+        ("D", "a"), ("A", "b"), ("D", "d"), ("A", "e")]
+
+
+def test_changeset_between_builds(tmp_path: Path) -> None:
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    ttl_out = tmp_path / "ttl"
+    merged = ttl_out / "skills.ttl"
+    changes = tmp_path / "changes"
+    for i in range(3):
+        (raw / f"{i}.json").write_text(json.dumps(_rsd(i, ["alpha"])), encoding="utf-8")
+
+    process_directory(raw, ttl_out, merged, changeset=True, changes_dir=changes)
+    assert latest_changeset(changes) is None  # first build: snapshot only
+    before = Graph().parse(merged, format="turtle")
+
+    (raw / "0.json").write_text(json.dumps(_rsd(0, ["alpha", "beta"])), encoding="utf-8")
+    (raw / "2.json").unlink()
+    (raw / "9.json").write_text(json.dumps(_rsd(9, ["alpha"])), encoding="utf-8")
+    process_directory(raw, ttl_out, merged, changeset=True, changes_dir=changes)
+
+    cs = latest_changeset(changes)
+    summary = json.loads((cs / "summary.json").read_text())
+    rsds = summary["rsds"]
+    assert rsds["rsd-00000000-0000-0000-0000-000000000000"]["status"] == "modified"
+    assert rsds["rsd-00000000-0000-0000-0000-000000000002"]["status"] == "removed"
+    assert rsds["rsd-00000000-0000-0000-0000-000000000009"]["status"] == "added"
+    assert "rsd-00000000-0000-0000-0000-000000000001" not in rsds
+
+    # applying the delta to the old graph yields the new graph
+    patched = set(before)
+    patched -= set(Graph().parse(cs / "delete.nt", format="nt"))
+    patched |= set(Graph().parse(cs / "add.nt", format="nt"))
+    assert patched == set(Graph().parse(merged, format="turtle"))
+    assert (cs / "patch.rdfp").read_text().splitlines()[-1] == "TC ."
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+from pathlib import Path
+
+from wgu_osmt_builder.build.assemble import merge_ttls_to_single_ontology
+from wgu_osmt_builder.build.json2ttl import TransformJSONtoTTL
+
+
+def _rsd(i: int) -> dict:
+    return {
+        "type": "RichSkillDescriptor",
+        "uuid": f"00000000-0000-0000-0000-{i:012d}",
+        "skillName": f"Skill {i}",
+        "skillStatement": f"Skill {i} statement",
+        "keywords": ["alpha", f"kw {i % 3}"],
+        "category": f"category_{i % 2}",
+        "standards": ["NICE-ABC-123"],
+        "collections": [{"uuid": "11111111-1111-1111-1111-111111111111", "name": "Demo Collection"}],
+        "alignments": [{"id": "https://example.org/align/foo", "skillName": "Foo Align"}],
+        "occupations": [{"code": "15-1252", "targetNodeName": "Software Developers", "parents": [{"code": "15-0000"}]}],
+    }
+
+
+def test_parallel_merge_matches_serial(tmp_path: Path) -> None:
+    stage = tmp_path / "partials"
+    converter = TransformJSONtoTTL()
+    for i in range(12):
+        src = tmp_path / f"{i}.json"
+        src.write_text(json.dumps(_rsd(i)), encoding="utf-8")
+        converter.process(str(src), str(stage / f"{i}.ttl"))
+
+    serial = tmp_path / "serial.ttl"
+    parallel = tmp_path / "parallel.ttl"
+    g_serial = merge_ttls_to_single_ontology(stage, serial, workers=1)
+    g_parallel = merge_ttls_to_single_ontology(stage, parallel, workers=3)
+
+    assert len(g_serial) == len(g_parallel)
+    assert serial.read_text(encoding="utf-8") == parallel.read_text(encoding="utf-8")
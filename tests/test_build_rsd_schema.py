@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+from pathlib import Path
+
+from wgu_osmt_builder.build.assemble import process_directory
+from wgu_osmt_builder.build.rsd_schema import rsd_errors
+
+
+def _rsd(uuid: str) -> dict:
+    return {
+        "type": "RichSkillDescriptor",
+        "uuid": uuid,
+        "skillName": "Skill",
+        "keywords": ["alpha", 7],
+        "standards": ["NICE-ABC-123", {"skillName": "NICE-DEF-456"}],
+        "occupations": [{"code": "15-1252", "parents": [{"code": "15-0000"}]}],
+    }
+
+
+def test_rsd_errors_paths() -> None:
+    assert rsd_errors(_rsd("u1")) == []
+    bad = _rsd("u1")
+    bad["occupations"] = ["15-1252"]
+    bad["keywords"] = ["ok", {"x": 1}]
+    assert rsd_errors(bad) == [
+        ("$.keywords[1]", "expected scalar, got dict"),
+        ("$.occupations[0]", "expected object, got str"),
+    ]
+    assert rsd_errors({"type": "RichSkillDescriptor"}) == [("$.uuid", "one of uuid or id is required")]
+    assert rsd_errors([]) == [("$", "expected object, got list")]
+
+
+def test_bad_inputs_are_quarantined_before_conversion(tmp_path: Path) -> None:
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "good.json").write_text(json.dumps(_rsd("good")), encoding="utf-8")
+    bad = _rsd("bad")
+    bad["collections"] = "not-a-list"
+    (raw / "bad.json").write_text(json.dumps(bad), encoding="utf-8")
+    (raw / "broken.json").write_text("{", encoding="utf-8")
+    (raw / "other.json").write_text(json.dumps({"type": "Collection"}), encoding="utf-8")
+
+    q = tmp_path / "quarantine"
+    merged = tmp_path / "ttl" / "skills.ttl"
+    process_directory(raw, tmp_path / "ttl", merged, quarantine_dir=q)
+
+    assert sorted(p.name for p in raw.iterdir()) == ["good.json", "other.json"]
+    assert sorted(p.name for p in q.glob("*.json")) == ["bad.json", "broken.json", "report.json"]
+    report = {Path(e["dst"]).name: e["errors"] for e in json.loads((q / "report.json").read_text())}
+    assert report["bad.json"] == [{"path": "$.collections", "msg": "expected list, got str"}]
+    assert report["broken.json"][0]["msg"].startswith("unreadable JSON")
+    assert "rsd-good" in merged.read_text()
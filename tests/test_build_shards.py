@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+from pathlib import Path
+
+from wgu_osmt_builder.build.assemble import process_directory
+from wgu_osmt_builder.build.shard import load_manifest, select_shards
+from wgu_osmt_builder.validate.keywords import extract_keyword_labels
+from wgu_osmt_builder.validate.rsd import extract_rsd_pref_labels
+from wgu_osmt_builder.validate.shards import REPORT_FILES, extract_reports_from_shards
+
+
+def _rsd(i: int) -> dict:
+    col = f"{i % 3}" * 8 + "-1111-1111-1111-111111111111"
+    return {
+        "type": "RichSkillDescriptor",
+        "uuid": f"00000000-0000-0000-0000-{i:012d}",
+        "skillName": f"Skill {i}",
+        "keywords": ["alpha", f"kw {i}"],
+        "category": "demo_category",
+        "collections": [{"uuid": col, "name": f"Collection {i % 3}"}],
+        "alignments": [{"id": f"https://example.org/align/{i}", "skillName": f"Align {i}"}],
+        "occupations": [{"code": "15-1252", "targetNodeName": "Software Developers", "parents": [{"code": "15-0000"}]}],
+    }
+
+
+def test_shards_by_collection_match_monolithic_reports(tmp_path: Path) -> None:
+    json_root = tmp_path / "json"
+    json_root.mkdir()
+    for i in range(6):
+        (json_root / f"{i}.json").write_text(json.dumps(_rsd(i)), encoding="utf-8")
+
+    ttl_out = tmp_path / "ttl"
+    merged = ttl_out / "skills.ttl"
+    process_directory(json_root, ttl_out, merged, shard_by="collection")
+
+    shard_dir = ttl_out / "shards"
+    manifest = load_manifest(shard_dir)
+    assert [e["rsds"] for e in manifest["shards"]] == [2, 2, 2]
+    assert all(len(e["sha256"]) == 64 and e["triples"] > 0 for e in manifest["shards"])
+
+    # whole set, in parallel → same as monolithic
+    sharded = tmp_path / "sharded"
+    extract_reports_from_shards(shard_dir, sharded, ["keywords", "rsd"], workers=2)
+    mono = tmp_path / "mono"
+    extract_keyword_labels(merged, mono / REPORT_FILES["keywords"])
+    extract_rsd_pref_labels(merged, mono / REPORT_FILES["rsd"])
+    for k in ("keywords", "rsd"):
+        assert (sharded / REPORT_FILES[k]).read_text() == (mono / REPORT_FILES[k]).read_text()
+
+    # single shard → only its RSDs
+    name = manifest["shards"][0]["name"]
+    assert select_shards(shard_dir, [name]) == [shard_dir / f"{name}.ttl"]
+    one = tmp_path / "one"
+    n = extract_reports_from_shards(shard_dir, one, ["rsd"], names=[name])
+    assert n == {"rsd": 2}
+
+
+def test_validate_shards_rejects_whole_graph_steps(tmp_path: Path) -> None:
+    from wgu_osmt_builder.common.cli import _build_parser
+
+    for flag in (["--integrity"], ["--near-dupes"], ["--incremental"], ["--prefix-index", str(tmp_path / "p")]):
+        args = _build_parser().parse_args(["validate", "--shards-dir", str(tmp_path), "--out-dir", str(tmp_path), *flag])
+        assert args.func(args) == 2
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+from pathlib import Path
+
+from rdflib import Graph
+from rdflib.namespace import SKOS
+
+from wgu_osmt_builder.build.assemble import merge_ttls_to_single_ontology
+from wgu_osmt_builder.build.watch import IncrementalAssembler, PollWatcher
+
+
+def _rsd(i: int, keywords: list[str]) -> dict:
+    return {
+        "type": "RichSkillDescriptor",
+        "uuid": f"00000000-0000-0000-0000-{i:012d}",
+        "skillName": f"Skill {i}",
+        "keywords": keywords,
+        "category": "demo_category",
+    }
+
+
+def _write(root: Path, i: int, keywords: list[str]) -> Path:
+    p = root / f"{i}.json"
+    p.write_text(json.dumps(_rsd(i, keywords)), encoding="utf-8")
+    return p
+
+
+def test_incremental_apply_matches_full_merge(tmp_path: Path) -> None:
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    ttl_out = tmp_path / "ttl"
+    merged = ttl_out / "skills.ttl"
+    paths = {_write(raw, i, ["shared", f"only {i}"]) for i in range(3)}
+
+    asm = IncrementalAssembler(raw, ttl_out, merged)
+    assert asm.apply(paths) == 3
+
+    # change one file, delete another: shared keyword must survive
+    changed = _write(raw, 0, ["shared", "replacement"])
+    gone = raw / "1.json"
+    gone.unlink()
+    asm.apply({changed, gone})
+    asm.flush()
+
+    expected = merge_ttls_to_single_ontology(ttl_out / ".partials", tmp_path / "full.ttl")
+    got = Graph()
+    got.parse(merged, format="turtle")
+    assert set(got) == set(expected)
+    labels = {str(o) for o in got.objects(None, SKOS.prefLabel)}
+    assert {"shared", "replacement", "only 2"} <= labels
+    assert "only 0" not in labels and "Skill 1" not in labels
+
+
+def test_poll_watcher_reports_new_and_deleted_files(tmp_path: Path) -> None:
+    w = PollWatcher(tmp_path, interval=0.0)
+    p = _write(tmp_path, 7, ["x"])
+    assert w.poll(0.0) == {p}
+    p.unlink()
+    assert w.poll(0.0) == {p}
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import argparse
+import subprocess
+import sys
+
+import pytest
+
+from wgu_osmt_builder.common import cli
+
+# Summed cumulative `-X importtime` of everything `cli` loads (interpreter `site` excluded).
+# Importing every subcommand module up front cost ~370 ms; with lazy handlers it is ~15 ms.
+BUDGET_US = 150_000
+HEAVY = ("rdflib", "numpy", "pyarrow", "requests")
+
+
+def _subcommands() -> list[str]:
+    action = next(a for a in cli._build_parser()._actions if isinstance(a, argparse._SubParsersAction))
+    return list(action.choices)
+
+
+def _importtime(*argv: str) -> tuple[int, set[str]]:
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-m", "wgu_osmt_builder.common.cli", *argv],
+                          capture_output=True, text=True)
+    total, modules = 0, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.add(name.strip())
+        if not name.startswith("  ") and name.strip() != "site":  # top-level imports only
+            total += int(cumulative)
+    return total, modules
+
+
+@pytest.mark.parametrize("cmd", _subcommands())
+def test_subcommand_help_within_budget(cmd: str) -> None:
+    total, modules = _importtime(cmd, "--help")
+    assert not {m.split(".")[0] for m in modules} & set(HEAVY)
+    assert total < BUDGET_US, f"{cmd} --help imports took {total / 1000:.0f} ms"
+
+
+def test_fetch_skips_rdf_and_array_stacks() -> None:
+    _, modules = _importtime("fetch")  # no --dir/--csv: imports the handler, then exits 2
+    assert "wgu_osmt_builder.fetch.wgu" in modules
+    assert not {m.split(".")[0] for m in modules} & {"rdflib", "numpy", "pyarrow"}
+    assert "wgu_osmt_builder.common.ua" not in modules
+
+
+def test_mirrored_defaults_match_owners() -> None:
+    from wgu_osmt_builder.bench import suite
+    from wgu_osmt_builder.build.shard import SHARD_BY
+    from wgu_osmt_builder.graph.build.admin_import import DEFAULT_PART_ROWS
+    from wgu_osmt_builder.graph.load.loader import DEFAULT_BATCH
+    from wgu_osmt_builder.index.prefix import KINDS
+    from wgu_osmt_builder.serve import server
+
+    assert cli.SHARD_BY == SHARD_BY
+    assert cli.PREFIX_KINDS == tuple(KINDS.values())
+    assert (cli.DEFAULT_BATCH, cli.DEFAULT_PART_ROWS) == (DEFAULT_BATCH, DEFAULT_PART_ROWS)
+    assert (cli.DEFAULT_HOST, cli.DEFAULT_PORT, cli.DEFAULT_CACHE) == (server.DEFAULT_HOST, server.DEFAULT_PORT, server.DEFAULT_CACHE)
+    assert (cli.BENCH_SIZES, cli.BENCH_THRESHOLD) == (suite.DEFAULT_SIZES, suite.THRESHOLD)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import csv
+import gzip
+import json
+from pathlib import Path
+
+from rdflib import Graph
+
+from wgu_osmt_builder.graph.build.admin_import import export_admin_import
+
+TTL = """
+@prefix :     <https://w3id.org/wgu/osmt/skills#> .
+@prefix rdf:  <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix dct:  <http://purl.org/dc/terms/> .
+
+:rsd-a rdf:type :RichSkillDescriptor ; skos:prefLabel "Skill A"@en ; dct:identifier "a" ;
+    dct:created "2024-01-02T03:04:05Z" ; :hasKeyword :kw-1, :kw-2, :kw-3 ; :hasOccupation :bls-15-1252 .
+:kw-1 rdf:type :Keyword ; skos:prefLabel "One"@en .
+:kw-2 rdf:type :Keyword ; skos:prefLabel "Two, \\"quoted\\""@en .
+:kw-3 rdf:type :Keyword ; skos:prefLabel "Three"@en .
+:bls-15-1252 rdf:type :Occupation ; skos:prefLabel "Software Developers"@en ; :partOf :bls-15-1250 .
+:bls-15-1250 rdf:type :Occupation ; skos:prefLabel "Software Group"@en .
+"""
+
+
+def _rows(out: Path, files: list[str]) -> list[list[str]]:
+    rows: list[list[str]] = []
+    for name in files[1:]:
+        with gzip.open(out / name, "rt", encoding="utf-8", newline="") as f:
+            rows.extend(csv.reader(f))
+    return rows
+
+
+def test_admin_import_layout(tmp_path: Path) -> None:
+    g = Graph()
+    g.parse(data=TTL, format="turtle")
+    (tmp_path / "stale.part-0009.csv.gz").write_bytes(b"")
+    manifest = json.loads(export_admin_import(out_dir=tmp_path, graph=g, rows_per_part=2).read_text())
+
+    nodes = {n["label"]: n for n in manifest["nodes"]}
+    rels = {r["type"]: r for r in manifest["relationships"]}
+
+    kw = nodes["Keyword"]
+    assert kw["header"] == ["id:ID(Keyword)", "prefLabel:string"]
+    assert kw["files"] == ["nodes_keyword.header.csv", "nodes_keyword.part-0000.csv.gz", "nodes_keyword.part-0001.csv.gz"]
+    assert (tmp_path / kw["files"][0]).read_text().strip() == "id:ID(Keyword),prefLabel:string"
+    assert _rows(tmp_path, kw["files"]) == [["kw-1", "One"], ["kw-2", 'Two, "quoted"'], ["kw-3", "Three"]]
+
+    assert "created:datetime" in nodes["RSD"]["header"]
+    assert nodes["RSD"]["header"][0] == "id:ID(RSD)"
+    assert nodes["Collection"]["rows"] == 0 and nodes["Collection"]["files"] == ["nodes_collection.header.csv"]
+
+    assert rels["HAS_KEYWORD"]["header"] == [":START_ID(RSD)", ":END_ID(Keyword)", ":TYPE"]
+    assert rels["HAS_KEYWORD"]["rows"] == 3
+    assert rels["PART_OF"]["header"][:2] == [":START_ID(Occupation)", ":END_ID(Occupation)"]
+    assert _rows(tmp_path, rels["HAS_OCCUPATION"]["files"]) == [["rsd-a", "bls-15-1252", "HAS_OCCUPATION"]]
+
+    assert not (tmp_path / "stale.part-0009.csv.gz").exists()
+    script = (tmp_path / "import.sh").read_text()
+    assert "--nodes=Keyword=nodes_keyword.header.csv,nodes_keyword.part-0000.csv.gz,nodes_keyword.part-0001.csv.gz" in script
+    assert "--relationships=PART_OF=rels_occupation_partOf.header.csv" in script
+    assert manifest["command"][-1] == "neo4j"
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+
+from wgu_osmt_builder.graph.build.diff import diff_exports, merge_diff
+from wgu_osmt_builder.graph.build.export import export_neo_csvs
+from wgu_osmt_builder.graph.load.loader import Loader
+
+PREFIXES = """
+@prefix :     <https://w3id.org/wgu/osmt/skills#> .
+@prefix rdf:  <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix dct:  <http://purl.org/dc/terms/> .
+"""
+
+OLD = PREFIXES + """
+:rsd-a rdf:type :RichSkillDescriptor ; skos:prefLabel "Skill A"@en ; :hasKeyword :kw-1, :kw-2 .
+:rsd-b rdf:type :RichSkillDescriptor ; skos:prefLabel "Skill B"@en ; :hasKeyword :kw-2 .
+:kw-1 rdf:type :Keyword ; skos:prefLabel "One"@en .
+:kw-2 rdf:type :Keyword ; skos:prefLabel "Two"@en .
+"""
+
+NEW = PREFIXES + """
+:rsd-a rdf:type :RichSkillDescriptor ; skos:prefLabel "Skill A (renamed)"@en ; :hasKeyword :kw-2, :kw-3 .
+:kw-2 rdf:type :Keyword ; skos:prefLabel "Two"@en .
+:kw-3 rdf:type :Keyword ; skos:prefLabel "Three"@en .
+"""
+
+
+def _export(ttl: str, out: Path) -> Path:
+    g = Graph()
+    g.parse(data=ttl, format="turtle")
+    export_neo_csvs(out_dir=out, graph=g)
+    return out
+
+
+def _rows(path: Path) -> list[list[str]]:
+    with path.open(encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))[1:]
+
+
+@pytest.fixture
+def delta(tmp_path: Path) -> Path:
+    old = _export(OLD, tmp_path / "old")
+    new = _export(NEW, tmp_path / "new")
+    diff_exports(old, new, tmp_path / "delta")
+    return tmp_path / "delta"
+
+
+def test_merge_diff_classifies_keys() -> None:
+    old = [["a", "1"], ["b", "1"], ["c", "1"]]
+    new = [["b", "2"], ["c", "1"], ["d", "1"]]
+    assert list(merge_diff(iter(old), iter(new), 1)) == [
+        ("old", ["a", "1"]), ("changed", ["b", "2"]), ("new", ["d", "1"]),
+    ]
+
+
+def test_diff_exports_writes_upserts_deletes_and_rel_changes(delta: Path) -> None:
+    upserts = {r[0] for r in _rows(delta / "nodes_rsd.upsert.csv")}
+    assert upserts == {"rsd-a"}
+    assert _rows(delta / "nodes_rsd.delete.csv") == [["rsd-b"]]
+    assert {r[0] for r in _rows(delta / "nodes_keyword.upsert.csv")} == {"kw-3"}
+    assert _rows(delta / "nodes_keyword.delete.csv") == [["kw-1"]]
+
+    added = {(r[0], r[1]) for r in _rows(delta / "rels_rsd_hasKeyword.add.csv")}
+    removed = {(r[0], r[1]) for r in _rows(delta / "rels_rsd_hasKeyword.remove.csv")}
+    assert added == {("rsd-a", "kw-3")}
+    assert removed == {("rsd-a", "kw-1"), ("rsd-b", "kw-2")}
+
+    summary = json.loads((delta / "summary.json").read_text(encoding="utf-8"))
+    assert summary["nodes"]["RSD"] == {"upsert": 1, "delete": 1}
+    assert summary["relationships"]["rels_rsd_hasKeyword"] == {"add": 1, "remove": 2}
+
+
+def test_identical_exports_give_empty_delta(tmp_path: Path) -> None:
+    a = _export(OLD, tmp_path / "a")
+    b = _export(OLD, tmp_path / "b")
+    summary = diff_exports(a, b, tmp_path / "delta")
+    assert all(v == {"upsert": 0, "delete": 0} for v in summary["nodes"].values())
+    assert all(v == {"add": 0, "remove": 0} for v in summary["relationships"].values())
+
+
+def test_unsorted_export_is_rejected(tmp_path: Path) -> None:
+    old = _export(OLD, tmp_path / "old")
+    new = _export(NEW, tmp_path / "new")
+    path = new / "nodes_keyword.csv"
+    lines = path.read_text(encoding="utf-8").splitlines()
+    path.write_text("\n".join([lines[0], *reversed(lines[1:])]) + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="not sorted"):
+        diff_exports(old, new, tmp_path / "delta")
+
+
+class _Session:
+    def __init__(self, calls: list) -> None:
+        self.calls = calls
+
+    def __enter__(self) -> "_Session":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def run(self, query: str, **params):
+        self.calls.append((query, params.get("rows")))
+        return self
+
+    def consume(self) -> None:
+        pass
+
+
+class _Driver:
+    def __init__(self) -> None:
+        self.calls: list = []
+
+    def session(self, database=None) -> _Session:
+        return _Session(self.calls)
+
+
+def test_apply_delta_orders_removes_before_adds(delta: Path) -> None:
+    driver = _Driver()
+    res = Loader(driver, backoff=0).apply_delta(delta)
+    assert res["rels_removed"]["HAS_KEYWORD"] == 2
+    assert res["nodes_deleted"]["RSD"] == res["nodes_deleted"]["Keyword"] == 1
+    assert res["rels_added"]["HAS_KEYWORD"] == 1
+
+    kinds = [q.splitlines()[-1].split()[0] for q, _ in driver.calls]
+    first_add = next(i for i, (q, _) in enumerate(driver.calls) if q.endswith("->(t)"))
+    assert "DELETE" in kinds[:2] and max(i for i, k in enumerate(kinds) if k in ("DELETE", "DETACH")) < first_add
+    upsert = next(q for q, _ in driver.calls if "MERGE (n:RSD" in q)
+    assert "coalesce" not in upsert
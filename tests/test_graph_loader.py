@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import threading
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+
+from wgu_osmt_builder.graph.build.export import export_neo_csvs
+from wgu_osmt_builder.graph.build.schema import REL_SPECS
+from wgu_osmt_builder.graph.load.loader import Loader, rel_waves
+
+TTL = """
+@prefix :     <https://w3id.org/wgu/osmt/skills#> .
+@prefix rdf:  <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix dct:  <http://purl.org/dc/terms/> .
+
+:rsd-a rdf:type :RichSkillDescriptor ; skos:prefLabel "Skill A"@en ; dct:identifier "a" ;
+    dct:created "2024-01-02T03:04:05Z" ; :hasKeyword :kw-1, :kw-2, :kw-3 ; :hasOccupation :bls-15-1252 .
+:kw-1 rdf:type :Keyword ; skos:prefLabel "One"@en .
+:kw-2 rdf:type :Keyword ; skos:prefLabel "Two"@en .
+:kw-3 rdf:type :Keyword .
+:bls-15-1252 rdf:type :Occupation ; skos:prefLabel "Software Developers"@en ; :partOf :bls-15-1250 .
+:bls-15-1250 rdf:type :Occupation ; skos:prefLabel "Software Group"@en .
+"""
+
+
+class TransientError(Exception):
+    pass
+
+
+class FakeResult:
+    def consume(self) -> None:
+        pass
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver") -> None:
+        self.driver = driver
+
+    def __enter__(self) -> "FakeSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def run(self, query: str, **params) -> FakeResult:
+        with self.driver.lock:
+            if self.driver.fail_next:
+                self.driver.fail_next -= 1
+                raise TransientError("deadlock")
+            self.driver.calls.append((query, params.get("rows")))
+        return FakeResult()
+
+
+class FakeDriver:
+    def __init__(self, fail_next: int = 0) -> None:
+        self.calls: list[tuple[str, list | None]] = []
+        self.fail_next = fail_next
+        self.lock = threading.Lock()
+
+    def session(self, database: str | None = None) -> FakeSession:
+        return FakeSession(self)
+
+
+@pytest.fixture
+def graph_dir(tmp_path: Path) -> Path:
+    g = Graph()
+    g.parse(data=TTL, format="turtle")
+    export_neo_csvs(out_dir=tmp_path, graph=g)
+    return tmp_path
+
+
+def test_loader_batches_and_statements(graph_dir: Path) -> None:
+    driver = FakeDriver()
+    res = Loader(driver, batch_size=2, backoff=0).load(graph_dir)
+    assert res["nodes"]["Keyword"] == 3
+    assert res["relationships"]["HAS_KEYWORD"] == 3
+    assert res["relationships"]["PART_OF"] == 1
+
+    kw = [rows for q, rows in driver.calls if "MERGE (n:Keyword" in q]
+    assert [len(b) for b in kw] == [2, 1]
+    assert {"id": "kw-3"} in kw[1] + kw[0]  # empty prefLabel is not sent
+
+    rsd_q = next(q for q, _ in driver.calls if "MERGE (n:RSD" in q)
+    assert "datetime(row.created)" in rsd_q
+    rel_q = next(q for q, _ in driver.calls if ":HAS_KEYWORD]" in q)
+    assert "MATCH (s:RSD {id: row.s})" in rel_q and "MATCH (t:Keyword {id: row.t})" in rel_q
+    assert any(q.startswith("CREATE CONSTRAINT") for q, _ in driver.calls)
+
+
+def test_loader_retries_transient_errors(graph_dir: Path) -> None:
+    driver = FakeDriver(fail_next=2)
+    Loader(driver, batch_size=100, backoff=0, workers=1).load(graph_dir, constraints=False)
+    assert sum(len(rows) for q, rows in driver.calls if "MERGE (n:Keyword" in q) == 3
+
+    driver = FakeDriver(fail_next=5)
+    with pytest.raises(TransientError):
+        Loader(driver, retries=2, backoff=0, workers=1).load(graph_dir, constraints=False)
+
+
+def test_rel_waves_disjoint_endpoints() -> None:
+    for wave in rel_waves(REL_SPECS):
+        ends = [c for spec in wave for c in {spec.src_cls, spec.dst_cls}]
+        assert len(ends) == len(set(ends))
+    assert sum(len(w) for w in rel_waves(REL_SPECS)) == len(REL_SPECS)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import csv
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+
+from wgu_osmt_builder.common.parquet_utils import column_name, reports_to_parquet
+from wgu_osmt_builder.graph.build.export import export_neo_csvs
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+TTL = """
+@prefix :     <https://w3id.org/wgu/osmt/skills#> .
+@prefix rdf:  <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix dct:  <http://purl.org/dc/terms/> .
+
+:rsd-a rdf:type :RichSkillDescriptor ; skos:prefLabel "Skill A"@en ; dct:identifier "a" ;
+    :status "published" ; :hasKeyword :kw-python, :kw-sql .
+:rsd-b rdf:type :RichSkillDescriptor ; skos:prefLabel "Skill B"@en ; dct:identifier "b" ;
+    :status "published" ; :hasKeyword :kw-python .
+:kw-python rdf:type :Keyword ; skos:prefLabel "Python"@en .
+:kw-sql rdf:type :Keyword ; skos:prefLabel "SQL"@en .
+"""
+
+
+def test_column_name() -> None:
+    assert column_name(":ID") == "id"
+    assert column_name(":START_ID") == "start_id"
+    assert column_name("created:datetime") == "created"
+
+
+def test_parquet_matches_csv(tmp_path: Path) -> None:
+    g = Graph()
+    g.parse(data=TTL, format="turtle")
+    export_neo_csvs(out_dir=tmp_path, graph=g, parquet=True)
+
+    for stem in ("nodes_rsd", "nodes_keyword", "rels_rsd_hasKeyword", "rels_occupation_partOf"):
+        with (tmp_path / f"{stem}.csv").open(encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))[1:]
+        table = pq.read_table(tmp_path / f"{stem}.parquet")
+        assert [list(r.values()) for r in table.to_pylist()] == rows
+
+    status = pq.read_table(tmp_path / "nodes_rsd.parquet", columns=["status"])
+    assert status.column_names == ["status"]
+    assert pq.ParquetFile(tmp_path / "nodes_rsd.parquet").metadata.row_group(0).column(4).encodings.count("RLE_DICTIONARY") == 1
+
+
+def test_reports_to_parquet(tmp_path: Path) -> None:
+    (tmp_path / "keyword-labels.txt").write_text("python\nsql\n", encoding="utf-8")
+    assert reports_to_parquet([tmp_path / "keyword-labels.txt", tmp_path / "missing.txt"]) == {"keyword-labels.parquet": 2}
+    assert pq.read_table(tmp_path / "keyword-labels.parquet").column("label").to_pylist() == ["python", "sql"]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import csv
+import json
+from pathlib import Path
+
+from rdflib import Graph
+
+from wgu_osmt_builder.graph.build.export import export_neo_csvs
+from wgu_osmt_builder.graph.build.stats import offline_stats, parse_plain_pairs, split_plain_results
+
+TTL = """
+@prefix :     <https://w3id.org/wgu/osmt/skills#> .
+@prefix rdf:  <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix dct:  <http://purl.org/dc/terms/> .
+
+:rsd-a rdf:type :RichSkillDescriptor ; skos:prefLabel "A"@en ;
+    :hasKeyword :kw-1, :kw-2 ; :hasOccupation :bls-1 ; :inCollection :col-1 .
+:rsd-b rdf:type :RichSkillDescriptor ; skos:prefLabel "B"@en ;
+    :hasKeyword :kw-1, :kw-missing ; :inCollection :col-1 .
+:kw-1 rdf:type :Keyword ; skos:prefLabel "One"@en .
+:kw-2 rdf:type :Keyword ; skos:prefLabel "Two"@en .
+:kw-3 rdf:type :Keyword ; skos:prefLabel "Unused"@en .
+:bls-1 rdf:type :Occupation ; skos:prefLabel "Occ"@en .
+:col-1 rdf:type :Collection ; dct:title "Col" .
+"""
+
+
+def _graph() -> Graph:
+    g = Graph()
+    g.parse(data=TTL, format="turtle")
+    return g
+
+
+def _rows(path: Path) -> list[list[str]]:
+    with path.open(encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))[1:]
+
+
+def test_offline_stats_counts_and_aggregates(tmp_path: Path) -> None:
+    export_neo_csvs(out_dir=tmp_path / "graph", graph=_graph())
+    stats = offline_stats(tmp_path / "graph", out_dir=tmp_path / "stats")
+
+    assert stats["nodes"]["RSD"] == 2 and stats["nodes"]["Keyword"] == 3
+    assert stats["relationships"]["HAS_KEYWORD"] == 3
+    assert stats["dangling"] == {"HAS_KEYWORD": 1}
+    assert stats["summary"] == {"nodes": 7, "relationships": 6}
+
+    assert _rows(tmp_path / "stats" / "keyword_frequency.csv") == [
+        ["kw-1", "One", "2"], ["kw-2", "Two", "1"], ["kw-3", "Unused", "0"],
+    ]
+    assert _rows(tmp_path / "stats" / "collection_sizes.csv") == [["col-1", "Col", "2"]]
+    assert _rows(tmp_path / "stats" / "occupation_skills.csv") == [["bls-1", "Occ", "1", "1"]]
+    degrees = _rows(tmp_path / "stats" / "degree_distribution.csv")
+    assert ["Keyword", "in", "0", "1"] in degrees and ["RSD", "out", "4", "1"] in degrees
+
+    doc = json.loads((tmp_path / "stats" / "stats.json").read_text(encoding="utf-8"))
+    assert doc["summary"] == stats["summary"]
+
+
+def test_ttl_and_csv_sources_agree(tmp_path: Path) -> None:
+    g = _graph()
+    export_neo_csvs(out_dir=tmp_path / "graph", graph=g)
+    ttl = tmp_path / "skills.ttl"
+    g.serialize(str(ttl), format="turtle")
+    from_csv = offline_stats(tmp_path / "graph", out_dir=None)
+    from_ttl = offline_stats(ttl_path=ttl, out_dir=None)
+    assert from_csv == from_ttl
+
+
+def test_split_plain_results_for_single_cypher_shell_call() -> None:
+    text = 'item, count\n"nodes", 7\n"relationships", 6\nlabel, count\n"Keyword", 3\ntype, count\n"HAS_KEYWORD", 3\n'
+    blocks = [parse_plain_pairs(b) for b in split_plain_results(text)]
+    assert blocks == [[("nodes", "7"), ("relationships", "6")], [("Keyword", "3")], [("HAS_KEYWORD", "3")]]
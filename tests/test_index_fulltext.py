@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+from pathlib import Path
+
+from wgu_osmt_builder.build.assemble import process_directory
+from wgu_osmt_builder.index import fulltext
+from wgu_osmt_builder.index.fulltext import FullTextIndex, build_segment, refresh_search_index, tokenize
+
+
+def _rsd(i: int, name: str, statement: str, keywords: list[str]) -> dict:
+    return {
+        "type": "RichSkillDescriptor",
+        "uuid": f"00000000-0000-0000-0000-{i:012d}",
+        "skillName": name,
+        "skillStatement": statement,
+        "keywords": keywords,
+    }
+
+
+def _ranked(index_dir: Path, q: str) -> list[str]:
+    return [i for i, _ in FullTextIndex.load(index_dir).search(q, 10)]
+
+
+def test_tokenize_matches_clean_label() -> None:
+    assert tokenize("  Data-Analysis,  ＳＱＬ  Queries. ") == ["data", "analysis", "sql", "queries"]
+
+
+def test_bm25_ranking() -> None:
+    seg = build_segment({
+        "rsd-a": {"name": "Welding safety", "statement": "Apply welding safety rules.", "keywords": "welding"},
+        "rsd-b": {"name": "Data analysis", "statement": "Analyze data sets with SQL.", "keywords": "sql"},
+        "rsd-c": {"name": "Machine safety", "statement": "Inspect machines for hazards.", "keywords": ""},
+    })
+    index = FullTextIndex({"segments": [{"name": "s", "docs": 3, "deleted": []}]}, [seg])
+    assert [i for i, _ in index.search("welding")] == ["rsd-a"]
+    assert {i for i, _ in index.search("safety")} == {"rsd-a", "rsd-c"}
+    assert index.search("safety welding")[0][0] == "rsd-a"
+    assert index.search("nothing matches") == []
+
+
+def test_incremental_segments_match_full(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(fulltext, "MAX_DELETED", 1.0)  # keep the tombstoned segment around
+    raw, ttl_out, changes = tmp_path / "raw", tmp_path / "ttl", tmp_path / "changes"
+    merged, idx = ttl_out / "skills.ttl", tmp_path / "fulltext"
+    raw.mkdir()
+
+    def build() -> None:
+        process_directory(raw, ttl_out, merged, changeset=True, changes_dir=changes)
+
+    for i, (name, kw) in enumerate([("Welding safety", "metal"), ("Data analysis", "sql"), ("Team leadership", "people")]):
+        (raw / f"{i}.json").write_text(json.dumps(_rsd(i, name, f"Statement about {name}.", [kw])), encoding="utf-8")
+    build()
+    assert refresh_search_index(merged, idx, changes)["mode"] == "full"
+    assert refresh_search_index(merged, idx, changes)["mode"] == "noop"
+    assert _ranked(idx, "sql")[0].endswith("000000000001")
+
+    # rename one skill, drop one, add one: one new segment + tombstones
+    (raw / "1.json").write_text(json.dumps(_rsd(1, "Spreadsheet modelling", "Build models.", ["excel"])), encoding="utf-8")
+    (raw / "2.json").unlink()
+    (raw / "7.json").write_text(json.dumps(_rsd(7, "Advanced welding", "TIG welding.", ["metal"])), encoding="utf-8")
+    build()
+    lines: list[str] = []
+    monkeypatch.setattr(fulltext.logger, "info", lines.append)
+    res = refresh_search_index(merged, idx, changes)
+    assert res["mode"] == "incremental" and res["docs"] == 3 and res["segments"] == 2
+    assert "2 document(s) re-indexed, 1 removed" in lines[-1]  # touched keywords are not counted
+    assert _ranked(idx, "sql") == []
+    assert _ranked(idx, "leadership") == []
+    assert len(_ranked(idx, "welding")) == 2
+
+    incremental = FullTextIndex.load(idx)
+    refresh_search_index(merged, tmp_path / "full", changes, force_full=True)
+    full = FullTextIndex.load(tmp_path / "full")
+    for q in ("welding", "metal spreadsheet", "statement about"):
+        a, b = incremental.search(q), full.search(q)
+        assert [i for i, _ in a] == [i for i, _ in b]
+        assert all(abs(x - y) < 1e-5 for (_, x), (_, y) in zip(a, b))
+
+    # past the deleted-postings threshold the next refresh folds everything into one segment
+    monkeypatch.setattr(fulltext, "MAX_DELETED", 0.25)
+    (raw / "0.json").write_text(json.dumps(_rsd(0, "Welding inspection", "Inspect welds.", ["metal"])), encoding="utf-8")
+    build()
+    res = refresh_search_index(merged, idx, changes)
+    assert res["mode"] == "incremental" and res["segments"] == 1 and res["docs"] == 3
+    assert sorted(p.name for p in idx.glob("seg-*.npz")) == [FullTextIndex.load(idx).manifest["segments"][0]["name"]]
+
+
+def test_language_change_rebuilds(tmp_path: Path) -> None:
+    raw, ttl_out, changes = tmp_path / "raw", tmp_path / "ttl", tmp_path / "changes"
+    merged, idx = ttl_out / "skills.ttl", tmp_path / "fulltext"
+    raw.mkdir()
+    (raw / "0.json").write_text(json.dumps(_rsd(0, "Welding safety", "Weld safely.", ["metal"])), encoding="utf-8")
+    process_directory(raw, ttl_out, merged, changeset=True, changes_dir=changes)
+
+    assert refresh_search_index(merged, idx, changes)["mode"] == "full"
+    assert FullTextIndex.load(idx).manifest["lang"] == "en"
+    assert refresh_search_index(merged, idx, changes, lang="en")["mode"] == "noop"
+    res = refresh_search_index(merged, idx, changes, lang="fr")
+    assert res["mode"] == "full" and FullTextIndex.load(idx).manifest["lang"] == "fr"
+    assert _ranked(idx, "welding") == []  # the converter tags labels @en
+    assert refresh_search_index(merged, idx, changes)["mode"] == "noop"  # None keeps the index's language
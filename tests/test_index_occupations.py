@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import csv
+from pathlib import Path
+
+from rdflib import Graph
+
+from wgu_osmt_builder.index.occupations import (
+    OccupationIndex, build_from_graph, build_occupation_index,
+)
+
+# BLS parents list every ancestor, not only the direct one
+TTL = """
+@prefix :    <https://w3id.org/wgu/osmt/skills#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+
+:bls-15-0000 rdf:type :Occupation .
+:bls-15-1200 rdf:type :Occupation ; :partOf :bls-15-0000 .
+:bls-15-1250 rdf:type :Occupation ; :partOf :bls-15-1200, :bls-15-0000 .
+:bls-15-1252 rdf:type :Occupation ; :partOf :bls-15-1250, :bls-15-1200, :bls-15-0000 .
+:bls-15-1253 rdf:type :Occupation ; :partOf :bls-15-1250, :bls-15-1200, :bls-15-0000 .
+:bls-29-0000 rdf:type :Occupation .
+
+:rsd-a rdf:type :RichSkillDescriptor ; :hasOccupation :bls-15-1252, :bls-15-1253 .
+:rsd-b rdf:type :RichSkillDescriptor ; :hasOccupation :bls-15-1253 .
+:rsd-c rdf:type :RichSkillDescriptor ; :hasOccupation :bls-15-1200, :bls-29-0000 .
+"""
+
+
+def _index(tmp_path: Path) -> OccupationIndex:
+    g = Graph()
+    g.parse(data=TTL, format="turtle")
+    return OccupationIndex.load(build_from_graph(g, tmp_path))
+
+
+def test_tree_reduction_and_closure(tmp_path: Path) -> None:
+    idx = _index(tmp_path)
+    assert idx.tree
+    assert idx.ancestors("15-1252") == ["bls-15-1250", "bls-15-1200", "bls-15-0000"]
+    assert idx.descendants("15-1200") == ["bls-15-1250", "bls-15-1252", "bls-15-1253"]
+    assert idx.is_ancestor("15-0000", "15-1253")
+    assert not idx.is_ancestor("15-1252", "15-1250")
+    assert not idx.is_ancestor("29-0000", "15-1252")
+
+
+def test_rollups_count_distinct_skills(tmp_path: Path) -> None:
+    idx = _index(tmp_path)
+    assert idx.rollup("15-1250") == (0, 2)       # rsd-a counted once across both children
+    assert idx.rollup("15-0000") == (0, 3)
+    assert idx.rollup("29-0000") == (1, 1)
+    assert idx.skills_under("15-1250") == ["rsd-a", "rsd-b"]
+    assert idx.skills_under("15-0000") == ["rsd-a", "rsd-b", "rsd-c"]
+
+    with (tmp_path / "occupation-rollups.csv").open(encoding="utf-8", newline="") as f:
+        rows = {r["id"]: r for r in csv.DictReader(f)}
+    assert rows["bls-15-1252"]["parent"] == "bls-15-1250"
+    assert rows["bls-15-0000"]["skills_rollup"] == "3"
+
+
+def test_unrelated_parents_fall_back_to_closure() -> None:
+    arrays = build_occupation_index(
+        ["bls-a", "bls-b", "bls-c", "bls-d"],
+        [("bls-c", "bls-a"), ("bls-c", "bls-b"), ("bls-d", "bls-c")],
+        [("r1", "bls-d")],
+    )
+    idx = OccupationIndex(arrays)
+    assert not idx.tree
+    assert idx.is_ancestor("a", "d") and idx.is_ancestor("b", "d")
+    assert idx.descendants("b") == ["bls-c", "bls-d"]
+    assert idx.rollup("a") == idx.rollup("b") == (0, 1)
+    assert idx.skills_under("b") == ["r1"]
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from pathlib import Path
+
+import numpy as np
+
+from wgu_osmt_builder.index import prefix
+from wgu_osmt_builder.index.prefix import PrefixIndex, build_prefix_index, write_prefix_index
+
+
+def _tables(n_extra: int = 0) -> dict:
+    keywords = [["kw-da", "Keyword", "Data Analysis"], ["kw-dv", "Keyword", "Data Visualization"],
+                ["kw-w", "Keyword", "Welding"], ["kw-e", "Keyword", ""]]
+    keywords += [[f"kw-x{i}", "Keyword", f"Dx{i:05d}"] for i in range(n_extra)]
+    return {
+        "nodes_rsd": ([], [["rsd-1", "RichSkillDescriptor", "Analyze Données"]]),
+        "nodes_keyword": ([], keywords),
+        "nodes_category": ([], [["cat-d", "Category", "Data Analysis"]]),
+        "nodes_occupation": ([], [["bls-15-2051", "Occupation", "Data Scientists"]]),
+        "rels_rsd_hasKeyword": ([], [["rsd-1", "kw-dv", "HAS_KEYWORD"], ["rsd-2", "kw-dv", "HAS_KEYWORD"],
+                                     ["rsd-1", "kw-da", "HAS_KEYWORD"]]),
+    }
+
+
+def test_ranked_suggestions_from_mapped_files(tmp_path: Path) -> None:
+    write_prefix_index(build_prefix_index(_tables()), tmp_path)
+    idx = PrefixIndex(tmp_path)
+    assert isinstance(idx.key_rank, np.memmap)
+
+    hits = idx.suggest("DATA ", k=10)
+    assert [h["id"] for h in hits][:2] == ["kw-dv", "kw-da"]        # frequency first
+    assert {h["kind"] for h in hits} == {"keyword", "category", "occupation"}
+    assert [h["id"] for h in idx.suggest("anal")] == ["rsd-1", "kw-da", "cat-d"]  # word starts match too
+    assert [h["label"] for h in idx.suggest("donn")] == ["Analyze Données"]
+    assert [h["id"] for h in idx.suggest("da", kinds=["occupation"])] == ["bls-15-2051"]
+    assert idx.suggest("zz") == [] and idx.suggest("  ") == []
+
+
+def test_wide_prefixes_use_precomputed_top(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(prefix, "SCAN", 8)
+    files = build_prefix_index(_tables(n_extra=40))
+    write_prefix_index(files, tmp_path)
+    assert files["manifest.json"]["hot"] > 0
+    idx = PrefixIndex(tmp_path)
+    assert [h["id"] for h in idx.suggest("d", k=2)] == ["kw-dv", "rsd-1"]
+    scanned = prefix._top(np.asarray(idx.key_rank), np.asarray(idx.key_entry), *idx._range(b"dx"), 5)
+    assert [idx.entry(e)["id"] for e in scanned] == [h["id"] for h in idx.suggest("dx", k=5)]
+
+
+def test_rebuild_switches_at_the_manifest(tmp_path: Path) -> None:
+    write_prefix_index(build_prefix_index(_tables()), tmp_path)
+    before = PrefixIndex(tmp_path)
+    first = before.manifest["build"]
+    write_prefix_index(build_prefix_index(_tables(n_extra=40)), tmp_path)
+    write_prefix_index(build_prefix_index(_tables(n_extra=40)), tmp_path)
+
+    after = PrefixIndex(tmp_path)
+    assert after.manifest["build"] != first and after.manifest["entries"] > before.manifest["entries"]
+    assert [h["id"] for h in before.suggest("anal")] == ["rsd-1", "kw-da", "cat-d"]  # old mapping still whole
+    assert len(list(tmp_path.glob("build-*"))) == 2 and not list(tmp_path.glob(".*.tmp"))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import io
+import logging
+
+from wgu_osmt_builder.common import log
+from wgu_osmt_builder.common.log import ItemSampler, Progress, configure_logger, configure_sampling, flush_logs, log_item
+
+
+class _Records(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _logger(name: str, level: int = logging.INFO) -> tuple[logging.Logger, _Records]:
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    logger.propagate = False
+    sink = _Records()
+    logger.addHandler(sink)
+    return logger, sink
+
+
+def test_records_are_written_by_the_listener_thread() -> None:
+    logger = configure_logger("tests.log.async")
+    assert isinstance(logger.handlers[0], log._AsyncHandler) and log._listener is not None
+    buf = io.StringIO()
+    old = log._stream.setStream(buf)
+    try:
+        logger.info("queued %s", "record")
+        flush_logs()
+    finally:
+        log._stream.setStream(old)
+    assert "INFO tests.log.async: queued record" in buf.getvalue()
+
+
+def test_item_logs_debug_or_sampled() -> None:
+    logger, sink = _logger("tests.log.items", logging.DEBUG)
+    log_item(logger, {"json2ttl": "ok", "src": "a.json"})
+    assert sink.records[0].levelno == logging.DEBUG
+    assert sink.records[0].getMessage() == '{"json2ttl": "ok", "src": "a.json"}'
+
+    logger, sink = _logger("tests.log.sampled")
+    try:
+        for i in range(9):
+            log_item(logger, "item %d", i)
+        assert sink.records == []  # sampling is off by default at INFO
+        configure_sampling(every=3, per_second=0)
+        for i in range(9):
+            log_item(logger, "item %d", i)
+        assert [r.getMessage() for r in sink.records] == ["item 2", "item 5", "item 8"]
+    finally:
+        configure_sampling()
+
+
+def test_rate_limit_refills_over_time() -> None:
+    now = [0.0]
+    sampler = ItemSampler(per_second=2, clock=lambda: now[0])
+    assert [sampler.take() for _ in range(4)] == [True, True, False, False]
+    now[0] = 0.5
+    assert [sampler.take() for _ in range(2)] == [True, False]
+    assert sampler.dropped == 3
+
+
+def test_progress_aggregates() -> None:
+    logger, sink = _logger("tests.log.progress")
+    now = [0.0]
+    with Progress(logger, "convert", total=100, interval=5, clock=lambda: now[0]) as progress:
+        for i in range(100):
+            now[0] = i * 0.1
+            progress.update(outcome="error" if i % 50 == 0 else "ok")
+    lines = [r.getMessage() for r in sink.records]
+    assert lines == [
+        "⏳ convert: 51/100 (51.0%) eta 5s 10/s error=2 ok=49",
+        "✅ convert: 100 in 9.9s (10/s) error=2 ok=98",
+    ]
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from pathlib import Path
+
+from wgu_osmt_builder.common.pipeline import Stage, run_pipeline
+
+
+def _upper(cfg: dict) -> None:
+    cfg["b"].write_text(cfg["a"].read_text().upper())
+
+
+def _count(cfg: dict) -> None:
+    cfg["c"].write_text(str(len(cfg["b"].read_text())))
+
+
+def _reverse(cfg: dict) -> None:
+    cfg["d"].write_text(cfg["b"].read_text()[::-1])
+
+
+def test_unchanged_stages_are_skipped(tmp_path: Path) -> None:
+    cfg = {k: tmp_path / f"{k}.txt" for k in "abcd"}
+    cfg["a"].write_text("hello")
+    stages = [
+        Stage("upper", _upper, (cfg["a"],), (cfg["b"],)),
+        Stage("count", _count, (cfg["b"],), (cfg["c"],), deps=("upper",)),
+        Stage("reverse", _reverse, (cfg["b"],), (cfg["d"],), deps=("upper",)),
+    ]
+    cache = tmp_path / "cache"
+
+    first = run_pipeline(cfg=cfg, stages=stages, cache_dir=cache)
+    assert first == {"upper": "ran", "count": "ran", "reverse": "ran"}
+    assert cfg["d"].read_text() == "OLLEH"
+
+    assert set(run_pipeline(cfg=cfg, stages=stages, cache_dir=cache).values()) == {"cached"}
+
+    # a clobbered output invalidates only its own stage
+    cfg["c"].write_text("stale")
+    again = run_pipeline(cfg=cfg, stages=stages, cache_dir=cache)
+    assert again == {"upper": "cached", "count": "ran", "reverse": "cached"}
+    assert cfg["c"].read_text() == "5"
+
+    # a changed input reruns the stage and everything downstream
+    cfg["a"].write_text("hello!")
+    assert set(run_pipeline(cfg=cfg, stages=stages, cache_dir=cache).values()) == {"ran"}
+    assert cfg["c"].read_text() == "6"
+
+
+def test_key_covers_only_declared_params_and_outputs(tmp_path: Path) -> None:
+    cfg = {"a": tmp_path / "a.txt", "out": tmp_path / "out", "workers": 1, "lang": "en"}
+    cfg["a"].write_text("hello")
+
+    def _split(cfg: dict) -> None:
+        cfg["out"].mkdir(exist_ok=True)
+        (cfg["out"] / "nodes_a.csv").write_text(cfg["a"].read_text())
+
+    stages = [Stage("split", _split, (cfg["a"],), (cfg["out"] / "nodes_*.csv",), params=("lang",))]
+    cache = tmp_path / "cache"
+    assert run_pipeline(cfg=cfg, stages=stages, cache_dir=cache) == {"split": "ran"}
+
+    # undeclared config and files written beside the outputs leave the stage cached
+    (cfg["out"] / "stats").mkdir()
+    (cfg["out"] / "stats" / "stats.json").write_text("{}")
+    assert run_pipeline(cfg={**cfg, "workers": 4}, stages=stages, cache_dir=cache) == {"split": "cached"}
+    assert run_pipeline(cfg={**cfg, "lang": "fr"}, stages=stages, cache_dir=cache) == {"split": "ran"}
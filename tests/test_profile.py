@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+import threading
+from pathlib import Path
+
+from wgu_osmt_builder.build.assemble import process_directory
+from wgu_osmt_builder.common import profile
+from wgu_osmt_builder.common.cli import _build_parser
+from wgu_osmt_builder.common.profile import Profiler, span
+
+
+def test_spans_aggregate_by_path() -> None:
+    assert span("idle") is profile._NOOP
+    with Profiler("job") as prof:
+        for _ in range(3):
+            with span("load"):
+                with span("parse"):
+                    pass
+        with span("write"):
+            pass
+    assert profile._active is None and span("idle") is profile._NOOP
+
+    tree = prof.tree()
+    assert tree["name"] == "job" and {c["name"] for c in tree["children"]} == {"load", "write"}
+    load = next(c for c in tree["children"] if c["name"] == "load")
+    (parse,) = load["children"]
+    assert (load["calls"], parse["name"], parse["calls"]) == (3, "parse", 3)
+    assert load["total_s"] >= parse["total_s"] and load["self_s"] <= load["total_s"]
+    assert all(line.split(" ")[0].split(";")[0] == "job" for line in prof.collapsed())
+
+
+def test_thread_spans_nest_under_root() -> None:
+    with Profiler("job") as prof:
+        def work() -> None:
+            with span("worker"):
+                pass
+        threads = [threading.Thread(target=work) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert prof.stats[("job", "worker")][0] == 2
+
+
+def test_build_report_files(tmp_path: Path) -> None:
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    for i in range(3):
+        (raw / f"{i}.json").write_text(json.dumps({
+            "type": "RichSkillDescriptor", "uuid": f"00000000-0000-0000-0000-{i:012d}",
+            "skillName": f"Skill {i}", "skillStatement": "Do it.", "keywords": ["kw"],
+        }), encoding="utf-8")
+
+    with Profiler("build", cprofile=True) as prof:
+        process_directory(raw, tmp_path / "ttl", tmp_path / "ttl" / "skills.ttl")
+    paths = prof.write(tmp_path / "profile")
+
+    assert sorted(paths) == ["collapsed", "json", "pstats"] and all(p.exists() for p in paths.values())
+    report = json.loads(paths["json"].read_text())
+    convert = next(c for c in report["children"] if c["name"] == "convert")
+    assert {c["name"]: c["calls"] for c in convert["children"]} == {"json_load": 3, "ttl_build": 3, "write": 3}
+    stacks = {ln.rsplit(" ", 1)[0] for ln in paths["collapsed"].read_text().splitlines()}
+    assert {"build;convert;json_load", "build;merge;parse", "build;merge;serialize"} <= stacks
+
+
+def test_global_flags_precede_subcommand() -> None:
+    args = _build_parser().parse_args(["--profile", "--profile-dir", "x", "graph", "--parquet"])
+    assert (args.profile, args.profile_dir, args.cmd, args.parquet) == (True, "x", "graph", True)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+import os
+import urllib.request
+from pathlib import Path
+
+from rdflib import Graph
+
+from wgu_osmt_builder.graph.build.export import export_neo_csvs
+from wgu_osmt_builder.index.occupations import build_from_graph as build_occupation_index
+from wgu_osmt_builder.index.skills import SkillsIndex, build_from_source
+from wgu_osmt_builder.serve.server import IndexHolder, LRUCache, query, start_server
+
+TTL = """
+@prefix :     <https://w3id.org/wgu/osmt/skills#> .
+@prefix rdf:  <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix dct:  <http://purl.org/dc/terms/> .
+
+:rsd-a rdf:type :RichSkillDescriptor ; skos:prefLabel "Alpha"@en ;
+    :hasKeyword :kw-1 ; :hasOccupation :bls-15-1252 ; :inCollection :col-x .
+:rsd-b rdf:type :RichSkillDescriptor ; skos:prefLabel "Beta"@en ; :hasKeyword :kw-1 ; :inCollection :col-x .
+:rsd-c rdf:type :RichSkillDescriptor ; skos:prefLabel "Gamma"@en ; :hasKeyword :kw-2 ; :hasOccupation :bls-15-0000 .
+:kw-1 rdf:type :Keyword ; skos:prefLabel "Data Analysis."@en .
+:kw-2 rdf:type :Keyword ; skos:prefLabel "Welding"@en .
+:bls-15-1252 rdf:type :Occupation ; :partOf :bls-15-0000 .
+:bls-15-0000 rdf:type :Occupation .
+:col-x rdf:type :Collection ; dct:title "X" ; dct:identifier "x-uuid" .
+"""
+
+
+def _index(tmp_path: Path) -> Path:
+    g = Graph()
+    g.parse(data=TTL, format="turtle")
+    export_neo_csvs(out_dir=tmp_path / "graph", graph=g)
+    build_occupation_index(g, tmp_path / "index")
+    return build_from_source(None, tmp_path / "graph", tmp_path / "index" / "skills.json")
+
+
+def test_lookups_and_pagination(tmp_path: Path) -> None:
+    index = SkillsIndex.load(_index(tmp_path))
+    assert index.skill("a")["prefLabel"] == "Alpha"
+    assert index.by_keyword("  DATA analysis ") == ["rsd-a", "rsd-b"]
+    assert index.by_collection("x-uuid") == index.by_collection("col-x") == ["rsd-a", "rsd-b"]
+    assert index.by_occupation("15-0000") == ["rsd-c"]
+    assert index.by_occupation("15-0000", subtree=True) == ["rsd-a", "rsd-c"]
+
+    status, body = query(index, "/keywords/data%20analysis", {"offset": ["1"], "limit": ["1"], "ids": ["1"]})
+    assert status == 200 and body["total"] == 2 and body["items"] == ["rsd-b"]
+    assert query(index, "/skills/nope", {})[0] == 404
+    assert query(index, "/keywords/x", {"limit": ["many"]})[0] == 400
+
+
+def test_lru_evicts_least_recent() -> None:
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None and cache.get("a") == 1
+    assert cache.stats()["hits"] == 2
+
+
+def test_http_and_hot_reload(tmp_path: Path) -> None:
+    path = _index(tmp_path)
+    server = start_server(path, port=0, reload_interval=0)
+    base = "http://%s:%d" % server.server_address[:2]
+    try:
+        get = lambda p: json.load(urllib.request.urlopen(base + p))  # noqa: E731
+        assert get("/collections/col-x")["total"] == 2
+        get("/collections/col-x")
+        assert get("/health")["cache"]["hits"] == 1
+
+        doc = json.loads(path.read_text())
+        doc["collections"]["col-x"] = ["rsd-a"]
+        path.write_text(json.dumps(doc))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert server.holder.check()
+        assert get("/collections/col-x")["total"] == 1
+        assert get("/health")["generation"] == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_newer_source_is_reindexed(tmp_path: Path) -> None:
+    path = _index(tmp_path)
+    holder = IndexHolder(path, graph_dir=tmp_path / "graph")
+    holder.check()
+    for f in (tmp_path / "graph").glob("*.csv"):
+        st = f.stat()
+        os.utime(f, ns=(st.st_atime_ns, path.stat().st_mtime_ns + 10**9))
+    assert holder.check() and holder.generation == 2
+    assert not holder.check()
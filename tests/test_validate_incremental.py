@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+from pathlib import Path
+
+from wgu_osmt_builder.build.assemble import process_directory
+from wgu_osmt_builder.validate.alignments import extract_alignment_labels
+from wgu_osmt_builder.validate.bls import extract_bls_pref_labels
+from wgu_osmt_builder.validate.incremental import refresh_reports
+from wgu_osmt_builder.validate.keywords import extract_keyword_labels
+from wgu_osmt_builder.validate.rsd import extract_rsd_pref_labels
+from wgu_osmt_builder.validate.shards import REPORT_FILES
+
+
+def _rsd(i: int, keywords: list[str], occ: str = "15-1252") -> dict:
+    return {
+        "type": "RichSkillDescriptor",
+        "uuid": f"00000000-0000-0000-0000-{i:012d}",
+        "skillName": f"Skill {i}",
+        "keywords": keywords,
+        "alignments": [{"id": f"https://example.org/align/{i}", "skillName": f"Align {i}"}],
+        "occupations": [{"code": occ, "targetNodeName": f"Occupation {occ}"}],
+    }
+
+
+def _full_reports(ttl: Path, out: Path) -> dict[str, str]:
+    extract_alignment_labels(ttl, out / REPORT_FILES["alignments"])
+    extract_bls_pref_labels(ttl, out / REPORT_FILES["bls"])
+    extract_keyword_labels(ttl, out / REPORT_FILES["keywords"])
+    extract_rsd_pref_labels(ttl, out / REPORT_FILES["rsd"])
+    return {k: (out / f).read_text(encoding="utf-8") for k, f in REPORT_FILES.items()}
+
+
+def _reports(out: Path) -> dict[str, str]:
+    return {k: (out / f).read_text(encoding="utf-8") for k, f in REPORT_FILES.items()}
+
+
+def test_incremental_matches_full(tmp_path: Path) -> None:
+    raw, ttl_out, changes = tmp_path / "raw", tmp_path / "ttl", tmp_path / "changes"
+    merged, reports = ttl_out / "skills.ttl", tmp_path / "reports"
+    raw.mkdir()
+
+    def build() -> None:
+        process_directory(raw, ttl_out, merged, changeset=True, changes_dir=changes)
+
+    for i in range(4):
+        (raw / f"{i}.json").write_text(json.dumps(_rsd(i, ["alpha", f"kw {i}"])), encoding="utf-8")
+    build()
+    assert refresh_reports(merged, reports, changes_dir=changes)["mode"] == "full"
+    assert refresh_reports(merged, reports, changes_dir=changes)["mode"] == "noop"
+
+    # one changeset: edit keywords, drop one RSD, add one with a new occupation
+    (raw / "0.json").write_text(json.dumps(_rsd(0, ["alpha", "beta"])), encoding="utf-8")
+    (raw / "3.json").unlink()
+    (raw / "9.json").write_text(json.dumps(_rsd(9, ["alpha"], occ="11-1021")), encoding="utf-8")
+    build()
+    res = refresh_reports(merged, reports, changes_dir=changes)
+    assert res["mode"] == "incremental"
+    assert set(res["written"]) == set(REPORT_FILES)
+    assert _reports(reports) == _full_reports(merged, tmp_path / "full1")
+
+    # two builds behind: the changeset chain is applied in order
+    (raw / "1.json").write_text(json.dumps(_rsd(1, ["kw 1", "gamma"])), encoding="utf-8")
+    build()
+    (raw / "1.json").write_text(json.dumps(_rsd(1, ["kw 1", "delta"])), encoding="utf-8")
+    build()
+    res = refresh_reports(merged, reports, changes_dir=changes)
+    assert res["mode"] == "incremental"
+    assert set(res["written"]) == {"keywords"}
+    assert _reports(reports) == _full_reports(merged, tmp_path / "full2")
+    assert "gamma" not in _reports(reports)["keywords"]
+
+    # ttl rebuilt without --changeset → fall back to a full rebuild
+    (raw / "2.json").unlink()
+    process_directory(raw, ttl_out, merged)
+    assert refresh_reports(merged, reports, changes_dir=changes)["mode"] == "full"
+    assert _reports(reports) == _full_reports(merged, tmp_path / "full3")
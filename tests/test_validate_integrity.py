@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from rdflib import Graph
+
+from wgu_osmt_builder.validate.integrity import check_integrity
+
+TTL = """
+@prefix :     <https://w3id.org/wgu/osmt/skills#> .
+@prefix rdf:  <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix dct:  <http://purl.org/dc/terms/> .
+
+:rsd-a rdf:type :RichSkillDescriptor ;
+    skos:prefLabel "Skill A"@en ;
+    dct:identifier "a" ;
+    :hasKeyword :kw-python, :kw-missing ;
+    :hasCategory :kw-python .
+
+:rsd-b rdf:type :RichSkillDescriptor ;
+    dct:identifier "a" .
+
+:kw-python rdf:type :Keyword ;
+    skos:prefLabel "Python"@en, "python."@en .
+
+:bls-15-1252 rdf:type :Occupation ;
+    skos:prefLabel "Software Developers"@en ;
+    :partOf :bls-15-1250 .
+
+:orphan skos:prefLabel "No type"@en .
+"""
+
+
+def test_integrity_checks() -> None:
+    g = Graph()
+    g.parse(data=TTL, format="turtle")
+    rep = check_integrity(g)
+    s = rep["summary"]
+    assert s == {
+        "dangling_refs": 3,
+        "untyped_nodes": 1,
+        "missing_labels": 1,
+        "slug_collisions": 1,
+        "duplicate_identifiers": 1,
+    }
+    dangling = {(d["source"], d["predicate"], d["target"]) for d in rep["checks"]["dangling_refs"]["examples"]}
+    assert dangling == {
+        ("rsd-a", "hasKeyword", "kw-missing"),
+        ("rsd-a", "hasCategory", "kw-python"),
+        ("bls-15-1252", "partOf", "bls-15-1250"),
+    }
+    assert rep["checks"]["untyped_nodes"]["examples"] == [{"node": "orphan"}]
+    assert rep["checks"]["missing_labels"]["examples"][0]["node"] == "rsd-b"
+    assert rep["checks"]["slug_collisions"]["examples"][0]["labels"] == ["Python", "python."]
+    assert rep["checks"]["duplicate_identifiers"]["examples"][0]["nodes"] == ["rsd-a", "rsd-b"]
+
+
+def test_integrity_limit() -> None:
+    g = Graph()
+    g.parse(data=TTL, format="turtle")
+    rep = check_integrity(g, limit=1)
+    assert rep["checks"]["dangling_refs"]["count"] == 3
+    assert len(rep["checks"]["dangling_refs"]["examples"]) == 1
+
+
+def test_integrity_labels_use_langmatches() -> None:
+    g = Graph()
+    g.parse(data="""
+@prefix :     <https://w3id.org/wgu/osmt/skills#> .
+@prefix rdf:  <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+
+:kw-data rdf:type :Keyword ; skos:prefLabel "Data"@en-US .
+:kw-plain rdf:type :Keyword ; skos:prefLabel "Plain" .
+:kw-fr rdf:type :Keyword ; skos:prefLabel "Données"@fr .
+""", format="turtle")
+    for lang in ("en", "EN"):
+        missing = check_integrity(g, lang=lang)["checks"]["missing_labels"]["examples"]
+        assert [m["node"] for m in missing] == ["kw-fr"]
@@ -0,0 +1,22 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from wgu_osmt_builder.validate.keyword_dupes import find_near_duplicates, normalize_for_shingles
+
+
+def test_normalize_for_shingles() -> None:
+    assert normalize_for_shingles("Data-Analysis.") == normalize_for_shingles("analysis data")
+    assert normalize_for_shingles("Firewalls") == normalize_for_shingles("firewall")
+
+
+def test_near_duplicate_clusters() -> None:
+    labels = [
+        "cloud computing", "cloud-computing.", "computing, cloud",
+        "network firewalls", "network firewall",
+        "project management", "risk assessment", "python",
+    ]
+    clusters = find_near_duplicates(labels)
+    assert ["cloud computing", "cloud-computing.", "computing, cloud"] in clusters
+    assert ["network firewall", "network firewalls"] in clusters
+    flat = {lab for c in clusters for lab in c}
+    assert not flat & {"project management", "risk assessment", "python"}
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import random
+
+from wgu_osmt_builder.validate.keywords import clean_label, clean_labels, unique_valid_labels, valid_label
+
+TRICKY = [
+    "Data Analysis", "  Cloud   Computing. ", "a b ..", "x . .", "12-0000", "1404.22", "10344",
+    "12-lead ECG", "wgusid 12", "WGUSID-x", "wguſid x", "wgusidx", "ΟΔΟΣ ΣΟΦΙΑΣ", "İstanbul",
+    "ﬁle  system", "①②③", "١٢٣", "١٢.٥", "tab\tand\nnewline", " nbsp em ", "x́",
+    "ẹ́", "..", "ab", "", "  ", "Über-Café.", "¨umlaut", "sigma ς end",
+]
+
+
+def _reference(raw: list[str]) -> list[str]:
+    out = []
+    for s in raw:
+        t = clean_label(s)
+        if valid_label(t):
+            out.append(t)
+    return sorted(dict.fromkeys(out))
+
+
+def test_batch_cleaning_matches_per_label() -> None:
+    rng = random.Random(0)
+    alphabet = list("abcXYZ019.-_ ") + ["\t", "\n", " ", "ſ", "Σ", "́", "ﬁ", "İ", "٣"]
+    fuzz = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(5000)]
+    raw = TRICKY + fuzz + TRICKY
+
+    assert clean_labels(raw) == [clean_label(s) for s in raw]
+    assert unique_valid_labels(raw) == _reference(raw)
+
+
+def test_separator_collision_falls_back() -> None:
+    raw = ["nul\x00inside", "Plain Label."]
+    assert clean_labels(raw) == [clean_label(s) for s in raw]
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+analytics/csr.py
+The skills graph as integer-indexed CSR adjacency arrays, for structural
+questions answered in-process (no Neo4j, no SPARQL).
+
+- one id array per label (sorted, position = node index)
+- one CSR (indptr, indices) per relationship type in graph/build/schema.REL_SPECS
+- vectorised degree, neighbourhood, co-occurrence and bipartite projection
+- persisted as a single .npz (no pickles), so a reload is a few array reads
+
+Relationship rows whose endpoint is not an exported node are dropped, the
+same rows a Neo4j MATCH would drop.
+
+IN:  wgu_osmt_builder/data/out/graph/*.csv (or skills.ttl)
+OUT: wgu_osmt_builder/data/out/analytics/graph.npz
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import GRAPH, CSR_NPZ
+from wgu_osmt_builder.graph.build.admin_import import NODE_TABLES
+from wgu_osmt_builder.graph.build.export import REL_FILES
+from wgu_osmt_builder.graph.build.schema import CLS_OCCUPATION, REL_SPECS
+from wgu_osmt_builder.graph.build.stats import load_tables
+
+logger = configure_logger(__name__)
+
+DEFAULT_NPZ = CSR_NPZ
+
+
+@dataclass
+class Adjacency:
+    """One relationship type: row i = source node i, indices = target node indexes."""
+    rel_type: str
+    src: str
+    dst: str
+    indptr: np.ndarray   # int64, n_src + 1
+    indices: np.ndarray  # int32, sorted within each row
+    n_dst: int
+
+    @property
+    def n_src(self) -> int:
+        return len(self.indptr) - 1
+
+    def out_degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def in_degree(self) -> np.ndarray:
+        return np.bincount(self.indices, minlength=self.n_dst)
+
+    def row(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def rows(self, idx: np.ndarray) -> np.ndarray:
+        """Concatenated neighbours of several source rows (with repeats)."""
+        idx = np.asarray(idx, dtype=np.int64)
+        starts, ends = self.indptr[idx], self.indptr[idx + 1]
+        lens = ends - starts
+        if not lens.sum():
+            return np.empty(0, dtype=self.indices.dtype)
+        offsets = np.repeat(starts - np.cumsum(lens) + lens, lens) + np.arange(lens.sum())
+        return self.indices[offsets]
+
+    def transpose(self) -> "Adjacency":
+        order = np.argsort(self.indices, kind="stable")
+        rows = np.repeat(np.arange(self.n_src, dtype=np.int32), self.out_degree())
+        indptr = np.zeros(self.n_dst + 1, dtype=np.int64)
+        np.cumsum(self.in_degree(), out=indptr[1:])
+        return Adjacency(self.rel_type, self.dst, self.src, indptr, rows[order], self.n_src)
+
+
+def from_pairs(rel_type: str, src: str, dst: str, s: np.ndarray, t: np.ndarray, n_src: int, n_dst: int) -> Adjacency:
+    """CSR from (source index, target index) pairs; duplicates are collapsed."""
+    key = np.unique(s.astype(np.int64) * n_dst + t)
+    s, t = key // max(n_dst, 1), key % max(n_dst, 1)
+    indptr = np.zeros(n_src + 1, dtype=np.int64)
+    np.cumsum(np.bincount(s, minlength=n_src), out=indptr[1:])
+    return Adjacency(rel_type, src, dst, indptr, t.astype(np.int32), n_dst)
+
+
+def project(adj: Adjacency, max_degree: int | None = None) -> tuple[Adjacency, np.ndarray]:
+    """
+    Bipartite projection onto the source side (A·Aᵀ without the diagonal):
+    returns the projected CSR and, aligned with its indices, the number of
+    shared targets. Targets with more than max_degree sources (hubs) can be
+    skipped to bound the number of generated pairs (Σ deg²).
+    """
+    t = adj.transpose()
+    deg = t.out_degree()
+    keep = deg > 1 if max_degree is None else (deg > 1) & (deg <= max_degree)
+    seg_len = deg[keep]
+    members = t.rows(np.flatnonzero(keep))               # sources, grouped by target
+    rep = np.repeat(seg_len, seg_len)                    # each member's group size
+    seg_start = np.repeat(np.cumsum(seg_len) - seg_len, seg_len)
+    ramp = np.arange(rep.sum()) - np.repeat(np.cumsum(rep) - rep, rep)
+    left = np.repeat(members, rep)
+    right = members[np.repeat(seg_start, rep) + ramp]
+    mask = left != right
+    n = max(adj.n_src, 1)
+    key, counts = np.unique(left[mask].astype(np.int64) * n + right[mask], return_counts=True)
+    s, o = key // n, key % n
+    indptr = np.zeros(adj.n_src + 1, dtype=np.int64)
+    np.cumsum(np.bincount(s, minlength=adj.n_src), out=indptr[1:])
+    proj = Adjacency(f"{adj.rel_type}~{adj.rel_type}", adj.src, adj.src, indptr, o.astype(np.int32), adj.n_src)
+    return proj, counts.astype(np.int32)
+
+
+class CSRGraph:
+    def __init__(self, ids: dict[str, np.ndarray], rels: dict[str, Adjacency]) -> None:
+        self.ids = ids
+        self.rels = rels
+        self._pos: dict[str, dict[str, int]] = {}
+
+    # ---------- ids ----------
+    def index(self, label: str, node_id: str) -> int:
+        pos = self._pos.get(label)
+        if pos is None:
+            pos = self._pos[label] = {v: i for i, v in enumerate(self.ids[label].tolist())}
+        return pos[node_id]
+
+    def names(self, label: str, idx: Iterable[int]) -> list[str]:
+        return self.ids[label][np.asarray(list(idx), dtype=np.int64)].tolist()
+
+    # ---------- queries ----------
+    def degree(self, label: str) -> np.ndarray:
+        """Total degree (in + out over every relationship type) per node of label."""
+        deg = np.zeros(len(self.ids[label]), dtype=np.int64)
+        for adj in self.rels.values():
+            if adj.src == label:
+                deg += adj.out_degree()
+            if adj.dst == label:
+                deg += adj.in_degree()
+        return deg
+
+    def neighbors(self, rel_type: str, node_id: str, reverse: bool = False) -> list[str]:
+        adj = self.rels[rel_type].transpose() if reverse else self.rels[rel_type]
+        return self.names(adj.dst, adj.row(self.index(adj.src, node_id)))
+
+    def cooccurrence(self, rel_type: str, node_id: str, top: int = 10) -> list[tuple[str, int]]:
+        """Sources sharing the most targets with node_id (e.g. skills sharing keywords)."""
+        adj = self.rels[rel_type]
+        i = self.index(adj.src, node_id)
+        via = adj.transpose().rows(adj.row(i))
+        counts = np.bincount(via, minlength=adj.n_src)
+        counts[i] = 0
+        order = np.lexsort((np.arange(adj.n_src), -counts))[:top]
+        return [(self.ids[adj.src][j], int(counts[j])) for j in order if counts[j]]
+
+    # ---------- persistence ----------
+    def save(self, path: Path = DEFAULT_NPZ) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays: dict[str, np.ndarray] = {f"ids.{label}": ids for label, ids in self.ids.items()}
+        meta = {}
+        for rel_type, adj in self.rels.items():
+            arrays[f"indptr.{rel_type}"] = adj.indptr
+            arrays[f"indices.{rel_type}"] = adj.indices
+            meta[rel_type] = [adj.src, adj.dst]
+        arrays["meta"] = np.array(json.dumps(meta))
+        tmp = path.with_name(path.name + ".tmp.npz")
+        np.savez(tmp, **arrays)
+        tmp.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_NPZ) -> "CSRGraph":
+        with np.load(path, allow_pickle=False) as z:
+            ids = {k.split(".", 1)[1]: z[k] for k in z.files if k.startswith("ids.")}
+            meta = json.loads(str(z["meta"]))
+            rels = {
+                rel_type: Adjacency(rel_type, src, dst, z[f"indptr.{rel_type}"], z[f"indices.{rel_type}"], len(ids[dst]))
+                for rel_type, (src, dst) in meta.items()
+            }
+        return cls(ids, rels)
+
+
+def build_csr(tables: dict) -> CSRGraph:
+    """CSRGraph from graph tables (stem → (header, rows)), e.g. csv_tables() or graph_tables()."""
+    ids: dict[str, np.ndarray] = {}
+    for label, stem in NODE_TABLES.values():
+        _, rows = tables.get(stem, ([], ()))
+        ids[label] = np.unique(np.array([r[0] for r in rows], dtype=str))
+
+    rels: dict[str, Adjacency] = {}
+    for spec in REL_SPECS:
+        src_name = "Occupation" if spec.src_cls == CLS_OCCUPATION else "RichSkillDescriptor"
+        stem = REL_FILES[(src_name, spec.rel_type)].removesuffix(".csv")
+        src, dst = NODE_TABLES[spec.src_cls][0], NODE_TABLES[spec.dst_cls][0]
+        pairs = [(r[0], r[1]) for r in tables.get(stem, ([], ()))[1]]
+        s_ids = np.array([p[0] for p in pairs], dtype=str)
+        t_ids = np.array([p[1] for p in pairs], dtype=str)
+        s, s_ok = _lookup(ids[src], s_ids)
+        t, t_ok = _lookup(ids[dst], t_ids)
+        ok = s_ok & t_ok
+        rels[spec.rel_type] = from_pairs(spec.rel_type, src, dst, s[ok], t[ok], len(ids[src]), len(ids[dst]))
+    return CSRGraph(ids, rels)
+
+
+def _lookup(sorted_ids: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    if not len(sorted_ids):
+        return np.zeros(len(values), dtype=np.int64), np.zeros(len(values), dtype=bool)
+    pos = np.searchsorted(sorted_ids, values)
+    pos = np.minimum(pos, len(sorted_ids) - 1)
+    return pos, sorted_ids[pos] == values
+
+
+def build_from_export(graph_dir: Path = GRAPH, ttl_path: Path | None = None, out_path: Path | None = DEFAULT_NPZ) -> CSRGraph:
+    csr = build_csr(load_tables(graph_dir, ttl_path))
+    if out_path is not None:
+        csr.save(out_path)
+        n_edges = sum(len(a.indices) for a in csr.rels.values())
+        logger.info(f"🧮 CSR: {sum(len(v) for v in csr.ids.values()):,} nodes, {n_edges:,} edges → {out_path}")
+    return csr
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Compile the graph export into CSR adjacency arrays (.npz)")
+    ap.add_argument("--graph-dir", type=Path, default=GRAPH)
+    ap.add_argument("--ttl", type=Path, help="Build from skills.ttl instead of the CSV export")
+    ap.add_argument("--out", type=Path, default=DEFAULT_NPZ)
+    args = ap.parse_args()
+    csr = build_from_export(args.graph_dir, args.ttl, args.out)
+    print(f"✅ CSR adjacency: {len(csr.rels)} relationship types → {args.out}")
+
+
+if __name__ == "__main__":
+    _cli()
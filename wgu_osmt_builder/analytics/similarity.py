@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+analytics/similarity.py
+Precomputed "skills similar to this RSD" index.
+
+1. vectors:  one sparse TF-IDF row per RSD over its :hasKeyword,
+             :hasOccupation, :hasStandard and :hasCategory targets
+             (binary tf, smoothed idf, L2-normalised; features shared by
+             fewer than 2 RSDs or by more than max_df of them are dropped)
+2. top-k:    blocked sparse X·Xᵀ — for a block of rows every nonzero on a
+             rare feature is expanded over that feature's posting list and
+             the partial products are summed per (row, other) cell with one
+             sort + reduceat; the candidates' common-feature terms are added
+             by sorted-key lookup, so scores are exact cosines. Blocks are
+             sized by partial-product count, not by rows. Low-cardinality
+             features (categories, large occupations) would otherwise make
+             X·Xᵀ dense.
+3. store:    ids + (N × k) neighbour / score arrays in one .npz; a lookup is
+             one dict hit and one row slice
+
+IN:  wgu_osmt_builder/data/out/analytics/graph.npz (built on demand)
+OUT: wgu_osmt_builder/data/out/analytics/similar.npz
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from wgu_osmt_builder.analytics.csr import DEFAULT_NPZ, Adjacency, CSRGraph, build_from_export, from_pairs
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import GRAPH, SIMILAR_INDEX
+
+logger = configure_logger(__name__)
+
+DEFAULT_INDEX = SIMILAR_INDEX
+FEATURE_RELS = ("HAS_KEYWORD", "HAS_OCCUPATION", "HAS_STANDARD", "HAS_CATEGORY")
+
+# partial products per block (~8M cells, well under 1 GB peak)
+_BLOCK_PAIRS = 1 << 23
+# features shared by at most this many RSDs (or 1% of them) generate candidates
+_CANDIDATE_DF = 1000
+# minimum fixed-point bits for a partial product / score in the packed sort keys
+_WEIGHT_BITS = 24
+# rows × common-features cells held densely for the exact rescoring (~256 MB)
+_DENSE_COMMON = 1 << 25
+
+
+def tfidf_rows(adjs: list[Adjacency], max_df: float = 0.5) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Row-normalised TF-IDF CSR (indptr, indices, data) over the concatenated
+    target spaces of adjs (all sharing the same source rows).
+    """
+    n = adjs[0].n_src
+    rows, cols = [], []
+    offset = 0
+    for adj in adjs:
+        rows.append(np.repeat(np.arange(n, dtype=np.int64), adj.out_degree()))
+        cols.append(adj.indices.astype(np.int64) + offset)
+        offset += adj.n_dst
+    r, c = np.concatenate(rows), np.concatenate(cols)
+
+    df = np.bincount(c, minlength=offset)
+    keep = (df >= 2) & (df <= max(2, max_df * n))
+    mask = keep[c]
+    r, c = r[mask], c[mask]
+    idf = np.log((1 + n) / (1 + df)) + 1.0
+    w = idf[c]
+
+    order = np.lexsort((c, r))
+    r, c, w = r[order], c[order], w[order]
+    norms = np.sqrt(np.bincount(r, weights=w * w, minlength=n))
+    w = w / norms[r]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(r, minlength=n), out=indptr[1:])
+    return indptr, c, w
+
+
+def _segments(ptr: np.ndarray, idx: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Positions of all entries of CSR rows idx, concatenated, and each row's length."""
+    lens = ptr[idx + 1] - ptr[idx]
+    total = int(lens.sum())
+    return np.repeat(ptr[idx] - np.cumsum(lens) + lens, lens) + np.arange(total), lens
+
+
+def top_k(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    k: int = 10,
+    candidate_df: int | None = None,
+    block_pairs: int = _BLOCK_PAIRS,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    k nearest rows by cosine for every row (self excluded): (neighbours, scores),
+    both N × k, best first, padded with -1 / 0 where a row has fewer than k
+    nonzero scores.
+
+    Candidates come from features shared by at most candidate_df rows
+    (default max(1000, 1% of N)); each candidate pair is then scored exactly
+    over all features. Pairs that only share common features are skipped.
+    """
+    n = len(indptr) - 1
+    nbr = np.full((n, k), -1, dtype=np.int32)
+    score = np.zeros((n, k), dtype=np.float32)
+    if not len(indices):
+        return nbr, score
+    if candidate_df is None:
+        candidate_df = max(_CANDIDATE_DF, n // 100)
+
+    n_feat = int(indices.max()) + 1
+    df = np.bincount(indices, minlength=n_feat)
+    row_of = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    rare = df[indices] <= candidate_df
+
+    # posting lists of the rare features: feature → rows, weights
+    r_idx, r_rows, r_w = indices[rare], row_of[rare], data[rare]
+    order = np.argsort(r_idx, kind="stable")
+    p_ptr = np.zeros(n_feat + 1, dtype=np.int64)
+    np.cumsum(np.bincount(r_idx, minlength=n_feat), out=p_ptr[1:])
+    p_rows, p_w = r_rows[order], r_w[order]
+
+    # common entries per row, as a dense rows × common-features table when it
+    # fits, else as sorted row * n_feat + feature keys for binary search
+    common = ~rare
+    c_ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(row_of[common], minlength=n), out=c_ptr[1:])
+    c_feats, c_feat = np.unique(indices[common], return_inverse=True)
+    c_w = data[common]
+    dense_common = None
+    if n * len(c_feats) <= _DENSE_COMMON:
+        dense_common = np.zeros((n, len(c_feats)), dtype=np.float64)
+        dense_common[row_of[common], c_feat] = c_w
+    else:
+        c_key = row_of[common] * n_feat + c_feat
+
+    # blocks of consecutive rows generating ~block_pairs candidate products each
+    r_ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(r_rows, minlength=n), out=r_ptr[1:])
+    plen = p_ptr[r_idx + 1] - p_ptr[r_idx]
+    work = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(r_rows, weights=plen, minlength=n).astype(np.int64), out=work[1:])
+    cb = int(n).bit_length()
+    max_rows = 1 << (63 - cb - _WEIGHT_BITS)
+    bounds = [0]
+    while bounds[-1] < n:
+        nxt = int(np.searchsorted(work, work[bounds[-1]] + block_pairs, side="right")) - 1
+        bounds.append(min(n, bounds[-1] + max_rows, max(nxt, bounds[-1] + 1)))
+
+    for r0, r1 in zip(bounds, bounds[1:]):
+        a, b = r_ptr[r0], r_ptr[r1]
+        starts, lens = _segments(p_ptr, r_idx[a:b])
+        if not len(starts):
+            continue
+        left = np.repeat(r_rows[a:b] - r0, lens)
+        right = p_rows[starts]
+        prod = np.repeat(r_w[a:b], lens) * p_w[starts]
+        keep = left + r0 != right
+
+        # rare-feature score per candidate cell: sort packed (row, other, weight)
+        # keys — one np.sort, no argsort — and sum the weights of equal cells
+        rb = int(r1 - r0).bit_length()
+        wb = 63 - rb - cb
+        wscale = (1 << wb) - 1
+        packed = np.sort((((left[keep] << cb) | right[keep]) << wb) | np.rint(prod[keep] * wscale).astype(np.int64))
+        cells = packed >> wb
+        first = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+        sums = np.add.reduceat(packed & wscale, first) / wscale
+        cells = cells[first]
+        rows, cols = (cells >> cb) + r0, cells & ((1 << cb) - 1)
+
+        # plus the common-feature part: look up (other, feature) for each common
+        # feature of row, in candidate chunks of ~block_pairs lookups
+        ccum = np.cumsum(c_ptr[rows + 1] - c_ptr[rows])
+        c0 = 0
+        while c0 < len(rows):
+            c1 = max(c0 + 1, int(np.searchsorted(ccum, (ccum[c0 - 1] if c0 else 0) + block_pairs, side="right")))
+            pos, clens = _segments(c_ptr, rows[c0:c1])
+            if len(pos):
+                cand = np.repeat(np.arange(c0, c1), clens)
+                if dense_common is not None:
+                    other_w = dense_common[cols[cand], c_feat[pos]]
+                    sums[c0:c1] += np.bincount(cand - c0, weights=c_w[pos] * other_w, minlength=c1 - c0)
+                else:
+                    key = cols[cand] * n_feat + c_feat[pos]
+                    hit = np.minimum(np.searchsorted(c_key, key), len(c_key) - 1)
+                    match = c_key[hit] == key
+                    sums[c0:c1] += np.bincount(cand[match] - c0, weights=c_w[pos][match] * c_w[hit][match],
+                                               minlength=c1 - c0)
+            c0 = c1
+
+        # best k per row: sort packed (row, -score, col) and keep each row's first k
+        qscore = wscale - np.rint(np.clip(sums, 0.0, 1.0) * wscale).astype(np.int64)
+        ranked = np.sort((((rows - r0) << wb) | qscore) << cb | cols)
+        rows = (ranked >> (wb + cb)) + r0
+        cols = ranked & ((1 << cb) - 1)
+        vals = (wscale - ((ranked >> cb) & wscale)) / wscale
+        row_start = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        rank = np.arange(len(rows)) - np.repeat(row_start, np.diff(np.r_[row_start, len(rows)]))
+        sel = (rank < k) & (vals > 0)
+        nbr[rows[sel], rank[sel]] = cols[sel]
+        score[rows[sel], rank[sel]] = vals[sel]
+    return nbr, score
+
+
+class SimilarityIndex:
+    def __init__(self, ids: np.ndarray, nbr: np.ndarray, score: np.ndarray) -> None:
+        self.ids = ids
+        self.nbr = nbr
+        self.score = score
+        self._pos = {v: i for i, v in enumerate(ids.tolist())}
+
+    def similar(self, rsd_id: str, k: int | None = None) -> list[tuple[str, float]]:
+        i = self._pos[rsd_id]
+        row, sc = self.nbr[i][:k], self.score[i][:k]
+        return [(self.ids[j], float(s)) for j, s in zip(row.tolist(), sc.tolist()) if j >= 0]
+
+    def save(self, path: Path = DEFAULT_INDEX) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp.npz")
+        np.savez(tmp, ids=self.ids, nbr=self.nbr, score=self.score)
+        tmp.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_INDEX) -> "SimilarityIndex":
+        with np.load(path, allow_pickle=False) as z:
+            return cls(z["ids"], z["nbr"], z["score"])
+
+
+def build_index(csr: CSRGraph, k: int = 10, max_df: float = 0.5, rels: tuple[str, ...] = FEATURE_RELS) -> SimilarityIndex:
+    adjs = [csr.rels[t] for t in rels if t in csr.rels]
+    indptr, indices, data = tfidf_rows(adjs, max_df=max_df)
+    nbr, score = top_k(indptr, indices, data, k=k)
+    return SimilarityIndex(csr.ids[adjs[0].src], nbr, score)
+
+
+def build_similarity(
+    csr_path: Path = DEFAULT_NPZ,
+    out_path: Path = DEFAULT_INDEX,
+    graph_dir: Path = GRAPH,
+    k: int = 10,
+    max_df: float = 0.5,
+) -> SimilarityIndex:
+    """Build from the CSR .npz (compiled from graph_dir first when missing)."""
+    csr = CSRGraph.load(csr_path) if csr_path.exists() else build_from_export(graph_dir, out_path=csr_path)
+    t0 = time.perf_counter()
+    index = build_index(csr, k=k, max_df=max_df)
+    index.save(out_path)
+    logger.info(f"🧭 similarity top-{k}: {len(index.ids):,} RSDs in {time.perf_counter() - t0:.1f}s → {out_path}")
+    return index
+
+
+# -------------------- benchmark --------------------
+
+def synthetic_graph(n: int, seed: int = 0) -> CSRGraph:
+    """
+    n RSDs whose targets follow a rank-frequency Zipf law (p ∝ 1/rank^s)
+    over each vocabulary: a long keyword tail, a few occupations, standards
+    and categories per skill.
+    """
+    rng = np.random.default_rng(seed)
+    spaces = {  # rel → (target label, vocabulary size, min links, max links, zipf s)
+        "HAS_KEYWORD":    ("Keyword",    max(50, n // 2), 3, 9, 1.0),
+        "HAS_OCCUPATION": ("Occupation", 800, 1, 4, 0.8),
+        "HAS_STANDARD":   ("Standard",   max(20, n // 20), 0, 3, 1.0),
+        "HAS_CATEGORY":   ("Category",   60, 1, 2, 0.5),
+    }
+    ids = {"RSD": np.array([f"rsd-{i:07d}" for i in range(n)])}
+    rels = {}
+    for rel, (label, vocab, lo, hi, z) in spaces.items():
+        per = rng.integers(lo, hi + 1, n)
+        s = np.repeat(np.arange(n), per)
+        p = 1.0 / np.arange(1, vocab + 1) ** z
+        t = rng.choice(vocab, size=len(s), p=p / p.sum())
+        ids[label] = np.array([f"{label.lower()}-{i}" for i in range(vocab)])
+        rels[rel] = from_pairs(rel, "RSD", label, s, t, n, vocab)
+    return CSRGraph(ids, rels)
+
+
+def _bench(n: int, k: int) -> None:
+    t0 = time.perf_counter()
+    csr = synthetic_graph(n)
+    t1 = time.perf_counter()
+    indptr, indices, data = tfidf_rows([csr.rels[t] for t in FEATURE_RELS])
+    t2 = time.perf_counter()
+    nbr, score = top_k(indptr, indices, data, k=k)
+    t3 = time.perf_counter()
+    index = SimilarityIndex(csr.ids["RSD"], nbr, score)
+    q0 = time.perf_counter()
+    for i in range(0, n, max(1, n // 1000)):
+        index.similar(index.ids[i])
+    q1 = time.perf_counter()
+    print(json.dumps({
+        "rsds": n,
+        "k": k,
+        "nonzeros": int(len(indices)),
+        "generate_s": round(t1 - t0, 3),
+        "tfidf_s": round(t2 - t1, 3),
+        "topk_s": round(t3 - t2, 3),
+        "rows_per_s": round(n / max(t3 - t2, 1e-9)),
+        "lookup_us": round((q1 - q0) / len(range(0, n, max(1, n // 1000))) * 1e6, 2),
+    }, indent=2))
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Top-k similar RSDs from keyword/occupation/standard/category links")
+    ap.add_argument("rsd", nargs="?", help="RSD id to query (e.g. the local name from nodes_rsd.csv)")
+    ap.add_argument("--build", action="store_true", help="(Re)build the index first")
+    ap.add_argument("-k", type=int, default=10)
+    ap.add_argument("--max-df", type=float, default=0.5, help="Drop features linked to more than this share of RSDs")
+    ap.add_argument("--index", type=Path, default=DEFAULT_INDEX)
+    ap.add_argument("--csr", type=Path, default=DEFAULT_NPZ)
+    ap.add_argument("--graph-dir", type=Path, default=GRAPH)
+    ap.add_argument("--bench", type=int, metavar="N", help="Benchmark on N synthetic RSDs and exit")
+    args = ap.parse_args()
+
+    if args.bench:
+        _bench(args.bench, args.k)
+        return
+    if args.build or not args.index.exists():
+        index = build_similarity(args.csr, args.index, args.graph_dir, k=args.k, max_df=args.max_df)
+    else:
+        index = SimilarityIndex.load(args.index)
+    if args.rsd:
+        for rsd_id, s in index.similar(args.rsd, args.k):
+            print(f"{s:.4f}  {rsd_id}")
+    else:
+        print(f"✅ similarity index: {len(index.ids)} RSDs → {args.index}")
+
+
+if __name__ == "__main__":
+    _cli()
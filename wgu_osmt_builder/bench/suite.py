@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+bench/suite.py
+Throughput and peak-memory benchmarks for the build → validate → graph path
+on synthetic corpora (bench/synthetic.py), with JSON baselines and
+regression flags.
+
+Steps per size (each on the previous step's files):
+  json2ttl          TransformJSONtoTTL over every RSD JSON
+  merge             merge_ttls_to_single_ontology → skills.ttl
+  validate.<name>   each extractor: alignments, bls, keywords, rsd, integrity, keyword_dupes
+  graph             export_neo_csvs
+
+Every step runs in a forked child process (where fork exists), so one step's
+garbage and rdflib caches cannot skew the next. peak_mb is the child's
+max-RSS growth over its start. Throughput is skills per second.
+
+A result compared against a baseline flags a step when it is more than
+--threshold slower (and at least MIN_SECONDS) or uses more than --threshold
+extra peak memory (and at least MIN_MB). Baselines are machine specific:
+record one per machine with --save-baseline.
+
+IN:  synthetic corpus, regenerated per run under <work-dir>/<n>/raw
+OUT: wgu_osmt_builder/data/out/bench/results-<stamp>.json,
+     baseline-<n>.json with --save-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing as mp
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import BENCH
+
+logger = configure_logger(__name__)
+
+DEFAULT_DIR = BENCH
+DEFAULT_SIZES = (1_000,)
+THRESHOLD = 0.25
+MIN_SECONDS = 0.05
+MIN_MB = 5.0
+FORMAT = 1
+
+
+def _maxrss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024  # bytes on macOS, KiB elsewhere
+
+
+def _measure(fn: Callable[[], object], conn=None) -> dict:
+    start = _maxrss_mb()
+    t0 = time.perf_counter()
+    out = fn()
+    res = {"seconds": time.perf_counter() - t0, "peak_mb": max(0.0, _maxrss_mb() - start), "out": out}
+    if conn is None:
+        return res
+    conn.send(res)
+    conn.close()
+
+
+def _run_isolated(fn: Callable[[], object]) -> dict:
+    if "fork" not in mp.get_all_start_methods():
+        return _measure(fn)  # peak_mb is only growth past this process's earlier peak
+    ctx = mp.get_context("fork")
+    recv, send = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_measure, args=(fn, send))
+    proc.start()
+    send.close()
+    try:
+        res = recv.recv()
+    except EOFError:
+        proc.join()
+        raise RuntimeError(f"benchmark step failed in its worker (exit code {proc.exitcode})") from None
+    proc.join()
+    return res
+
+
+# -------------------- steps --------------------
+
+def _json2ttl(raw: Path, stage: Path) -> int:
+    from wgu_osmt_builder.build.json2ttl import TransformJSONtoTTL
+
+    converter = TransformJSONtoTTL()
+    files = sorted(raw.glob("*.json"))
+    for src in files:
+        converter.process(str(src), str(stage / f"{src.stem}.ttl"))
+    return len(files)
+
+
+def _merge(stage: Path, merged: Path) -> int:
+    from wgu_osmt_builder.build.assemble import merge_ttls_to_single_ontology
+
+    return len(merge_ttls_to_single_ontology(stage, merged))
+
+
+def _extractors() -> dict[str, Callable[[Path, Path], int]]:
+    from wgu_osmt_builder.validate.alignments import extract_alignment_labels
+    from wgu_osmt_builder.validate.bls import extract_bls_pref_labels
+    from wgu_osmt_builder.validate.integrity import extract_integrity_report
+    from wgu_osmt_builder.validate.keyword_dupes import extract_keyword_near_duplicates
+    from wgu_osmt_builder.validate.keywords import extract_keyword_labels
+    from wgu_osmt_builder.validate.rsd import extract_rsd_pref_labels
+
+    return {
+        "alignments": extract_alignment_labels,
+        "bls": extract_bls_pref_labels,
+        "keywords": extract_keyword_labels,
+        "rsd": extract_rsd_pref_labels,
+        "integrity": extract_integrity_report,
+        "keyword_dupes": extract_keyword_near_duplicates,
+    }
+
+
+def _graph(merged: Path, out_dir: Path) -> int:
+    from wgu_osmt_builder.graph.build.export import export_neo_csvs
+
+    export_neo_csvs(ttl_path=merged, out_dir=out_dir)
+    return sum(1 for _ in out_dir.glob("*.csv"))
+
+
+def run_size(n: int, work_dir: Path, seed: int = 0) -> dict:
+    """Generate an n-skill corpus under work_dir/<n> and time every step on it."""
+    from wgu_osmt_builder.bench.synthetic import write_corpus
+
+    root = work_dir / str(n)
+    if root.exists():
+        shutil.rmtree(root)
+    raw, stage, reports, graph = root / "raw", root / "stage", root / "reports", root / "graph"
+    for d in (stage, reports, graph):
+        d.mkdir(parents=True)
+    merged = root / "skills.ttl"
+
+    t0 = time.perf_counter()
+    write_corpus(n, raw, seed)
+    logger.info(f"🧪 {n:,} synthetic RSDs in {time.perf_counter() - t0:.1f}s → {raw}")
+
+    steps: dict[str, Callable[[], object]] = {
+        "json2ttl": lambda: _json2ttl(raw, stage),
+        "merge": lambda: _merge(stage, merged),
+    }
+    for name, extract in _extractors().items():
+        steps[f"validate.{name}"] = lambda extract=extract, name=name: extract(merged, reports / name)
+    steps["graph"] = lambda: _graph(merged, graph)
+
+    results: dict[str, dict] = {}
+    for name, fn in steps.items():
+        res = _run_isolated(fn)
+        results[name] = {
+            "seconds": round(res["seconds"], 4),
+            "skills_per_s": round(n / res["seconds"], 1) if res["seconds"] else None,
+            "peak_mb": round(res["peak_mb"], 1),
+            "output": res["out"],
+        }
+        logger.info(f"⏱️ {n:,} {name}: {res['seconds']:.2f}s, {results[name]['skills_per_s']:,} skills/s, "
+                    f"+{res['peak_mb']:.0f} MB")
+    return {"skills": n, "seed": seed, "steps": results}
+
+
+def run_suite(sizes=DEFAULT_SIZES, work_dir: Path | None = None, seed: int = 0) -> dict:
+    tmp = None
+    if work_dir is None:
+        tmp = tempfile.TemporaryDirectory(prefix="wgu-bench-")
+        work_dir = Path(tmp.name)
+    try:
+        return {
+            "format": FORMAT,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                        "cpus": mp.cpu_count()},
+            "sizes": {str(n): run_size(n, work_dir, seed) for n in sizes},
+        }
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+
+
+# -------------------- baselines --------------------
+
+def compare(result: dict, baseline: dict, threshold: float = THRESHOLD) -> list[dict]:
+    """Steps whose time or peak memory grew past the threshold (sizes/steps missing on either side are skipped)."""
+    regressions = []
+    for size, run in result["sizes"].items():
+        base = baseline.get("sizes", {}).get(size)
+        if base is None:
+            continue
+        for step, cur in run["steps"].items():
+            ref = base["steps"].get(step)
+            if ref is None:
+                continue
+            for metric, floor in (("seconds", MIN_SECONDS), ("peak_mb", MIN_MB)):
+                was, now = ref[metric], cur[metric]
+                if now > was * (1 + threshold) and now - was >= floor:
+                    regressions.append({"size": int(size), "step": step, "metric": metric,
+                                        "baseline": was, "current": now,
+                                        "change": round(now / was - 1, 3) if was else None})
+    return regressions
+
+
+def baseline_path(out_dir: Path, n: int) -> Path:
+    return out_dir / f"baseline-{n}.json"
+
+
+def save_baselines(result: dict, out_dir: Path) -> list[Path]:
+    """One baseline file per size, so sizes can be re-recorded independently."""
+    paths = []
+    for size, run in result["sizes"].items():
+        path = baseline_path(out_dir, int(size))
+        path.write_text(json.dumps({**result, "sizes": {size: run}}, indent=2), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def load_baselines(out_dir: Path, sizes) -> dict:
+    merged: dict = {"sizes": {}}
+    for n in sizes:
+        path = baseline_path(out_dir, n)
+        if path.exists():
+            merged["sizes"].update(json.loads(path.read_text(encoding="utf-8"))["sizes"])
+    return merged
+
+
+def benchmark(sizes=DEFAULT_SIZES, out_dir: Path | None = None, work_dir: Path | None = None, seed: int = 0,
+              save_baseline: bool = False, threshold: float = THRESHOLD) -> int:
+    """Run, write results-<stamp>.json, compare with (or record) baselines; 1 when something regressed."""
+    out_dir = Path(out_dir or DEFAULT_DIR)
+    result = run_suite(sizes, work_dir, seed)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out = out_dir / f"results-{time.strftime('%Y%m%d-%H%M%S')}.json"
+
+    baseline = load_baselines(out_dir, sizes)
+    result["regressions"] = compare(result, baseline, threshold)
+    out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    logger.info(f"📊 results → {out}")
+
+    if save_baseline:
+        for path in save_baselines(result, out_dir):
+            logger.info(f"📌 baseline → {path}")
+        return 0
+    if not baseline["sizes"]:
+        logger.info("ℹ️ no baseline for these sizes yet (record one with --save-baseline)")
+    for r in result["regressions"]:
+        logger.warning(f"🐢 {r['size']:,} {r['step']} {r['metric']}: {r['baseline']} → {r['current']} "
+                       f"(+{100 * (r['change'] or 0):.0f}%)")
+    return 1 if result["regressions"] else 0
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark build/validate/graph on synthetic RSD corpora")
+    ap.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                    help="Corpus sizes in skills (e.g. 1000 10000 100000)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out-dir", type=Path, default=DEFAULT_DIR, help=f"Results + baselines (default: {DEFAULT_DIR})")
+    ap.add_argument("--work-dir", type=Path, help="Keep generated corpora and outputs here (default: temp dir)")
+    ap.add_argument("--save-baseline", action="store_true", help="Record this run as the baseline for its sizes")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD, help="Allowed slowdown / memory growth (0.25 = 25%%)")
+    args = ap.parse_args()
+    raise SystemExit(benchmark(args.sizes, args.out_dir, args.work_dir, args.seed, args.save_baseline, args.threshold))
+
+
+if __name__ == "__main__":
+    _cli()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+bench/synthetic.py
+Deterministic synthetic OSMT RSD corpus for benchmarks.
+
+Same (n, seed) → byte-identical JSON files. Distributions follow what the
+real WGU export looks like rather than uniform noise:
+- keywords: 2–8 per skill, Zipf (s=0.8) over a vocabulary of ~n/3 labels
+  (a few keywords on thousands of skills, a long tail on one or two)
+- occupations: 0–3 per skill, Zipf over a 4-level SOC-shaped tree
+  (major 15-0000 → minor 15-1000 → broad 15-1010 → detailed 15-1011),
+  each carrying its parent chain like the OSMT API does
+- collections: ~n/200 collections with Zipf sizes, 1–2 per skill, 10% none
+- category: ~40 categories, Zipf, 90% of skills have one
+- standards (20% of skills) and alignments (15%) from small shared pools
+
+OUT: <dir>/<uuid>.json, one RSD per file (the layout fetch writes to data/raw)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import uuid
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from wgu_osmt_builder.validate.keyword_dupes import synthetic_vocabulary
+
+SOC_MAJORS = ("11", "13", "15", "17", "19", "21", "23", "25", "27", "29", "31",
+              "33", "35", "37", "39", "41", "43", "45", "47", "49", "51", "53")
+
+
+def _zipf(rng: np.random.Generator, n: int, s: float = 1.0) -> np.ndarray:
+    """Probabilities ∝ 1/rank^s over n items, ranks shuffled so popularity is not id order."""
+    p = 1.0 / np.arange(1, n + 1) ** s
+    p /= p.sum()
+    return p[rng.permutation(n)]
+
+
+def occupation_tree(seed: int = 0) -> list[dict]:
+    """Detailed SOC-like occupations, each with its [major, minor, broad] parents."""
+    rng = np.random.default_rng(seed)
+    out: list[dict] = []
+    for mj in SOC_MAJORS:
+        for m in range(1, int(rng.integers(2, 6)) + 1):
+            for b in range(1, int(rng.integers(1, 5)) + 1):
+                for d in range(1, int(rng.integers(1, 5)) + 1):
+                    code = f"{mj}-{m}0{b}{d}"
+                    out.append({
+                        "code": code,
+                        "targetNodeName": f"Occupation {code}",
+                        "frameworkName": "bls",
+                        "parents": [{"code": f"{mj}-0000"}, {"code": f"{mj}-{m}000"}, {"code": f"{mj}-{m}0{b}0"}],
+                    })
+    return out
+
+
+def synthetic_rsds(n: int, seed: int = 0) -> Iterator[dict]:
+    rng = np.random.default_rng(seed)
+    vocab = synthetic_vocabulary(max(n // 3, 200), seed)
+    words = sorted({w for label in vocab for w in label.split()})
+    occupations = occupation_tree(seed)
+    n_col = max(5, n // 200)
+    collections = [{"uuid": str(uuid.UUID(int=(seed << 96) | (1 << 64) | i)), "name": f"Collection {i}"}
+                   for i in range(n_col)]
+    categories = [f"Category {w.title()}" for w in words[:40]]
+    standards = [f"NICE-{k:03d}" for k in range(100)]
+    alignments = [f"https://example.org/alignments/{k}" for k in range(max(10, n // 20))]
+
+    p_kw = _zipf(rng, len(vocab), s=0.8)  # flatter head: the top keyword sits on ~1/4 of skills
+    p_occ, p_col, p_cat = (_zipf(rng, len(x)) for x in (occupations, collections, categories))
+    n_kw = rng.integers(2, 9, size=n)
+    n_occ = rng.choice(4, size=n, p=[0.2, 0.45, 0.25, 0.1])
+    n_coll = rng.choice(3, size=n, p=[0.1, 0.7, 0.2])
+    kw_idx = rng.choice(len(vocab), size=int(n_kw.sum()), p=p_kw)
+    occ_idx = rng.choice(len(occupations), size=int(n_occ.sum()), p=p_occ)
+    col_idx = rng.choice(n_col, size=int(n_coll.sum()), p=p_col)
+    cat_idx = rng.choice(len(categories), size=n, p=p_cat)
+    has_cat = rng.random(n) < 0.9
+    has_std = rng.random(n) < 0.2
+    has_align = rng.random(n) < 0.15
+    name_words = rng.integers(0, len(words), size=(n, 4))
+
+    kw_at = occ_at = col_at = 0
+    for i in range(n):
+        name = " ".join(words[j] for j in name_words[i, :2 + i % 3]).capitalize()
+        kws = list(dict.fromkeys(vocab[j] for j in kw_idx[kw_at:kw_at + n_kw[i]]))
+        occs = {occupations[j]["code"]: occupations[j] for j in occ_idx[occ_at:occ_at + n_occ[i]]}
+        cols = {collections[j]["uuid"]: collections[j] for j in col_idx[col_at:col_at + n_coll[i]]}
+        kw_at, occ_at, col_at = kw_at + n_kw[i], occ_at + n_occ[i], col_at + n_coll[i]
+        rsd_uuid = str(uuid.UUID(int=(seed << 96) | i))
+        yield {
+            "type": "RichSkillDescriptor",
+            "uuid": rsd_uuid,
+            "id": f"https://osmt.wgu.edu/api/skills/{rsd_uuid}",
+            "skillName": name,
+            "skillStatement": f"{name} using {', '.join(kws[:3])}.",
+            "status": "published",
+            "creationDate": "2023-01-01T00:00:00Z",
+            "publishDate": "2023-02-01T00:00:00Z",
+            "author": "Western Governors University",
+            "category": categories[cat_idx[i]] if has_cat[i] else None,
+            "keywords": kws,
+            "occupations": list(occs.values()),
+            "collections": list(cols.values()),
+            "standards": [{"skillName": standards[(i * 7 + k) % len(standards)]} for k in range(1 + i % 2)] if has_std[i] else [],
+            "alignments": ([{"id": alignments[i % len(alignments)], "skillName": f"Alignment {i % len(alignments)}"}]
+                           if has_align[i] else []),
+        }
+
+
+def write_corpus(n: int, out_dir: Path, seed: int = 0) -> list[Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for doc in synthetic_rsds(n, seed):
+        path = out_dir / f"{doc['uuid']}.json"
+        path.write_text(json.dumps(doc, indent=2), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Write a deterministic synthetic RSD JSON corpus")
+    ap.add_argument("n", type=int, help="Number of skills")
+    ap.add_argument("out_dir", type=Path)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+    print(f"✅ {len(write_corpus(args.n, args.out_dir, args.seed)):,} RSD JSON file(s) → {args.out_dir}")
+
+
+if __name__ == "__main__":
+    _cli()
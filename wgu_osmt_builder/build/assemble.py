@@ -12,9 +12,17 @@ Defaults:
 - Merged TTL:   wgu_osmt_builder/data/out/ttl/skills.ttl
 
 Behavior:
+- Checks every JSON against the RSD schema first; bad inputs are skipped
+  (or moved to a quarantine dir with report.json) before any conversion
 - Writes per-file TTLs into a staging folder: <ttl_out>/.partials
 - Merges staged TTLs into skills.ttl
 - Deletes the staging folder after a successful merge
+- Optionally diffs against the previous build and writes a changeset
+- Optionally writes sharded outputs + manifest under <ttl_out>/shards
+- Optionally writes the occupation closure index (index/occupations.py)
+- Optionally refreshes the BM25 search index (index/fulltext.py)
+- With workers > 1, partials are parsed in parallel chunks (map) and the
+  N-Triples results are unioned before one final serialize (reduce)
 """
 
 from __future__ import annotations
@@ -23,13 +31,19 @@ import os
 import sys
 import json
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from rdflib import Graph
 
-from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.log import Progress, configure_logger, log_item
 from wgu_osmt_builder.common.paths import RAW, TTL_OUT
+from wgu_osmt_builder.common.profile import span
 from wgu_osmt_builder.build.json2ttl import TransformJSONtoTTL
+from wgu_osmt_builder.build.changeset import write_changeset
+from wgu_osmt_builder.build.rsd_schema import check_corpus, quarantine
+from wgu_osmt_builder.build.shard import write_shards
+from wgu_osmt_builder.index.occupations import build_from_graph as build_occupation_index_from_graph
 
 logger = configure_logger(__name__)
 
@@ -49,8 +63,96 @@ def is_osmt_json(path: Path) -> bool:
         return False
 
 
-def merge_ttls_to_single_ontology(src_dir: Path, merged_path: Path) -> None:
+def resolve_workers(workers: int | None) -> int:
+    """0 or None → one worker per CPU; anything else is clamped to >= 1."""
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def _chunk(items: list[Path], n: int) -> list[list[Path]]:
+    size = max(1, -(-len(items) // n))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _parse_chunk(paths: list[str]) -> tuple[bytes, list[tuple[str, str]], list[tuple[str, str]]]:
+    """
+    Map step: parse a chunk of TTL files into one Graph.
+    Returns (N-Triples bytes, namespace bindings, [(src, error), ...]).
+    """
+    g = Graph()
+    errors: list[tuple[str, str]] = []
+    for path in paths:
+        try:
+            g.parse(path, format="turtle")
+        except Exception as ex:
+            errors.append((path, str(ex)))
+    nt = g.serialize(format="nt", encoding="utf-8")
+    namespaces = [(prefix, str(ns)) for prefix, ns in g.namespaces()]
+    return nt, namespaces, errors
+
+
+def parse_ttls_parallel(ttl_files: list[Path], workers: int) -> Graph:
+    """
+    Parse many TTL files into a single Graph using a process pool.
+
+    Each worker parses a disjoint chunk and returns N-Triples; the reducer
+    unions and de-duplicates the lines, then parses them once.
+    """
+    workers = min(resolve_workers(workers), len(ttl_files)) or 1
+    chunks = _chunk(ttl_files, workers * 4)
+
+    lines: set[bytes] = set()
+    namespaces: list[tuple[str, str]] = []
+    with span("parse"), ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_parse_chunk, [[str(p) for p in c] for c in chunks])
+        for chunk, (nt, ns, errors) in zip(chunks, results):
+            lines.update(ln for ln in nt.splitlines() if ln.strip())
+            if not namespaces:
+                namespaces = ns
+            for src, err in errors:
+                logger.error(json.dumps({
+                    "json2ttl": "error",
+                    "msg": "failed to parse ttl",
+                    "src": src,
+                    "error": err
+                }))
+            logger.info(f"🧩 Merged TTL chunk: {len(chunk)} file(s)")
+
+    g = Graph()
+    for prefix, ns in namespaces:
+        g.bind(prefix, ns, override=True, replace=True)
+    if lines:
+        with span("reduce"):
+            g.parse(data=b"\n".join(lines).decode("utf-8"), format="nt")
+    return g
+
+
+def load_ttls(ttl_files: list[Path], workers: int = 1) -> Graph:
+    """Parse TTL files into one Graph; serial, or map-reduce when workers > 1."""
+    if resolve_workers(workers) > 1 and len(ttl_files) > 1:
+        return parse_ttls_parallel(ttl_files, workers)
+
     g = Graph()
+    with Progress(logger, "merge", total=len(ttl_files)) as progress:
+        for ttl_path in ttl_files:
+            try:
+                with span("parse"):
+                    g.parse(ttl_path, format="turtle")
+                log_item(logger, "🧩 Merged TTL: %s", ttl_path)
+                progress.update(outcome="ok")
+            except Exception as ex:
+                logger.error(json.dumps({
+                    "json2ttl": "error",
+                    "msg": "failed to parse ttl",
+                    "src": str(ttl_path),
+                    "error": str(ex)
+                }))
+                progress.update(outcome="error")
+    return g
+
+
+def merge_ttls_to_single_ontology(src_dir: Path, merged_path: Path, workers: int = 1) -> Graph | None:
     ttl_files = sorted(src_dir.glob("*.ttl"))
 
     if not ttl_files:
@@ -59,30 +161,35 @@ def merge_ttls_to_single_ontology(src_dir: Path, merged_path: Path) -> None:
             "msg": "no ttl files to merge",
             "dir": str(src_dir)
         }))
-        return
+        return None
 
-    for ttl_path in ttl_files:
-        try:
-            g.parse(ttl_path, format="turtle")
-            logger.info(f"🧩 Merged TTL: {ttl_path}")
-        except Exception as ex:
-            logger.error(json.dumps({
-                "json2ttl": "error",
-                "msg": "failed to parse ttl",
-                "src": str(ttl_path),
-                "error": str(ex)
-            }))
+    g = load_ttls(ttl_files, workers)
 
     merged_path.parent.mkdir(parents=True, exist_ok=True)
-    g.serialize(destination=str(merged_path), format="turtle")
+    with span("serialize"):
+        g.serialize(destination=str(merged_path), format="turtle")
     logger.info(json.dumps({
         "json2ttl": "merged",
         "count": len(ttl_files),
         "dst": str(merged_path)
     }))
+    return g
 
 
-def process_directory(json_root: Path, ttl_out: Path, merged_path: Path) -> None:
+def process_directory(
+    json_root: Path,
+    ttl_out: Path,
+    merged_path: Path,
+    workers: int = 1,
+    shard_by: str | None = None,
+    shard_dir: Path | None = None,
+    shard_buckets: int = 16,
+    changeset: bool = False,
+    changes_dir: Path | None = None,
+    quarantine_dir: Path | None = None,
+    occupation_index: Path | None = None,
+    search_index: Path | None = None,
+) -> None:
     json_files = find_json_files(json_root)
     if not json_files:
         logger.info(f"⚠️ No JSON files found under {json_root}")
@@ -98,26 +205,63 @@ def process_directory(json_root: Path, ttl_out: Path, merged_path: Path) -> None
     stage_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"📦 Staging per-file TTLs in: {stage_dir}")
 
-    converter = TransformJSONtoTTL(logger=logger)
-    for json_path in json_files:
-        if not is_osmt_json(json_path):
-            logger.info(f"⏭️ Skip non-RSD JSON: {json_path}")
-            continue
+    # Shape-check the corpus up front so conversion only sees clean records
+    with span("check"):
+        checked = check_corpus(json_files, workers=workers)
+    for json_path in checked.skipped:
+        log_item(logger, "⏭️ Skip non-RSD JSON: %s", json_path)
+    for json_path, errors in sorted(checked.bad.items()):
+        logger.error(json.dumps({
+            "json2ttl": "invalid",
+            "src": str(json_path),
+            "errors": [f"{p}: {m}" for p, m in errors],
+        }))
+    if checked.bad and quarantine_dir:
+        quarantine(checked.bad, json_root, quarantine_dir)
 
-        dst_ttl = stage_dir / f"{json_path.stem}.ttl"
-        logger.info(f"▶️ Converting: {json_path} → {dst_ttl}")
-        try:
-            converter.process(str(json_path), str(dst_ttl))
-            logger.info(f"✅ Done: {json_path}")
-        except Exception as ex:
-            logger.error(json.dumps({
-                "json2ttl": "error",
-                "src": str(json_path),
-                "error": str(ex),
-            }))
+    converter = TransformJSONtoTTL(logger=logger)
+    with span("convert"), Progress(logger, "convert", total=len(checked.clean)) as progress:
+        for json_path in checked.clean:
+            dst_ttl = stage_dir / f"{json_path.stem}.ttl"
+            log_item(logger, "▶️ Converting: %s → %s", json_path, dst_ttl)
+            try:
+                converter.process(str(json_path), str(dst_ttl))
+                progress.update(outcome="ok")
+            except Exception as ex:
+                logger.error(json.dumps({
+                    "json2ttl": "error",
+                    "src": str(json_path),
+                    "error": str(ex),
+                }))
+                progress.update(outcome="error")
 
     # Merge staged TTLs → single ontology
-    merge_ttls_to_single_ontology(stage_dir, merged_path)
+    with span("merge"):
+        g = merge_ttls_to_single_ontology(stage_dir, merged_path, workers=workers)
+
+    # Optional: added/removed triples vs. the previous build
+    if changeset and g is not None:
+        kwargs = {"changes_dir": changes_dir} if changes_dir else {}
+        with span("changeset"):
+            write_changeset(g, ttl_out / ".snapshot", **kwargs)
+
+    # Optional: partition into self-contained shards
+    if shard_by and g is not None:
+        with span("shards"):
+            write_shards(g, shard_dir or (ttl_out / "shards"), by=shard_by, buckets=shard_buckets)
+
+    # Optional: occupation hierarchy closure + skill roll-ups
+    if occupation_index and g is not None:
+        with span("occupation_index"):
+            build_occupation_index_from_graph(g, occupation_index)
+
+    # Optional: BM25 full-text index (incremental when this build wrote a changeset)
+    if search_index and g is not None:
+        from wgu_osmt_builder.index.fulltext import refresh_search_index  # validate → build import cycle
+
+        kwargs = {"changes_dir": changes_dir} if changes_dir else {}
+        with span("search_index"):
+            refresh_search_index(merged_path, search_index, graph=g, **kwargs)
 
     # Remove intermediates; keep only merged
     try:
@@ -132,7 +276,8 @@ def main() -> None:
     json_root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(os.getenv("WGU_JSON_ROOT", RAW))
     ttl_out = Path(os.getenv("WGU_TTL_DIR", TTL_OUT))
     merged = Path(os.getenv("WGU_OWL_PATH", ttl_out / "skills.ttl"))
-    process_directory(json_root, ttl_out, merged)
+    workers = int(os.getenv("WGU_MERGE_WORKERS", "1"))
+    process_directory(json_root, ttl_out, merged, workers=workers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+changeset.py
+
+Diff the freshly merged graph against the previous build's snapshot.
+
+Snapshot:
+- <ttl_out>/.snapshot/skills.nt — sorted, de-duplicated N-Triples
+
+Changeset (one directory per build under data/out/changes/<stamp>-<head>):
+- add.nt / delete.nt   — triples added / removed
+- patch.rdfp           — the same as an RDF Patch (H/TX/D/A/TC rows)
+- summary.json         — base/head ids, totals, per-RSD change summary
+- ../latest.json       — name of the newest changeset directory
+
+Both sides are sorted, so the diff is a single streaming merge.
+"""
+
+from __future__ import annotations
+
+import json
+import hashlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from rdflib import Graph
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import CHANGES
+
+logger = configure_logger(__name__)
+
+SNAPSHOT_NAME = "skills.nt"
+LATEST = "latest.json"
+
+_RDF_TYPE = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+_RSD_CLASS = "<https://w3id.org/wgu/osmt/skills#RichSkillDescriptor>"
+_RSD_PREFIX = "<https://w3id.org/wgu/osmt/skills#rsd-"
+
+
+def snapshot_lines(g: Graph) -> list[str]:
+    nt = g.serialize(format="nt", encoding="utf-8").decode("utf-8")
+    return sorted({ln for ln in nt.splitlines() if ln.strip()})
+
+
+def _digest(lines: Iterable[str]) -> str:
+    h = hashlib.sha256()
+    for ln in lines:
+        h.update(ln.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def _read_sorted(path: Path) -> Iterator[str]:
+    with path.open("r", encoding="utf-8") as f:
+        for ln in f:
+            ln = ln.rstrip("\n")
+            if ln:
+                yield ln
+
+
+def diff_sorted(old: Iterable[str], new: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """
+    Merge two sorted, unique line streams.
+    Yields ("D", line) for lines only in old, ("A", line) for lines only in new.
+    """
+    a, b = iter(old), iter(new)
+    x, y = next(a, None), next(b, None)
+    while x is not None or y is not None:
+        if y is None or (x is not None and x < y):
+            yield "D", x
+            x = next(a, None)
+        elif x is None or y < x:
+            yield "A", y
+            y = next(b, None)
+        else:
+            x, y = next(a, None), next(b, None)
+
+
+def _rsd_of(line: str) -> str | None:
+    if not line.startswith(_RSD_PREFIX):
+        return None
+    return line[1:line.index(">")].rsplit("#", 1)[-1]
+
+
+def write_changeset(g: Graph, snapshot_dir: Path, changes_dir: Path = CHANGES) -> Path | None:
+    """
+    Compare g with the stored snapshot, write a changeset, refresh the snapshot.
+    Returns the changeset directory, or None when there is no previous snapshot.
+    """
+    new_lines = snapshot_lines(g)
+    head = _digest(new_lines)
+    snap = snapshot_dir / SNAPSHOT_NAME
+
+    out_dir: Path | None = None
+    if snap.exists():
+        base = _digest(_read_sorted(snap))
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        out_dir = changes_dir / f"{stamp}-{head[:8]}"
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        rsds: dict[str, dict] = {}
+        n_add = n_del = 0
+        with (out_dir / "add.nt").open("w", encoding="utf-8") as fa, \
+                (out_dir / "delete.nt").open("w", encoding="utf-8") as fd, \
+                (out_dir / "patch.rdfp").open("w", encoding="utf-8") as fp:
+            fp.write(f"H id <urn:sha256:{head}> .\n")
+            fp.write(f"H prev <urn:sha256:{base}> .\n")
+            fp.write("TX .\n")
+            for op, line in diff_sorted(_read_sorted(snap), new_lines):
+                fp.write(f"{op} {line}\n")
+                if op == "A":
+                    fa.write(line + "\n")
+                    n_add += 1
+                else:
+                    fd.write(line + "\n")
+                    n_del += 1
+                rsd = _rsd_of(line)
+                if rsd is None:
+                    continue
+                entry = rsds.setdefault(rsd, {"status": "modified", "added": 0, "removed": 0})
+                entry["added" if op == "A" else "removed"] += 1
+                if _RDF_TYPE in line and line.endswith(f"{_RSD_CLASS} ."):
+                    entry["status"] = "added" if op == "A" else "removed"
+            fp.write("TC .\n")
+
+        summary = {
+            "base": base,
+            "head": head,
+            "added": n_add,
+            "removed": n_del,
+            "rsds": dict(sorted(rsds.items())),
+        }
+        (out_dir / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        (changes_dir / LATEST).write_text(json.dumps({"dir": out_dir.name, "head": head}), encoding="utf-8")
+        logger.info(json.dumps({
+            "json2ttl": "changeset",
+            "added": n_add,
+            "removed": n_del,
+            "rsds": len(rsds),
+            "dst": str(out_dir),
+        }))
+    else:
+        logger.info(f"ℹ️ No previous snapshot at {snap}; recording baseline only")
+
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    tmp = snap.with_suffix(".nt.tmp")
+    tmp.write_text("".join(ln + "\n" for ln in new_lines), encoding="utf-8")
+    tmp.replace(snap)
+    return out_dir
+
+
+def snapshot_head(snapshot_dir: Path) -> str | None:
+    """Build id (sha256 of the sorted N-Triples) of the stored snapshot, if any."""
+    snap = snapshot_dir / SNAPSHOT_NAME
+    return _digest(_read_sorted(snap)) if snap.exists() else None
+
+
+def latest_changeset(changes_dir: Path = CHANGES) -> Path | None:
+    """Directory of the newest changeset, if any."""
+    ptr = changes_dir / LATEST
+    if not ptr.exists():
+        return None
+    return changes_dir / json.loads(ptr.read_text(encoding="utf-8"))["dir"]
@@ -13,7 +13,8 @@ from urllib.parse import urlparse
 from logging import Logger
 
 from rdflib.namespace import XSD  # noqa: F401  kept for future typed literals
-from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.log import configure_logger, log_item
+from wgu_osmt_builder.common.profile import span
 
 
 class TransformJSONtoTTL:
@@ -27,17 +28,20 @@ class TransformJSONtoTTL:
         src = Path(src_json_path)
         dst = Path(dst_ttl_path)
 
-        data = self._load_json(src)
-        ttl_str = self._build_ttl(data)
+        with span("json_load"):
+            data = self._load_json(src)
+        with span("ttl_build"):
+            ttl_str = self._build_ttl(data)
 
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        dst.write_text(ttl_str, encoding="utf-8")
+        with span("write"):
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            dst.write_text(ttl_str, encoding="utf-8")
 
-        self.logger.info(json.dumps({
+        log_item(self.logger, {
             "json2ttl": "ok",
             "src": str(src),
             "dst": str(dst),
-        }))
+        })
 
     # ---------- IO ----------
     def _load_json(self, path: Path) -> dict[str, object]:
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+rsd_schema.py
+
+Shape check for OSMT RichSkillDescriptor JSON, run in batch before
+conversion so malformed records never reach TransformJSONtoTTL.
+
+The schema is declared once as a small tree of nodes and compiled into
+nested closures (no per-record interpretation of the spec, no third-party
+dependency). Unknown keys are allowed; only the fields the converter reads
+are constrained.
+
+Outcome per file:
+- clean       → convert
+- skipped     → valid JSON but not an RSD (same rule as is_osmt_json)
+- bad         → unreadable JSON or schema errors; optionally moved to a
+                quarantine directory with report.json describing why
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import shutil
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import RAW, QUARANTINE
+
+logger = configure_logger(__name__)
+
+Check = Callable[[object, str, list], None]
+
+
+# -------------------- schema nodes --------------------
+
+@dataclass(frozen=True)
+class Scalar:
+    """str, or a number the converter will str() (bool is rejected)."""
+    nullable: bool = True
+
+
+@dataclass(frozen=True)
+class Str:
+    nullable: bool = True
+
+
+@dataclass(frozen=True)
+class ListOf:
+    item: object
+    nullable: bool = True
+
+
+@dataclass(frozen=True)
+class Obj:
+    fields: dict = field(default_factory=dict)
+    required: tuple[str, ...] = ()
+    nullable: bool = False
+
+
+@dataclass(frozen=True)
+class AnyOf:
+    options: tuple
+    nullable: bool = False
+
+
+RSD_SCHEMA = Obj(
+    fields={
+        "type": Str(nullable=False),
+        "uuid": Scalar(),
+        "id": Str(),
+        "skillName": Scalar(),
+        "skillStatement": Scalar(),
+        "category": Scalar(),
+        "creator": Str(),
+        "author": Scalar(),
+        "status": Scalar(),
+        "creationDate": Str(),
+        "publishDate": Str(),
+        "updateDate": Str(),
+        "keywords": ListOf(Scalar(nullable=False)),
+        "standards": ListOf(AnyOf((Scalar(nullable=False), Obj({"skillName": Scalar()})))),
+        "collections": ListOf(Obj({"uuid": Scalar(), "name": Scalar()})),
+        "alignments": ListOf(Obj({"id": Scalar(), "skillName": Scalar()})),
+        "occupations": ListOf(Obj({
+            "code": Scalar(),
+            "targetNodeName": Scalar(),
+            "parents": ListOf(Obj({"code": Scalar()})),
+        })),
+    },
+    required=("type",),
+)
+
+
+# -------------------- compiler --------------------
+
+_SCALARS = (str, int, float)
+
+
+def compile_schema(node: object) -> Check:
+    """Turn a schema node into a closure check(value, path, errors)."""
+    if isinstance(node, Str):
+        nullable = node.nullable
+
+        def check_str(v, path, errors):
+            if v is None:
+                if not nullable:
+                    errors.append((path, "required"))
+            elif not isinstance(v, str):
+                errors.append((path, f"expected string, got {type(v).__name__}"))
+        return check_str
+
+    if isinstance(node, Scalar):
+        nullable = node.nullable
+
+        def check_scalar(v, path, errors):
+            if v is None:
+                if not nullable:
+                    errors.append((path, "required"))
+            elif isinstance(v, bool) or not isinstance(v, _SCALARS):
+                errors.append((path, f"expected scalar, got {type(v).__name__}"))
+        return check_scalar
+
+    if isinstance(node, ListOf):
+        nullable = node.nullable
+        item = compile_schema(node.item)
+
+        def check_list(v, path, errors):
+            if v is None:
+                if not nullable:
+                    errors.append((path, "required"))
+                return
+            if not isinstance(v, list):
+                errors.append((path, f"expected list, got {type(v).__name__}"))
+                return
+            for i, x in enumerate(v):
+                item(x, f"{path}[{i}]", errors)
+        return check_list
+
+    if isinstance(node, Obj):
+        nullable = node.nullable
+        checks = tuple((k, compile_schema(sub)) for k, sub in node.fields.items())
+        required = node.required
+
+        def check_obj(v, path, errors):
+            if v is None:
+                if not nullable:
+                    errors.append((path or "$", "required"))
+                return
+            if not isinstance(v, dict):
+                errors.append((path or "$", f"expected object, got {type(v).__name__}"))
+                return
+            for k in required:
+                if v.get(k) is None:
+                    errors.append((f"{path}.{k}", "required"))
+            for k, c in checks:
+                if k in v:
+                    c(v[k], f"{path}.{k}", errors)
+        return check_obj
+
+    if isinstance(node, AnyOf):
+        options = tuple(compile_schema(o) for o in node.options)
+
+        def check_any(v, path, errors):
+            for c in options:
+                trial: list = []
+                c(v, path, trial)
+                if not trial:
+                    return
+            errors.append((path, f"no matching alternative for {type(v).__name__}"))
+        return check_any
+
+    raise TypeError(f"Unknown schema node: {node!r}")
+
+
+_check_rsd = compile_schema(RSD_SCHEMA)
+
+
+def rsd_errors(data: object) -> list[tuple[str, str]]:
+    """Schema errors for one parsed RSD (empty list → clean)."""
+    errors: list[tuple[str, str]] = []
+    _check_rsd(data, "$", errors)
+    if isinstance(data, dict) and data.get("uuid") is None and not isinstance(data.get("id"), str):
+        errors.append(("$.uuid", "one of uuid or id is required"))
+    return errors
+
+
+# -------------------- batch --------------------
+
+@dataclass
+class CorpusCheck:
+    clean: list[Path] = field(default_factory=list)
+    skipped: list[Path] = field(default_factory=list)
+    bad: dict[Path, list[tuple[str, str]]] = field(default_factory=dict)
+
+
+def _check_files(paths: list[str]) -> list[tuple[str, str, list[tuple[str, str]]]]:
+    out: list[tuple[str, str, list[tuple[str, str]]]] = []
+    for p in paths:
+        try:
+            with open(p, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as ex:
+            out.append((p, "bad", [("$", f"unreadable JSON: {ex}")]))
+            continue
+        if not (isinstance(data, dict) and data.get("type") == "RichSkillDescriptor"):
+            out.append((p, "skipped", []))
+            continue
+        errors = rsd_errors(data)
+        out.append((p, "bad" if errors else "clean", errors))
+    return out
+
+
+def check_corpus(json_files: list[Path], workers: int = 1) -> CorpusCheck:
+    """Validate every file; fan out across processes when workers > 1."""
+    from wgu_osmt_builder.build.assemble import _chunk, resolve_workers  # assemble imports this module
+
+    paths = [str(p) for p in json_files]
+    n = resolve_workers(workers)
+    if n > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=n) as pool:
+            results = [r for chunk in pool.map(_check_files, _chunk(paths, n * 4)) for r in chunk]
+    else:
+        results = _check_files(paths)
+
+    res = CorpusCheck()
+    for p, verdict, errors in results:
+        if verdict == "clean":
+            res.clean.append(Path(p))
+        elif verdict == "skipped":
+            res.skipped.append(Path(p))
+        else:
+            res.bad[Path(p)] = errors
+    return res
+
+
+def quarantine(bad: dict[Path, list[tuple[str, str]]], json_root: Path, quarantine_dir: Path) -> Path:
+    """
+    Move bad inputs under quarantine_dir (keeping their relative path) and
+    write report.json. Entries from earlier runs are kept while their files remain.
+    """
+    quarantine_dir.mkdir(parents=True, exist_ok=True)
+    report_path = quarantine_dir / "report.json"
+    try:
+        entries = {e["dst"]: e for e in json.loads(report_path.read_text(encoding="utf-8"))}
+    except (OSError, ValueError):
+        entries = {}
+    entries = {k: e for k, e in entries.items() if Path(k).exists()}
+
+    for src, errors in sorted(bad.items()):
+        try:
+            rel = src.relative_to(json_root)
+        except ValueError:
+            rel = Path(src.name)
+        dst = quarantine_dir / rel
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(src), str(dst))
+        entries[str(dst)] = {
+            "src": str(src),
+            "dst": str(dst),
+            "errors": [{"path": p, "msg": m} for p, m in errors],
+        }
+        logger.warning(f"🚧 Quarantined: {src} → {dst}")
+
+    report_path.write_text(json.dumps(sorted(entries.values(), key=lambda e: e["dst"]), indent=2), encoding="utf-8")
+    return report_path
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Validate RSD JSON shape; optionally quarantine bad inputs")
+    ap.add_argument("json_root", type=Path, nargs="?", default=RAW)
+    ap.add_argument("--quarantine", type=Path, nargs="?", const=QUARANTINE, help=f"Move bad inputs here (default: {QUARANTINE})")
+    ap.add_argument("--workers", type=int, default=1, help="0 = one per CPU")
+    args = ap.parse_args()
+
+    files = sorted(args.json_root.rglob("*.json"))
+    res = check_corpus(files, workers=args.workers)
+    for p, errors in sorted(res.bad.items()):
+        print(json.dumps({"src": str(p), "errors": errors}))
+    if args.quarantine and res.bad:
+        quarantine(res.bad, args.json_root, args.quarantine)
+    print(f"✅ rsd schema: {len(res.clean)} clean, {len(res.skipped)} skipped, {len(res.bad)} bad")
+    sys.exit(1 if res.bad else 0)
+
+
+if __name__ == "__main__":
+    _cli()
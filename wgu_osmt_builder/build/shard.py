@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+shard.py
+
+Partition the merged ontology into self-contained shards.
+
+Each RSD is routed to one or more shards by collection, category or a
+stable hash bucket. A shard carries the ontology header, its RSDs and every
+entity they reference (keywords, categories, occupations and their
+:partOf ancestors, ...), so any shard parses and validates on its own.
+
+Layout:
+- <shard_dir>/<name>.ttl
+- <shard_dir>/manifest.json  (shards, RSD counts, triple counts, sha256)
+"""
+
+from __future__ import annotations
+
+import json
+import hashlib
+import zlib
+from pathlib import Path
+
+from rdflib import Graph, URIRef
+from rdflib.namespace import OWL, RDF
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.graph.build.schema import (
+    BASE, CLS_RSD, P_HAS_CATEGORY, P_IN_COLLECTION, localname,
+)
+
+logger = configure_logger(__name__)
+
+SHARD_BY = ("collection", "category", "hash")
+MANIFEST = "manifest.json"
+UNASSIGNED = "unassigned"
+
+_HEADER_TYPES = (OWL.Ontology, OWL.Class, OWL.ObjectProperty)
+
+
+def _header_triples(g: Graph) -> list[tuple]:
+    out: list[tuple] = []
+    for cls in _HEADER_TYPES:
+        for s in g.subjects(RDF.type, cls):
+            out.extend(g.triples((s, None, None)))
+    return out
+
+
+def _shard_names(g: Graph, rsd: URIRef, by: str, buckets: int) -> list[str]:
+    if by == "collection":
+        names = sorted(localname(o) for o in g.objects(rsd, P_IN_COLLECTION))
+    elif by == "category":
+        names = sorted(localname(o) for o in g.objects(rsd, P_HAS_CATEGORY))
+    elif by == "hash":
+        bucket = zlib.crc32(localname(rsd).encode("utf-8")) % buckets
+        names = [f"bucket-{bucket:03d}"]
+    else:
+        raise ValueError(f"Unknown shard key: {by!r} (expected one of {SHARD_BY})")
+    return names or [UNASSIGNED]
+
+
+def _closure(g: Graph, root: URIRef) -> list[tuple]:
+    """All triples of root plus those of every in-namespace entity it reaches."""
+    triples: list[tuple] = []
+    seen = {root}
+    todo = [root]
+    while todo:
+        s = todo.pop()
+        for t in g.triples((s, None, None)):
+            triples.append(t)
+            o = t[2]
+            if t[1] == RDF.type or not isinstance(o, URIRef):
+                continue
+            if o not in seen and str(o).startswith(str(BASE)):
+                seen.add(o)
+                todo.append(o)
+    return triples
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def write_shards(g: Graph, shard_dir: Path, by: str = "collection", buckets: int = 16) -> dict:
+    """
+    Write one TTL per shard plus manifest.json. Returns the manifest.
+    """
+    if by not in SHARD_BY:
+        raise ValueError(f"Unknown shard key: {by!r} (expected one of {SHARD_BY})")
+
+    header = _header_triples(g)
+    shards: dict[str, Graph] = {}
+    rsd_counts: dict[str, int] = {}
+
+    for rsd in sorted(set(g.subjects(RDF.type, CLS_RSD))):
+        triples = _closure(g, rsd)
+        for name in _shard_names(g, rsd, by, buckets):
+            sg = shards.get(name)
+            if sg is None:
+                sg = Graph()
+                for prefix, ns in g.namespaces():
+                    sg.bind(prefix, ns, override=True, replace=True)
+                for t in header:
+                    sg.add(t)
+                shards[name] = sg
+                rsd_counts[name] = 0
+            for t in triples:
+                sg.add(t)
+            rsd_counts[name] += 1
+
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    for stale in shard_dir.glob("*.ttl"):
+        stale.unlink()
+
+    entries: list[dict] = []
+    for name in sorted(shards):
+        dst = shard_dir / f"{name}.ttl"
+        shards[name].serialize(destination=str(dst), format="turtle")
+        entries.append({
+            "name": name,
+            "file": dst.name,
+            "rsds": rsd_counts[name],
+            "triples": len(shards[name]),
+            "sha256": _sha256(dst),
+        })
+
+    manifest = {"by": by, "buckets": buckets if by == "hash" else None, "shards": entries}
+    (shard_dir / MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    logger.info(json.dumps({
+        "json2ttl": "sharded",
+        "by": by,
+        "shards": len(entries),
+        "dst": str(shard_dir),
+    }))
+    return manifest
+
+
+def load_manifest(shard_dir: Path) -> dict:
+    path = shard_dir / MANIFEST
+    if not path.exists():
+        raise FileNotFoundError(f"Shard manifest not found: {path}")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def select_shards(shard_dir: Path, names: list[str] | None = None) -> list[Path]:
+    """
+    Resolve shard names (as listed in the manifest) to TTL paths.
+    No names → every shard.
+    """
+    manifest = load_manifest(shard_dir)
+    known = {e["name"]: shard_dir / e["file"] for e in manifest["shards"]}
+    if not names:
+        return [known[n] for n in sorted(known)]
+    missing = [n for n in names if n not in known]
+    if missing:
+        raise KeyError(f"Unknown shard(s): {', '.join(missing)}")
+    return [known[n] for n in names]
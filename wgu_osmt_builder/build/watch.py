@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+watch.py
+
+Long-running incremental build: watch the JSON root and keep skills.ttl
+(and, optionally, the validate/graph artifacts) current while a fetch is
+still running.
+
+Behavior:
+- Uses Linux inotify (via libc) when available, polling otherwise
+- Changed/new RSD files are converted into <ttl_out>/.partials (kept)
+- Triples are reference-counted per partial, so a changed or deleted file
+  only retracts what no other partial still asserts
+- Events are debounced into micro-batches; each batch rewrites the merged
+  TTL atomically and then refreshes derived stages via the stage cache
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+from collections import Counter
+from pathlib import Path
+
+from rdflib import Graph
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import RAW, TTL_OUT
+from wgu_osmt_builder.build.assemble import find_json_files
+from wgu_osmt_builder.build.rsd_schema import check_corpus
+from wgu_osmt_builder.build.json2ttl import TransformJSONtoTTL
+
+logger = configure_logger(__name__)
+
+
+# -------------------- watchers --------------------
+
+class PollWatcher:
+    """Portable fallback: diff (size, mtime_ns) snapshots of *.json files."""
+
+    def __init__(self, root: Path, interval: float = 1.0) -> None:
+        self.root = root
+        self.interval = interval
+        self._snap = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        out: dict[Path, tuple[int, int]] = {}
+        for p in self.root.rglob("*.json"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            out[p] = (st.st_size, st.st_mtime_ns)
+        return out
+
+    def poll(self, timeout: float) -> set[Path]:
+        time.sleep(min(timeout, self.interval))
+        snap = self._scan()
+        changed = {p for p, sig in snap.items() if self._snap.get(p) != sig}
+        changed |= set(self._snap) - set(snap)
+        self._snap = snap
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify via libc; watches the root and its subdirectories."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_ISDIR = 0x40000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, root: Path) -> None:
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        self._add(root)
+        for d in root.rglob("*"):
+            if d.is_dir():
+                self._add(d)
+
+    @classmethod
+    def available(cls) -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+        lib = ctypes.util.find_library("c")
+        return bool(lib) and hasattr(ctypes.CDLL(lib), "inotify_init1")
+
+    def _add(self, d: Path) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, str(d).encode("utf-8"), self.MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {d}")
+        self._dirs[wd] = d
+
+    def poll(self, timeout: float) -> set[Path]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed: set[Path] = set()
+        buf = os.read(self.fd, 1 << 16)
+        i = 0
+        while i + self._EVENT.size <= len(buf):
+            wd, mask, _cookie, length = self._EVENT.unpack_from(buf, i)
+            i += self._EVENT.size
+            name = buf[i:i + length].rstrip(b"\0").decode("utf-8", "replace")
+            i += length
+            parent = self._dirs.get(wd)
+            if parent is None or not name:
+                continue
+            p = parent / name
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self._add(p)
+                    changed.update(p.rglob("*.json"))
+                continue
+            # IN_CREATE alone means "still being written"; wait for CLOSE_WRITE
+            if p.suffix == ".json" and mask != self.IN_CREATE:
+                changed.add(p)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def make_watcher(root: Path, force_poll: bool = False, interval: float = 1.0):
+    if not force_poll and InotifyWatcher.available():
+        try:
+            w = InotifyWatcher(root)
+            logger.info(f"👀 Watching {root} (inotify)")
+            return w
+        except OSError as ex:
+            logger.warning(f"⚠️ inotify unavailable ({ex}); falling back to polling")
+    logger.info(f"👀 Watching {root} (polling every {interval}s)")
+    return PollWatcher(root, interval=interval)
+
+
+# -------------------- incremental assembler --------------------
+
+class IncrementalAssembler:
+    """
+    Keeps one live Graph equal to the union of all partial TTLs.
+    Each partial's triples are remembered; a shared triple stays in the
+    graph while any partial still references it.
+    """
+
+    def __init__(self, json_root: Path, ttl_out: Path, merged_path: Path) -> None:
+        self.json_root = json_root
+        self.stage_dir = ttl_out / ".partials"
+        self.merged_path = merged_path
+        self.converter = TransformJSONtoTTL(logger=logger)
+        self.graph = Graph()
+        self._by_file: dict[Path, set[tuple]] = {}
+        self._refs: Counter = Counter()
+        self.stage_dir.mkdir(parents=True, exist_ok=True)
+
+    def _partial(self, json_path: Path) -> Path:
+        return self.stage_dir / f"{json_path.stem}.ttl"
+
+    def _convert(self, json_path: Path) -> tuple[set[tuple], dict[str, str]]:
+        dst = self._partial(json_path)
+        checked = check_corpus([json_path]) if json_path.exists() else None
+        if checked is None or not checked.clean:
+            if checked is not None and checked.bad:
+                logger.error(json.dumps({
+                    "json2ttl": "invalid",
+                    "src": str(json_path),
+                    "errors": [f"{p}: {m}" for p, m in checked.bad[json_path]],
+                }))
+            dst.unlink(missing_ok=True)
+            return set(), {}
+        self.converter.process(str(json_path), str(dst))
+        g = Graph()
+        g.parse(dst, format="turtle")
+        return set(g), {p: str(ns) for p, ns in g.namespaces()}
+
+    def apply(self, paths: set[Path]) -> int:
+        """Re-sync the given JSON files. Returns the number of files applied."""
+        applied = 0
+        for p in sorted(paths):
+            try:
+                new, namespaces = self._convert(p)
+            except Exception as ex:
+                logger.error(json.dumps({
+                    "json2ttl": "error",
+                    "src": str(p),
+                    "error": str(ex),
+                }))
+                continue
+            for prefix, ns in namespaces.items():
+                self.graph.bind(prefix, ns, override=True, replace=True)
+            old = self._by_file.pop(p, set())
+            for t in old - new:
+                self._refs[t] -= 1
+                if self._refs[t] <= 0:
+                    del self._refs[t]
+                    self.graph.remove(t)
+            for t in new - old:
+                self._refs[t] += 1
+                if self._refs[t] == 1:
+                    self.graph.add(t)
+            if new:
+                self._by_file[p] = new
+            applied += 1
+        return applied
+
+    def flush(self) -> None:
+        """Atomically rewrite the merged TTL from the live graph."""
+        self.merged_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.merged_path.with_name(f".{self.merged_path.name}.tmp")
+        self.graph.serialize(destination=str(tmp), format="turtle")
+        os.replace(tmp, self.merged_path)
+        logger.info(json.dumps({
+            "json2ttl": "merged",
+            "count": len(self._by_file),
+            "triples": len(self.graph),
+            "dst": str(self.merged_path),
+        }))
+
+
+# -------------------- loop --------------------
+
+def _refresh_derived(merged_path: Path) -> None:
+    from wgu_osmt_builder.common.pipeline import default_config, run_pipeline
+    cfg = default_config()
+    cfg["merged"] = merged_path
+    run_pipeline(only=["validate", "graph"], cfg=cfg)
+
+
+def watch(
+    json_root: Path,
+    ttl_out: Path,
+    merged_path: Path,
+    debounce: float = 2.0,
+    max_wait: float = 30.0,
+    interval: float = 1.0,
+    force_poll: bool = False,
+    derived: bool = True,
+    max_batches: int | None = None,
+) -> None:
+    """
+    Initial full sync, then debounced micro-batches until interrupted
+    (or until max_batches batches have been flushed).
+    """
+    json_root.mkdir(parents=True, exist_ok=True)
+    asm = IncrementalAssembler(json_root, ttl_out, merged_path)
+    watcher = make_watcher(json_root, force_poll=force_poll, interval=interval)
+
+    def _flush(n: int) -> None:
+        asm.flush()
+        logger.info(f"🔄 Batch applied: {n} file(s)")
+        if derived:
+            _refresh_derived(merged_path)
+
+    batches = 0
+    try:
+        _flush(asm.apply(set(find_json_files(json_root))))
+        batches += 1
+        pending: set[Path] = set()
+        first = last = 0.0
+        while max_batches is None or batches < max_batches:
+            changed = watcher.poll(debounce if pending else 1.0)
+            now = time.monotonic()
+            if changed:
+                if not pending:
+                    first = now
+                pending |= changed
+                last = now
+            if pending and (now - last >= debounce or now - first >= max_wait):
+                _flush(asm.apply(pending))
+                pending = set()
+                batches += 1
+    except KeyboardInterrupt:
+        logger.info("🛑 Watch stopped")
+    finally:
+        watcher.close()
+
+
+def main() -> None:
+    json_root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(os.getenv("WGU_JSON_ROOT", RAW))
+    ttl_out = Path(os.getenv("WGU_TTL_DIR", TTL_OUT))
+    merged = Path(os.getenv("WGU_OWL_PATH", ttl_out / "skills.ttl"))
+    watch(json_root, ttl_out, merged)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,45 +9,62 @@ Subcommands:
   build     → convert JSON → TTL and merge to skills.ttl
   validate  → extract label reports from skills.ttl
   graph     → export Neo4j bulk-import CSVs from skills.ttl
+  watch     → incrementally rebuild skills.ttl as JSON lands in data/raw
+  run       → fetch → build → (validate ∥ graph), skipping unchanged stages
+  load      → load the graph CSVs into Neo4j with batched UNWIND statements
+  graph-diff→ upsert/delete delta between two graph exports (optionally applied to Neo4j)
+  stats     → graph counts + materialized aggregates from the CSV export (no database)
+  csr       → compile the graph export into NumPy CSR adjacency arrays (.npz)
+  similar   → top-k similar RSDs (TF-IDF over keyword/occupation/standard/category links)
+  suggest   → prefix autocomplete over skill / keyword / occupation / category labels
+  search    → BM25 full-text search over RSD names, statements and keywords
+  serve     → local read-only HTTP/JSON skills query service (LRU cache, hot reload)
+  bench     → throughput/peak-memory benchmarks on synthetic corpora vs. saved baselines
+
+Global --profile (before the subcommand) writes a timing-span report and a
+collapsed-stack file under data/out/profile; --cprofile adds a .pstats dump.
 
 Defaults use wgu_osmt_builder.common.paths.
 """
 
 from __future__ import annotations
 
+import os
 import argparse
 from pathlib import Path
 
 from wgu_osmt_builder.common.log import configure_logger
-from wgu_osmt_builder.common.paths import RAW, TTL_OUT, REPORTS
+from wgu_osmt_builder.common.paths import (
+    RAW, TTL_OUT, REPORTS, QUARANTINE, INDEX, CHANGES, CSR_NPZ, SIMILAR_INDEX, SKILLS_INDEX, SEARCH_INDEX,
+    PREFIX_INDEX, STAGE_CACHE, PROFILE, BENCH, GRAPH_STATS as GRAPH_STATS_OUT, GRAPH_DELTA as GRAPH_DELTA_OUT, ADMIN_IMPORT as ADMIN_IMPORT_OUT,
+)
 from wgu_osmt_builder.common.config import PROXIES_PATH
+from wgu_osmt_builder.common.profile import span
 
-# fetch
-from wgu_osmt_builder.fetch.wgu import FetchWGUData
-from wgu_osmt_builder.fetch.collections import process_directory as fetch_collections
-
-# build
-from wgu_osmt_builder.build.assemble import process_directory as build_process
-
-# validate
-from wgu_osmt_builder.validate.alignments import extract_alignment_labels
-from wgu_osmt_builder.validate.bls import extract_bls_pref_labels
-from wgu_osmt_builder.validate.keywords import extract_keyword_labels
-from wgu_osmt_builder.validate.rsd import extract_rsd_pref_labels
-
-# graph export
-from wgu_osmt_builder.graph.build.export import export_neo_csvs
 from wgu_osmt_builder.common.paths import TTL_OUT as _TTL_DEFAULT  # explicit for help text
 try:
     from wgu_osmt_builder.common.paths import GRAPH as GRAPH_OUT_DEFAULT  # optional path
 except Exception:
     GRAPH_OUT_DEFAULT = Path("data/out/graph")
 
+# Subcommand modules are imported inside their handlers, so `--help` or `fetch`
+# does not pay for rdflib, numpy or pyarrow. Parser choices/defaults owned by
+# those modules are mirrored here (tests/test_cli_startup.py keeps them in sync).
+SHARD_BY = ("collection", "category", "hash")
+PREFIX_KINDS = ("skill", "keyword", "occupation", "category")
+DEFAULT_BATCH = 5000
+DEFAULT_PART_ROWS = 500_000
+DEFAULT_HOST, DEFAULT_PORT, DEFAULT_CACHE = "127.0.0.1", 8765, 4096
+BENCH_SIZES, BENCH_THRESHOLD = (1_000,), 0.25
+
 logger = configure_logger(__name__)
 
 
 # ----------------------------- fetch -----------------------------
 def _cmd_fetch(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.fetch.wgu import FetchWGUData
+    from wgu_osmt_builder.fetch.collections import process_directory as fetch_collections
+
     if args.dir and args.csv:
         logger.error("Provide either --dir or --csv, not both.")
         return 2
@@ -82,16 +99,68 @@ def _cmd_fetch(args: argparse.Namespace) -> int:
 
 # ----------------------------- build -----------------------------
 def _cmd_build(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.build.assemble import process_directory as build_process
+
+    json_root = Path(args.json_root or RAW)
+    ttl_out = Path(args.ttl_out or TTL_OUT)
+    merged = Path(args.merged or (ttl_out / "skills.ttl"))
+
+    build_process(
+        json_root, ttl_out, merged,
+        workers=args.workers,
+        shard_by=args.shard_by,
+        shard_dir=Path(args.shards_dir) if args.shards_dir else None,
+        shard_buckets=args.shard_buckets,
+        changeset=args.changeset,
+        changes_dir=Path(args.changes_dir) if args.changes_dir else None,
+        quarantine_dir=Path(args.quarantine) if args.quarantine else None,
+        occupation_index=Path(args.occupation_index) if args.occupation_index else None,
+        search_index=Path(args.search_index) if args.search_index else None,
+    )
+    return 0
+
+
+# ----------------------------- watch -----------------------------
+def _cmd_watch(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.build.watch import watch as build_watch
+
     json_root = Path(args.json_root or RAW)
     ttl_out = Path(args.ttl_out or TTL_OUT)
     merged = Path(args.merged or (ttl_out / "skills.ttl"))
 
-    build_process(json_root, ttl_out, merged)
+    build_watch(
+        json_root, ttl_out, merged,
+        debounce=args.debounce,
+        max_wait=args.max_wait,
+        interval=args.interval,
+        force_poll=args.poll,
+        derived=not args.no_derived,
+    )
     return 0
 
 
 # --------------------------- validate ----------------------------
 def _cmd_validate(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.common.parquet_utils import reports_to_parquet, require_pyarrow
+    from wgu_osmt_builder.validate.alignments import extract_alignment_labels
+    from wgu_osmt_builder.validate.bls import extract_bls_pref_labels
+    from wgu_osmt_builder.validate.incremental import refresh_reports
+    from wgu_osmt_builder.validate.integrity import extract_integrity_report
+    from wgu_osmt_builder.validate.keywords import extract_keyword_labels
+    from wgu_osmt_builder.validate.keyword_dupes import extract_keyword_near_duplicates
+    from wgu_osmt_builder.validate.rsd import extract_rsd_pref_labels
+    from wgu_osmt_builder.validate.shards import REPORT_FILES, extract_reports_from_shards
+
+    if args.shards_dir:
+        unsupported = [flag for flag, on in (
+            ("--integrity", args.integrity), ("--near-dupes", args.near_dupes),
+            ("--prefix-index", args.prefix_index), ("--incremental", args.incremental),
+        ) if on]
+        if unsupported:
+            logger.error(f"--shards-dir only writes the label reports; drop {', '.join(unsupported)} "
+                         "or run them against a merged --ttl.")
+            return 2
+
     ttl_path = Path(args.ttl or (TTL_OUT / "skills.ttl"))
     out_dir = Path(args.out_dir or REPORTS)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -109,25 +178,68 @@ def _cmd_validate(args: argparse.Namespace) -> int:
         if args.rsd:
             selected.append("rsd")
 
+    if args.parquet:
+        require_pyarrow()
+    mirrored = list(REPORT_FILES) if args.incremental else list(selected)
+
+    if args.shards_dir:
+        totals = extract_reports_from_shards(
+            Path(args.shards_dir), out_dir, selected, names=args.shard,
+            lang=args.lang, include_alt=args.alt, workers=args.workers,
+        )
+        if args.parquet:
+            totals["parquet"] = reports_to_parquet([out_dir / REPORT_FILES[k] for k in mirrored])
+        logger.info(f"reports: {totals}")
+        return 0
+
     totals: dict[str, int] = {}
 
+    if args.incremental:
+        kwargs = {"changes_dir": Path(args.changes_dir)} if args.changes_dir else {}
+        res = refresh_reports(ttl_path, out_dir, lang=args.lang, include_alt=args.alt, **kwargs)
+        logger.info(f"incremental reports ({res['mode']}): {res['written']}")
+        selected = []
+
     if "alignments" in selected:
         dst = out_dir / "alignment-labels.txt"
-        totals["alignments"] = extract_alignment_labels(
-            ttl_path, dst, lang=args.lang, include_alt=args.alt
-        )
+        with span("alignments"):
+            totals["alignments"] = extract_alignment_labels(
+                ttl_path, dst, lang=args.lang, include_alt=args.alt
+            )
 
     if "bls" in selected:
         dst = out_dir / "bls-labels.txt"
-        totals["bls"] = extract_bls_pref_labels(ttl_path, dst, lang=args.lang)
+        with span("bls"):
+            totals["bls"] = extract_bls_pref_labels(ttl_path, dst, lang=args.lang)
 
     if "keywords" in selected:
         dst = out_dir / "keyword-labels.txt"
-        totals["keywords"] = extract_keyword_labels(ttl_path, dst, lang=args.lang)
+        with span("keywords"):
+            totals["keywords"] = extract_keyword_labels(ttl_path, dst, lang=args.lang)
 
     if "rsd" in selected:
         dst = out_dir / "rsd-pref-labels.txt"
-        totals["rsd"] = extract_rsd_pref_labels(ttl_path, dst, lang=args.lang)
+        with span("rsd"):
+            totals["rsd"] = extract_rsd_pref_labels(ttl_path, dst, lang=args.lang)
+
+    if args.near_dupes:
+        dst = out_dir / "keyword-near-duplicates.json"
+        with span("near_dupes"):
+            totals["keyword_near_dupes"] = extract_keyword_near_duplicates(ttl_path, dst, lang=args.lang)
+
+    if args.integrity or args.all:
+        dst = out_dir / "integrity.json"
+        with span("integrity"):
+            totals["integrity"] = extract_integrity_report(ttl_path, dst, lang=args.lang)
+
+    if args.parquet:
+        with span("parquet"):
+            totals["parquet"] = reports_to_parquet([out_dir / REPORT_FILES[k] for k in mirrored])
+
+    if args.prefix_index:
+        from wgu_osmt_builder.index.prefix import build_from_source as build_prefix_index
+        with span("prefix_index"):
+            totals["prefix_index"] = build_prefix_index(ttl_path, out_dir=Path(args.prefix_index))["entries"]
 
     logger.info(f"reports: {totals}")
     return 0
@@ -135,15 +247,181 @@ def _cmd_validate(args: argparse.Namespace) -> int:
 
 # ---------------------------- graph ------------------------------
 def _cmd_graph(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.build.assemble import load_ttls
+    from wgu_osmt_builder.build.shard import select_shards
+    from wgu_osmt_builder.graph.build.admin_import import export_admin_import
+    from wgu_osmt_builder.graph.build.export import export_neo_csvs
+
     ttl_path = Path(args.ttl or (TTL_OUT / "skills.ttl"))
     out_dir = Path(args.out_dir or GRAPH_OUT_DEFAULT)
-    export_neo_csvs(ttl_path=ttl_path, out_dir=out_dir)
+    g = None
+    if args.shards_dir:
+        shards = select_shards(Path(args.shards_dir), args.shard)
+        with span("load_shards"):
+            g = load_ttls(shards, workers=args.workers)
+    if args.admin_import:
+        export_admin_import(ttl_path=ttl_path, out_dir=Path(args.admin_import), graph=g,
+                            rows_per_part=args.part_rows, database=args.database)
+        return 0
+    export_neo_csvs(ttl_path=ttl_path, out_dir=out_dir, graph=g, parquet=args.parquet)
+    return 0
+
+
+# ----------------------------- run -------------------------------
+def _cmd_run(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.common.pipeline import default_config, run_pipeline
+
+    cfg = default_config(workers=args.workers, lang=args.lang)
+    status = run_pipeline(
+        only=args.stages, force=args.force, cfg=cfg,
+        cache_dir=Path(args.cache_dir or STAGE_CACHE),
+    )
+    logger.info(f"pipeline: {status}")
+    return 0
+
+
+# ----------------------------- load ------------------------------
+def _cmd_load(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.graph.load.loader import Loader, connect as neo4j_connect
+
+    graph_dir = Path(args.graph_dir or GRAPH_OUT_DEFAULT)
+    with neo4j_connect(uri=args.uri, user=args.user) as driver:
+        res = Loader(driver, database=args.database, batch_size=args.batch_size,
+                     workers=args.workers, retries=args.retries).load(graph_dir, constraints=not args.no_constraints)
+    logger.info(f"load: {res}")
     return 0
 
 
+# -------------------------- graph-diff ---------------------------
+def _cmd_graph_diff(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.graph.build.diff import diff_exports
+    from wgu_osmt_builder.graph.load.loader import Loader, connect as neo4j_connect
+
+    new_dir = Path(args.new or GRAPH_OUT_DEFAULT)
+    out_dir = Path(args.out or GRAPH_DELTA_OUT)
+    summary = diff_exports(Path(args.old), new_dir, out_dir)
+    if args.apply:
+        with neo4j_connect(uri=args.uri, user=args.user) as driver:
+            summary["applied"] = Loader(driver, database=args.database, batch_size=args.batch_size,
+                                        workers=args.workers).apply_delta(out_dir)
+    logger.info(f"graph-diff: {summary}")
+    return 0
+
+
+# ----------------------------- stats -----------------------------
+def _cmd_stats(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.graph.build.stats import offline_stats
+
+    stats = offline_stats(
+        graph_dir=Path(args.graph_dir or GRAPH_OUT_DEFAULT),
+        ttl_path=Path(args.ttl) if args.ttl else None,
+        out_dir=Path(args.out_dir or GRAPH_STATS_OUT),
+    )
+    logger.info(f"stats: {stats['summary']} nodes={stats['nodes']} relationships={stats['relationships']}")
+    return 0
+
+
+# ------------------------------ csr ------------------------------
+def _cmd_csr(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.analytics.csr import build_from_export as build_csr
+
+    csr = build_csr(
+        graph_dir=Path(args.graph_dir or GRAPH_OUT_DEFAULT),
+        ttl_path=Path(args.ttl) if args.ttl else None,
+        out_path=Path(args.out or CSR_NPZ),
+    )
+    logger.info(f"csr: { {t: int(len(a.indices)) for t, a in csr.rels.items()} }")
+    return 0
+
+
+# ---------------------------- similar ----------------------------
+def _cmd_similar(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.analytics.similarity import SimilarityIndex, build_similarity
+
+    index_path = Path(args.index or SIMILAR_INDEX)
+    if args.build or not index_path.exists():
+        index = build_similarity(Path(args.csr or CSR_NPZ), index_path, Path(args.graph_dir or GRAPH_OUT_DEFAULT),
+                                 k=args.k, max_df=args.max_df)
+    else:
+        index = SimilarityIndex.load(index_path)
+    for rsd_id in args.rsd:
+        print(f"\n{rsd_id}")
+        for other, s in index.similar(rsd_id, args.k):
+            print(f"  {s:.4f}  {other}")
+    return 0
+
+
+# ---------------------------- suggest ----------------------------
+def _cmd_suggest(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.index.prefix import PrefixIndex, build_from_source as build_prefix_index
+
+    index_dir = Path(args.index_dir or PREFIX_INDEX)
+    if args.build or not (index_dir / "manifest.json").exists():
+        build_prefix_index(
+            Path(args.ttl) if args.ttl else None,
+            graph_dir=Path(args.graph_dir or GRAPH_OUT_DEFAULT), out_dir=index_dir,
+        )
+    if args.prefix:
+        for hit in PrefixIndex(index_dir).suggest(" ".join(args.prefix), args.k, args.kind):
+            print(f"{hit['kind']:<10}  {hit['label']}  ({hit['id']})")
+    return 0
+
+
+# ---------------------------- search -----------------------------
+def _cmd_search(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.index.fulltext import FullTextIndex, refresh_search_index
+
+    index_dir = Path(args.index_dir or SEARCH_INDEX)
+    if args.update or args.full or not (index_dir / "manifest.json").exists():
+        res = refresh_search_index(
+            Path(args.ttl or (TTL_OUT / "skills.ttl")), index_dir,
+            changes_dir=Path(args.changes_dir or CHANGES), force_full=args.full, lang=args.lang,
+        )
+        logger.info(f"search index ({res['mode']}): {res['docs']:,} document(s) in {res['segments']} segment(s)")
+    if args.query:
+        index = FullTextIndex.load(index_dir)
+        names = index.names()
+        for rsd_id, score in index.search(" ".join(args.query), args.k):
+            print(f"{score:8.3f}  {rsd_id}  {names.get(rsd_id, '')}")
+    return 0
+
+
+# ----------------------------- serve -----------------------------
+def _cmd_serve(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.index.skills import build_from_source as build_skills_index
+    from wgu_osmt_builder.serve.server import serve as serve_skills
+
+    index_path = Path(args.index or SKILLS_INDEX)
+    graph_dir = Path(args.graph_dir) if args.graph_dir else None
+    ttl_path = None if graph_dir else Path(args.ttl or (TTL_OUT / "skills.ttl"))
+    if args.build:
+        build_skills_index(ttl_path, graph_dir or GRAPH_OUT_DEFAULT, index_path)
+    serve_skills(
+        index_path=index_path, host=args.host, port=args.port,
+        ttl_path=ttl_path, graph_dir=graph_dir,
+        cache_size=args.cache_size, reload_interval=args.reload_interval,
+    )
+    return 0
+
+
+# ----------------------------- bench -----------------------------
+def _cmd_bench(args: argparse.Namespace) -> int:
+    from wgu_osmt_builder.bench.suite import benchmark
+
+    return benchmark(
+        sizes=args.sizes, out_dir=Path(args.out_dir or BENCH),
+        work_dir=Path(args.work_dir) if args.work_dir else None, seed=args.seed,
+        save_baseline=args.save_baseline, threshold=args.threshold,
+    )
+
+
 # ----------------------------- parser ----------------------------
 def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="wgu-osmt-builder", description="WGU OSMT builder CLI")
+    p.add_argument("--profile", action="store_true",
+                   help="Record timing spans per stage/sub-step; writes <cmd>-<stamp>.json + .collapsed")
+    p.add_argument("--cprofile", action="store_true", help="Also capture cProfile stats as .pstats (implies --profile)")
+    p.add_argument("--profile-dir", help=f"Profile output directory (default: {PROFILE})")
     sub = p.add_subparsers(dest="cmd", required=True)
 
     # fetch
@@ -160,8 +438,31 @@ def _build_parser() -> argparse.ArgumentParser:
     pb.add_argument("--json-root", help=f"Root dir of JSON inputs (default: {RAW})")
     pb.add_argument("--ttl-out", help=f"Directory for per-file TTL outputs (default: {TTL_OUT})")
     pb.add_argument("--merged", help="Path to merged skills.ttl (default: <ttl-out>/skills.ttl)")
+    pb.add_argument("--workers", type=int, default=1, help="Parallel merge workers (0 = one per CPU, default: 1 = serial)")
+    pb.add_argument("--quarantine", nargs="?", const=str(QUARANTINE), help=f"Move schema-invalid JSON here with report.json (default dir: {QUARANTINE})")
+    pb.add_argument("--changeset", action="store_true", help="Diff against the previous build and write add/delete N-Triples + RDF Patch")
+    pb.add_argument("--changes-dir", help="Changeset output directory (default: data/out/changes)")
+    pb.add_argument("--shard-by", choices=SHARD_BY, help="Also write sharded TTL outputs + manifest.json")
+    pb.add_argument("--shards-dir", help="Shard output directory (default: <ttl-out>/shards)")
+    pb.add_argument("--shard-buckets", type=int, default=16, help="Bucket count for --shard-by hash")
+    pb.add_argument("--occupation-index", nargs="?", const=str(INDEX), metavar="DIR",
+                    help=f"Also write the occupation closure index + skill roll-ups (default dir: {INDEX})")
+    pb.add_argument("--search-index", nargs="?", const=str(SEARCH_INDEX), metavar="DIR",
+                    help=f"Also refresh the BM25 search index, incrementally with --changeset (default dir: {SEARCH_INDEX})")
     pb.set_defaults(func=_cmd_build)
 
+    # watch
+    pw = sub.add_parser("watch", help="Watch JSON inputs and rebuild skills.ttl in debounced micro-batches")
+    pw.add_argument("--json-root", help=f"Root dir of JSON inputs (default: {RAW})")
+    pw.add_argument("--ttl-out", help=f"Directory for per-file TTL outputs (default: {TTL_OUT})")
+    pw.add_argument("--merged", help="Path to merged skills.ttl (default: <ttl-out>/skills.ttl)")
+    pw.add_argument("--debounce", type=float, default=2.0, help="Quiet period in seconds before a batch is applied")
+    pw.add_argument("--max-wait", type=float, default=30.0, help="Apply a batch at least this often during a steady stream")
+    pw.add_argument("--interval", type=float, default=1.0, help="Polling interval when inotify is unavailable")
+    pw.add_argument("--poll", action="store_true", help="Force polling instead of inotify")
+    pw.add_argument("--no-derived", action="store_true", help="Only refresh skills.ttl, not reports/graph CSVs")
+    pw.set_defaults(func=_cmd_watch)
+
     # validate
     pv = sub.add_parser("validate", help="Generate label reports from skills.ttl")
     pv.add_argument("--ttl", help=f"Path to skills.ttl (default: {_TTL_DEFAULT / 'skills.ttl'})")
@@ -173,21 +474,158 @@ def _build_parser() -> argparse.ArgumentParser:
     pv.add_argument("--keywords", action="store_true", help="Only keyword labels")
     pv.add_argument("--rsd", action="store_true", help="Only RSD labels")
     pv.add_argument("--all", action="store_true", help="Run all reports")
+    pv.add_argument("--near-dupes", action="store_true", help="Also cluster near-duplicate keyword labels (MinHash/LSH)")
+    pv.add_argument("--integrity", action="store_true", help="Also run referential-integrity checks (implied by --all)")
+    pv.add_argument("--incremental", action="store_true",
+                    help="Maintain all label reports from the latest build changesets (state in <out-dir>/.state)")
+    pv.add_argument("--changes-dir", help="Changeset directory for --incremental (default: data/out/changes)")
+    pv.add_argument("--shards-dir", help="Read TTL shards (manifest.json) instead of --ttl (label reports only)")
+    pv.add_argument("--shard", action="append", help="Shard name to include (repeatable; default: all)")
+    pv.add_argument("--workers", type=int, default=1, help="Parallel shard workers (0 = one per CPU)")
+    pv.add_argument("--parquet", action="store_true", help="Also write each label report as <name>.parquet (needs pyarrow)")
+    pv.add_argument("--prefix-index", nargs="?", const=str(PREFIX_INDEX), metavar="DIR",
+                    help=f"Also write the memory-mappable autocomplete index (default dir: {PREFIX_INDEX})")
     pv.set_defaults(func=_cmd_validate)
 
     # graph
     pg = sub.add_parser("graph", help="Export Neo4j bulk-import CSVs from skills.ttl")
     pg.add_argument("--ttl", help=f"Path to skills.ttl (default: {_TTL_DEFAULT / 'skills.ttl'})")
     pg.add_argument("--out-dir", help=f"Graph CSV output dir (default: {GRAPH_OUT_DEFAULT})")
+    pg.add_argument("--shards-dir", help="Read TTL shards (manifest.json) instead of --ttl")
+    pg.add_argument("--shard", action="append", help="Shard name to include (repeatable; default: all)")
+    pg.add_argument("--workers", type=int, default=1, help="Parallel shard parse workers (0 = one per CPU)")
+    pg.add_argument("--parquet", action="store_true", help="Also write every node/rel table as <stem>.parquet (needs pyarrow)")
+    pg.add_argument("--admin-import", nargs="?", const=str(ADMIN_IMPORT_OUT), metavar="DIR",
+                    help=f"Write the neo4j-admin bulk-import layout instead (default: {ADMIN_IMPORT_OUT})")
+    pg.add_argument("--part-rows", type=int, default=DEFAULT_PART_ROWS, help="Rows per gzip part for --admin-import")
+    pg.add_argument("--database", default="neo4j", help="Default target database in import.sh")
     pg.set_defaults(func=_cmd_graph)
 
+    # run
+    pr = sub.add_parser("run", help="Run fetch → build → validate/graph, skipping stages whose inputs are unchanged")
+    pr.add_argument("--stages", nargs="+", choices=["fetch", "build", "validate", "graph"], help="Subset of stages to consider (default: all)")
+    pr.add_argument("--force", action="store_true", help="Ignore the stage cache and rerun everything selected")
+    pr.add_argument("--workers", type=int, default=1, help="Parallel merge workers for build (0 = one per CPU)")
+    pr.add_argument("--lang", default="en", help="Language filter for validate reports")
+    pr.add_argument("--cache-dir", help=f"Stage cache directory (default: {STAGE_CACHE})")
+    pr.set_defaults(func=_cmd_run)
+
+    # load
+    pl = sub.add_parser("load", help="Load graph CSVs into Neo4j with batched UNWIND (needs the neo4j driver)")
+    pl.add_argument("--graph-dir", help=f"Graph CSV directory (default: {GRAPH_OUT_DEFAULT})")
+    pl.add_argument("--uri", help="Bolt URI (default: $wgu_osmt_skills_builder_uri)")
+    pl.add_argument("--user", help="User (default: $wgu_osmt_skills_builder_user)")
+    pl.add_argument("--database", default=os.getenv("wgu_osmt_skills_builder_db"), help="Database (default: $wgu_osmt_skills_builder_db)")
+    pl.add_argument("--batch-size", type=int, default=DEFAULT_BATCH, help="Rows per UNWIND batch")
+    pl.add_argument("--workers", type=int, default=4, help="Concurrent tables (node labels / disjoint relationship types)")
+    pl.add_argument("--retries", type=int, default=5, help="Retries per batch on transient errors")
+    pl.add_argument("--no-constraints", action="store_true", help="Skip constraints.cypher")
+    pl.set_defaults(func=_cmd_load)
+
+    # graph-diff
+    pd = sub.add_parser("graph-diff", help="Write node upsert/delete and relationship add/remove CSVs between two graph exports")
+    pd.add_argument("--old", required=True, help="Previous graph export directory")
+    pd.add_argument("--new", help=f"Current graph export directory (default: {GRAPH_OUT_DEFAULT})")
+    pd.add_argument("--out", help=f"Delta output directory (default: {GRAPH_DELTA_OUT})")
+    pd.add_argument("--apply", action="store_true", help="Also apply the delta to Neo4j with the batched loader")
+    pd.add_argument("--uri", help="Bolt URI for --apply (default: $wgu_osmt_skills_builder_uri)")
+    pd.add_argument("--user", help="User for --apply (default: $wgu_osmt_skills_builder_user)")
+    pd.add_argument("--database", default=os.getenv("wgu_osmt_skills_builder_db"), help="Database for --apply")
+    pd.add_argument("--batch-size", type=int, default=DEFAULT_BATCH, help="Rows per UNWIND batch")
+    pd.add_argument("--workers", type=int, default=4, help="Concurrent tables")
+    pd.set_defaults(func=_cmd_graph_diff)
+
+    # stats
+    ps = sub.add_parser("stats", help="Graph counts and aggregates computed offline from the CSV export")
+    ps.add_argument("--graph-dir", help=f"Graph CSV export directory (default: {GRAPH_OUT_DEFAULT})")
+    ps.add_argument("--ttl", help="Compute from skills.ttl instead of the CSV export")
+    ps.add_argument("--out-dir", help=f"Aggregates + stats.json directory (default: {GRAPH_STATS_OUT})")
+    ps.set_defaults(func=_cmd_stats)
+
+    # csr
+    pc = sub.add_parser("csr", help="Compile the graph export into CSR adjacency arrays for in-process analytics")
+    pc.add_argument("--graph-dir", help=f"Graph CSV export directory (default: {GRAPH_OUT_DEFAULT})")
+    pc.add_argument("--ttl", help="Build from skills.ttl instead of the CSV export")
+    pc.add_argument("--out", help=f"Output .npz (default: {CSR_NPZ})")
+    pc.set_defaults(func=_cmd_csr)
+
+    # similar
+    pm = sub.add_parser("similar", help="Top-k similar RSDs from the precomputed similarity index")
+    pm.add_argument("rsd", nargs="*", help="RSD id(s) to look up")
+    pm.add_argument("-k", type=int, default=10, help="Neighbours per RSD (build and lookup)")
+    pm.add_argument("--build", action="store_true", help="(Re)build the index first (also when it is missing)")
+    pm.add_argument("--max-df", type=float, default=0.5, help="Drop features linked to more than this share of RSDs")
+    pm.add_argument("--index", help=f"Index path (default: {SIMILAR_INDEX})")
+    pm.add_argument("--csr", help=f"CSR .npz to build from (default: {CSR_NPZ}; compiled when missing)")
+    pm.add_argument("--graph-dir", help=f"Graph CSV export directory (default: {GRAPH_OUT_DEFAULT})")
+    pm.set_defaults(func=_cmd_similar)
+
+    # suggest
+    pu = sub.add_parser("suggest", help="Type-ahead suggestions from the memory-mapped prefix index")
+    pu.add_argument("prefix", nargs="*", help="Text typed so far")
+    pu.add_argument("-k", type=int, default=10, help="Suggestions to print")
+    pu.add_argument("--kind", action="append", choices=PREFIX_KINDS, help="Restrict to entity type(s) (repeatable)")
+    pu.add_argument("--index-dir", help=f"Prefix index directory (default: {PREFIX_INDEX})")
+    pu.add_argument("--build", action="store_true", help="(Re)build the index first (also when it is missing)")
+    pu.add_argument("--ttl", help="Build from skills.ttl instead of the graph CSV export")
+    pu.add_argument("--graph-dir", help=f"Graph CSV export directory (default: {GRAPH_OUT_DEFAULT})")
+    pu.set_defaults(func=_cmd_suggest)
+
+    # search
+    pt = sub.add_parser("search", help="Ranked RSD ids for a text query (BM25 over names, statements, keywords)")
+    pt.add_argument("query", nargs="*", help="Search text")
+    pt.add_argument("-k", type=int, default=10, help="Results to print")
+    pt.add_argument("--ttl", help=f"Path to skills.ttl (default: {_TTL_DEFAULT / 'skills.ttl'})")
+    pt.add_argument("--index-dir", help=f"Search index directory (default: {SEARCH_INDEX})")
+    pt.add_argument("--changes-dir", help=f"Changesets for incremental updates (default: {CHANGES})")
+    pt.add_argument("--update", action="store_true", help="Refresh the index first (changesets when possible, else full)")
+    pt.add_argument("--full", action="store_true", help="Force a full rebuild first")
+    pt.add_argument("--lang", help="Label language to index (default: the index's current one, else en; a change rebuilds)")
+    pt.set_defaults(func=_cmd_search)
+
+    # serve
+    pq = sub.add_parser("serve", help="Serve id/keyword/occupation/collection lookups over HTTP/JSON from the skills index")
+    pq.add_argument("--host", default=DEFAULT_HOST)
+    pq.add_argument("--port", type=int, default=DEFAULT_PORT)
+    pq.add_argument("--index", help=f"Skills index (default: {SKILLS_INDEX})")
+    pq.add_argument("--ttl", help=f"Source watched for new builds (default: {_TTL_DEFAULT / 'skills.ttl'})")
+    pq.add_argument("--graph-dir", help="Index from (and watch) this graph CSV export instead of skills.ttl")
+    pq.add_argument("--build", action="store_true", help="(Re)build the index before serving")
+    pq.add_argument("--cache-size", type=int, default=DEFAULT_CACHE, help="LRU entries of encoded responses (0 disables)")
+    pq.add_argument("--reload-interval", type=float, default=2.0, help="Seconds between hot-reload checks (0 disables)")
+    pq.set_defaults(func=_cmd_serve)
+
+    # bench
+    pn = sub.add_parser("bench", help="Benchmark build/validate/graph on synthetic corpora; exit 1 on regressions")
+    pn.add_argument("--sizes", type=int, nargs="+", default=list(BENCH_SIZES),
+                    help="Corpus sizes in skills (e.g. 1000 10000 100000)")
+    pn.add_argument("--seed", type=int, default=0)
+    pn.add_argument("--out-dir", help=f"Results + baselines (default: {BENCH})")
+    pn.add_argument("--work-dir", help="Keep generated corpora and step outputs here (default: temp dir)")
+    pn.add_argument("--save-baseline", action="store_true", help="Record this run as the baseline for its sizes")
+    pn.add_argument("--threshold", type=float, default=BENCH_THRESHOLD,
+                    help="Allowed slowdown / peak-memory growth per step (0.25 = 25%%)")
+    pn.set_defaults(func=_cmd_bench)
+
     return p
 
 
 def main() -> None:
     parser = _build_parser()
     args = parser.parse_args()
-    code = args.func(args)
+    if not (args.profile or args.cprofile):
+        raise SystemExit(args.func(args))
+
+    from wgu_osmt_builder.common.profile import Profiler
+
+    prof = Profiler(args.cmd, cprofile=args.cprofile)
+    try:
+        with prof:
+            code = args.func(args)
+    finally:
+        paths = prof.write(Path(args.profile_dir or PROFILE))
+        logger.info(f"⏱️ profile: {prof.summary()}")
+        logger.info(f"⏱️ profile → {', '.join(str(p) for p in paths.values())}")
     raise SystemExit(code)
 
 
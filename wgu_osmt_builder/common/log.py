@@ -1,6 +1,89 @@
 # wgu_osmt_builder/log.py
+"""
+Logging setup shared by every module.
+
+- Records are queued and formatted/written by one listener thread, so a hot
+  loop only pays for building the record (LOG_ASYNC=0 writes synchronously).
+- Per-item detail goes through log_item(): always emitted at DEBUG, dropped
+  at INFO unless sampled in (LOG_SAMPLE=N → 1 in N, LOG_ITEM_RATE=R → at most
+  R per second per logger).
+- Progress prints one aggregated INFO line every LOG_PROGRESS seconds
+  (default 5) instead of a line per item.
+"""
 import os
+import json
+import time
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
+
+_stream: logging.Handler | None = None
+_async: "_AsyncHandler | None" = None
+_listener: QueueListener | None = None
+_closed = False
+_samplers: dict[str, "ItemSampler"] = {}
+
+
+class _AsyncHandler(QueueHandler):
+    """Enqueue records; writes synchronously once the listener is gone (exit, forked workers)."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Same-process queue: no copy or pickling-safe formatting, just freeze the
+        # message so later changes to mutable args cannot leak into the output.
+        record.msg, record.args = record.getMessage(), None
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if _listener is None:
+            _stream.handle(record)
+        else:
+            super().emit(record)
+
+
+def _handler() -> logging.Handler:
+    global _stream, _async, _listener
+    if _stream is None:
+        _stream = logging.StreamHandler()
+        _stream.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    if os.getenv("LOG_ASYNC", "1") == "0":
+        return _stream
+    if _async is None:
+        _async = _AsyncHandler(queue.Queue())
+        if not _closed:
+            _listener = QueueListener(_async.queue, _stream)
+            _listener.start()
+            atexit.register(_stop)
+    return _async
+
+
+def _stop() -> None:
+    """Drain the queue and stop the listener thread (atexit)."""
+    global _listener, _closed
+    _closed = True
+    if _listener is not None:
+        listener, _listener = _listener, None
+        listener.stop()
+
+
+def _after_fork_in_child() -> None:
+    # The listener thread does not survive fork() and pool workers exit without
+    # running atexit, so children write synchronously.
+    global _listener, _closed
+    _closed, _listener = True, None
+    if _async is not None:
+        _async.queue = queue.Queue()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def flush_logs() -> None:
+    """Block until every queued record has been written."""
+    if _listener is not None:
+        _async.queue.join()
 
 
 def configure_logger(name: str) -> logging.Logger:
@@ -9,8 +92,125 @@ def configure_logger(name: str) -> logging.Logger:
         return logger
     level = logging.getLevelName((os.getenv("LOG_LEVEL") or "INFO").upper())
     logger.setLevel(level)
-    h = logging.StreamHandler()
-    h.setFormatter(logging.Formatter(
-        "%(asctime)s %(levelname)s %(name)s: %(message)s"))
-    logger.addHandler(h)
+    logger.addHandler(_handler())
     return logger
+
+
+# ---------------------------------------------------------------------------
+# per-item sampling
+# ---------------------------------------------------------------------------
+class ItemSampler:
+    """Let 1 in `every` items through, at most `per_second` of them (0 disables either rule)."""
+
+    def __init__(self, every: int = 0, per_second: float = 0.0, clock=time.monotonic) -> None:
+        self.every = every
+        self.per_second = per_second
+        self.clock = clock
+        self.seen = 0
+        self.dropped = 0
+        self._tokens = per_second
+        self._last = clock()
+
+    def take(self) -> bool:
+        if not self.every and not self.per_second:
+            return False
+        self.seen += 1
+        if self.every and self.seen % self.every:
+            return False
+        if self.per_second:
+            now = self.clock()
+            self._tokens = min(self.per_second, self._tokens + (now - self._last) * self.per_second)
+            self._last = now
+            if self._tokens < 1:
+                self.dropped += 1
+                return False
+            self._tokens -= 1
+        return True
+
+
+def configure_sampling(every: int | None = None, per_second: float | None = None) -> None:
+    """Reset per-logger samplers (defaults: LOG_SAMPLE / LOG_ITEM_RATE)."""
+    global _sampling
+    _sampling = (
+        int(os.getenv("LOG_SAMPLE") or 0) if every is None else every,
+        float(os.getenv("LOG_ITEM_RATE") or 0) if per_second is None else per_second,
+    )
+    _samplers.clear()
+
+
+_sampling: tuple[int, float] = (0, 0.0)
+configure_sampling()
+
+
+def log_item(logger: logging.Logger, msg, *args) -> None:
+    """
+    Per-item detail for hot loops: DEBUG when enabled, otherwise INFO only for
+    sampled items. Dict messages become the usual JSON record, serialised only
+    when the record is actually emitted.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        level = logging.DEBUG
+    elif logger.isEnabledFor(logging.INFO):
+        sampler = _samplers.get(logger.name)
+        if sampler is None:
+            sampler = _samplers[logger.name] = ItemSampler(*_sampling)
+        if not sampler.take():
+            return
+        level = logging.INFO
+    else:
+        return
+    if isinstance(msg, dict):
+        msg = json.dumps(msg)
+    logger.log(level, msg, *args)
+
+
+# ---------------------------------------------------------------------------
+# aggregated progress
+# ---------------------------------------------------------------------------
+class Progress:
+    """
+    Counts items in a loop and logs one INFO line per `interval` seconds
+    (rate, ETA when `total` is known, per-outcome counters), plus a summary
+    on close().
+    """
+
+    def __init__(self, logger: logging.Logger, label: str, total: int | None = None,
+                 interval: float | None = None, clock=time.monotonic) -> None:
+        self.logger = logger
+        self.label = label
+        self.total = total
+        self.interval = float(os.getenv("LOG_PROGRESS") or 5.0) if interval is None else interval
+        self.clock = clock
+        self.done = 0
+        self.counts: dict[str, int] = {}
+        self._start = self._last = clock()
+
+    def __enter__(self) -> "Progress":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def update(self, n: int = 1, outcome: str | None = None) -> None:
+        self.done += n
+        if outcome:
+            self.counts[outcome] = self.counts.get(outcome, 0) + n
+        now = self.clock()
+        if now - self._last >= self.interval:
+            self._last = now
+            self.logger.info(self._line(now, final=False))
+
+    def close(self) -> None:
+        self.logger.info(self._line(self.clock(), final=True))
+
+    def _line(self, now: float, final: bool) -> str:
+        elapsed = max(now - self._start, 1e-9)
+        rate = self.done / elapsed
+        counts = "".join(f" {k}={v:,}" for k, v in sorted(self.counts.items()))
+        if final:
+            return f"✅ {self.label}: {self.done:,} in {elapsed:.1f}s ({rate:,.0f}/s){counts}"
+        of = ""
+        if self.total:
+            eta = (self.total - self.done) / rate if rate else 0.0
+            of = f"/{self.total:,} ({100 * self.done / self.total:.1f}%) eta {eta:.0f}s"
+        return f"⏳ {self.label}: {self.done:,}{of} {rate:,.0f}/s{counts}"
@@ -0,0 +1,65 @@
+# wgu_osmt_builder/common/parquet_utils.py
+"""
+Optional columnar (Parquet) output. Needs pyarrow:  pip install pyarrow
+
+Every column is written as a dictionary-encoded string column (labels,
+statuses and relationship types repeat heavily), zstd-compressed, so a
+reader can load only the columns it needs.
+"""
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+pa = pq = None  # optional dependency, imported on first use (pyarrow alone costs ~100 ms)
+
+_col_re = re.compile(r"[^0-9a-zA-Z]+")
+
+
+def have_pyarrow() -> bool:
+    global pa, pq
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            return False
+        pa, pq = pyarrow, pyarrow.parquet
+    return True
+
+
+def require_pyarrow() -> None:
+    if not have_pyarrow():
+        raise RuntimeError("Parquet output needs pyarrow: pip install pyarrow (or the 'parquet' extra)")
+
+
+def column_name(header: str) -> str:
+    """Neo4j CSV header → plain column name (':ID' → 'id', 'created:datetime' → 'created')."""
+    name = header.lstrip(":").split(":", 1)[0]
+    return _col_re.sub("_", name).strip("_").lower()
+
+
+def write_parquet(path: Path, header: list[str], rows: list[list[str]], compression: str = "zstd") -> None:
+    require_pyarrow()
+    cols = list(zip(*rows)) if rows else [()] * len(header)
+    table = pa.table({
+        column_name(h): pa.array(col, type=pa.string()) for h, col in zip(header, cols)
+    })
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, str(path), compression=compression, use_dictionary=True)
+
+
+def write_labels_parquet(path: Path, labels: list[str]) -> int:
+    write_parquet(path, ["label"], [[lab] for lab in labels])
+    return len(labels)
+
+
+def reports_to_parquet(txt_paths: list[Path]) -> dict[str, int]:
+    """Mirror newline label reports as <name>.parquet next to each file."""
+    out: dict[str, int] = {}
+    for p in txt_paths:
+        if not p.exists():
+            continue
+        labels = p.read_text(encoding="utf-8").splitlines()
+        out[p.with_suffix(".parquet").name] = write_labels_parquet(p.with_suffix(".parquet"), labels)
+    return out
@@ -4,9 +4,26 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 DATA = ROOT / "data"
 RAW = DATA / "raw"
+QUARANTINE = DATA / "quarantine"
 CACHE = DATA / "cache"
 OUT = DATA / "out"
 TTL_OUT = OUT / "ttl"
 REPORTS = OUT / "reports"
 SOURCES = DATA / "sources"
 GRAPH = OUT / "graph"
+CHANGES = OUT / "changes"
+ANALYTICS = OUT / "analytics"
+INDEX = OUT / "index"
+
+# derived output locations (the CLI shows these without importing their modules)
+STAGE_CACHE = CACHE / "stages"
+GRAPH_STATS = OUT / "graph-stats"
+GRAPH_DELTA = OUT / "graph-delta"
+ADMIN_IMPORT = OUT / "admin-import"
+CSR_NPZ = ANALYTICS / "graph.npz"
+SIMILAR_INDEX = ANALYTICS / "similar.npz"
+SKILLS_INDEX = INDEX / "skills.json"
+SEARCH_INDEX = INDEX / "fulltext"
+PREFIX_INDEX = INDEX / "prefix"
+PROFILE = OUT / "profile"
+BENCH = OUT / "bench"
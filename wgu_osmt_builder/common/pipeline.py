@@ -0,0 +1,273 @@
+# wgu_osmt_builder/common/pipeline.py
+"""
+Stage-aware pipeline: fetch → build → (validate ∥ graph).
+
+Each stage declares input and output paths. Before a stage runs, its inputs
+(data plus the stage's own source code and the config keys it reads) are
+fingerprinted; if the fingerprint and the recorded outputs still match the
+last run under data/cache/stages, the stage is skipped.
+
+Outputs may be glob patterns (graph/nodes_*.csv), so files other commands
+write next to a stage's outputs do not invalidate it.
+
+Fingerprints are content hashes. A stat cache (size, mtime_ns → sha256)
+avoids re-reading unchanged files, so a no-op rerun only stats the tree.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import ROOT, SOURCES, RAW, TTL_OUT, REPORTS, GRAPH, STAGE_CACHE
+from wgu_osmt_builder.common.profile import span
+
+logger = configure_logger(__name__)
+
+REPORT_FILES = ("alignment-labels.txt", "bls-labels.txt", "keyword-labels.txt", "rsd-pref-labels.txt")
+
+
+# -------------------- fingerprints --------------------
+
+class FileHasher:
+    """sha256 per file, memoised on (size, mtime_ns) and persisted as JSON."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._dirty = False
+        try:
+            self._memo: dict[str, list] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._memo = {}
+
+    def file(self, p: Path, st: os.stat_result) -> str:
+        key = str(p)
+        hit = self._memo.get(key)
+        if hit and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+            return hit[2]
+        h = hashlib.sha256()
+        with p.open("rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        self._memo[key] = [st.st_size, st.st_mtime_ns, digest]
+        self._dirty = True
+        return digest
+
+    def tree(self, paths: list[Path]) -> str:
+        """One digest over every (non-hidden) file under the given paths."""
+        h = hashlib.sha256()
+        for root in paths:
+            h.update(f"\0{root}\0".encode("utf-8"))
+            for rel, p, st in _walk(root):
+                h.update(rel.encode("utf-8"))
+                h.update(self.file(p, st).encode("ascii"))
+        return h.hexdigest()
+
+    def save(self) -> None:
+        if self._dirty:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._memo), encoding="utf-8")
+            self._dirty = False
+
+
+def _walk(root: Path):
+    if any(c in root.name for c in "*?["):
+        for p in sorted(root.parent.glob(root.name)):
+            if p.is_file():
+                yield p.name, p, p.stat()
+        return
+    if root.is_file():
+        yield root.name, root, root.stat()
+        return
+    if not root.exists():
+        return
+    stack = [root]
+    found: list[tuple[str, Path, os.stat_result]] = []
+    while stack:
+        d = stack.pop()
+        with os.scandir(d) as it:
+            for e in it:
+                if e.name.startswith(".") or e.name == "__pycache__":
+                    continue
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(Path(e.path))
+                elif e.is_file(follow_symlinks=False):
+                    p = Path(e.path)
+                    found.append((str(p.relative_to(root)), p, e.stat()))
+    found.sort(key=lambda t: t[0])
+    yield from found
+
+
+# -------------------- stages --------------------
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    run: Callable[[dict], None]
+    inputs: tuple[Path, ...]
+    outputs: tuple[Path, ...]
+    deps: tuple[str, ...] = ()
+    code: tuple[Path, ...] = field(default=())
+    params: tuple[str, ...] = ()  # config keys that change the stage's output
+
+
+def _run_fetch(cfg: dict) -> None:
+    from wgu_osmt_builder.fetch.collections import process_directory
+    process_directory(cfg["sources"], cfg["raw"])
+
+
+def _run_build(cfg: dict) -> None:
+    from wgu_osmt_builder.build.assemble import process_directory
+    process_directory(cfg["raw"], cfg["ttl_out"], cfg["merged"], workers=cfg["workers"])
+
+
+def _run_validate(cfg: dict) -> None:
+    from wgu_osmt_builder.validate.alignments import extract_alignment_labels
+    from wgu_osmt_builder.validate.bls import extract_bls_pref_labels
+    from wgu_osmt_builder.validate.keywords import extract_keyword_labels
+    from wgu_osmt_builder.validate.rsd import extract_rsd_pref_labels
+    ttl, out, lang = cfg["merged"], cfg["reports"], cfg["lang"]
+    extract_alignment_labels(ttl, out / REPORT_FILES[0], lang=lang)
+    extract_bls_pref_labels(ttl, out / REPORT_FILES[1], lang=lang)
+    extract_keyword_labels(ttl, out / REPORT_FILES[2], lang=lang)
+    extract_rsd_pref_labels(ttl, out / REPORT_FILES[3], lang=lang)
+
+
+def _run_graph(cfg: dict) -> None:
+    from wgu_osmt_builder.graph.build.export import export_neo_csvs
+    export_neo_csvs(ttl_path=cfg["merged"], out_dir=cfg["graph"])
+
+
+def default_config(workers: int = 1, lang: str = "en") -> dict:
+    return {
+        "sources": SOURCES,
+        "raw": RAW,
+        "ttl_out": TTL_OUT,
+        "merged": TTL_OUT / "skills.ttl",
+        "reports": REPORTS,
+        "graph": GRAPH,
+        "workers": workers,
+        "lang": lang,
+    }
+
+
+def default_stages(cfg: dict) -> list[Stage]:
+    return [
+        Stage("fetch", _run_fetch, (cfg["sources"],), (cfg["raw"],),
+              code=(ROOT / "fetch",)),
+        Stage("build", _run_build, (cfg["raw"],), (cfg["merged"],), deps=("fetch",),
+              code=(ROOT / "build",)),  # workers only change how fast, not what
+        Stage("validate", _run_validate, (cfg["merged"],), tuple(cfg["reports"] / f for f in REPORT_FILES),
+              deps=("build",), code=(ROOT / "validate",), params=("lang",)),
+        Stage("graph", _run_graph, (cfg["merged"],), (cfg["graph"] / "nodes_*.csv", cfg["graph"] / "rels_*.csv"),
+              deps=("build",), code=(ROOT / "graph" / "build",)),  # export labels do not follow cfg["lang"]
+    ]
+
+
+# -------------------- runner --------------------
+
+def _levels(stages: list[Stage]) -> list[list[Stage]]:
+    """Group stages into dependency levels; stages in one level are independent."""
+    by_name = {s.name: s for s in stages}
+    depth: dict[str, int] = {}
+
+    def _depth(s: Stage, trail: tuple[str, ...] = ()) -> int:
+        if s.name in trail:
+            raise ValueError(f"Stage cycle: {' → '.join(trail + (s.name,))}")
+        if s.name not in depth:
+            parents = [by_name[d] for d in s.deps if d in by_name]
+            depth[s.name] = 1 + max((_depth(p, trail + (s.name,)) for p in parents), default=-1)
+        return depth[s.name]
+
+    for s in stages:
+        _depth(s)
+    out: list[list[Stage]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+    for s in stages:
+        out[depth[s.name]].append(s)
+    return out
+
+
+def _record_path(cache_dir: Path, name: str) -> Path:
+    return cache_dir / f"{name}.json"
+
+
+def _input_key(hasher: FileHasher, stage: Stage, cfg: dict) -> str:
+    h = hashlib.sha256()
+    h.update(hasher.tree(list(stage.inputs)).encode("ascii"))
+    h.update(hasher.tree(list(stage.code)).encode("ascii"))
+    params = {k: cfg.get(k) for k in stage.params}
+    h.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+def run_pipeline(
+    only: list[str] | None = None,
+    force: bool = False,
+    cfg: dict | None = None,
+    stages: list[Stage] | None = None,
+    cache_dir: Path = STAGE_CACHE,
+) -> dict[str, str]:
+    """
+    Run stages in dependency order, skipping those whose inputs are unchanged.
+    Returns {stage: "ran" | "cached"}.
+    """
+    cfg = cfg or default_config()
+    stages = stages or default_stages(cfg)
+    if only:
+        unknown = set(only) - {s.name for s in stages}
+        if unknown:
+            raise KeyError(f"Unknown stage(s): {', '.join(sorted(unknown))}")
+        stages = [s for s in stages if s.name in only]
+
+    hasher = FileHasher(cache_dir / "files.json")
+    status: dict[str, str] = {}
+
+    for level in _levels(stages):
+        todo: list[tuple[Stage, str]] = []
+        for stage in level:
+            key = _input_key(hasher, stage, cfg)
+            rec_path = _record_path(cache_dir, stage.name)
+            try:
+                rec = json.loads(rec_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                rec = {}
+            fresh = (
+                not force
+                and rec.get("inputs") == key
+                and rec.get("outputs") == hasher.tree(list(stage.outputs))
+            )
+            if fresh:
+                logger.info(f"⏭️ {stage.name}: inputs unchanged, cached")
+                status[stage.name] = "cached"
+            else:
+                todo.append((stage, key))
+
+        if len(todo) > 1:
+            with span("+".join(s.name for s, _ in todo)), ProcessPoolExecutor(max_workers=len(todo)) as pool:
+                futures = [(s, k, pool.submit(s.run, cfg)) for s, k in todo]
+                for s, k, fut in futures:
+                    fut.result()
+        else:
+            for s, k in todo:
+                logger.info(f"▶️ {s.name}")
+                with span(s.name):
+                    s.run(cfg)
+
+        for stage, key in todo:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _record_path(cache_dir, stage.name).write_text(json.dumps({
+                "inputs": key,
+                "outputs": hasher.tree(list(stage.outputs)),
+            }, indent=2), encoding="utf-8")
+            logger.info(f"✅ {stage.name}")
+            status[stage.name] = "ran"
+        hasher.save()
+
+    return status
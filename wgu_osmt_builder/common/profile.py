@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+common/profile.py
+Hierarchical timing spans (and optional cProfile capture) behind `cli --profile`.
+
+OUT: data/out/profile/<cmd>-<stamp>.json       span tree: calls, total and self seconds
+     data/out/profile/<cmd>-<stamp>.collapsed  "a;b;c <self µs>" lines for flamegraph.pl / speedscope
+     data/out/profile/<cmd>-<stamp>.pstats     cProfile dump (--cprofile)
+
+Code marks sub-steps with `with span("parse"): ...`. Without an active
+Profiler span() returns a shared no-op context manager, so instrumented
+loops cost one global lookup. Spans with the same path (one per file in a
+loop) are aggregated into a single node. Each thread keeps its own stack
+under the root; work done in pool processes is timed only as the span that
+waits for it.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Iterator
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import PROFILE
+
+logger = configure_logger(__name__)
+
+DEFAULT_DIR = PROFILE
+
+_active: Profiler | None = None
+_NOOP = nullcontext()
+
+
+def span(name: str):
+    """Time the enclosed block under the current span (no-op unless profiling)."""
+    p = _active
+    return _NOOP if p is None else p.span(name)
+
+
+class Profiler:
+    def __init__(self, root: str, cprofile: bool = False) -> None:
+        self.root = root
+        self.stats: dict[tuple[str, ...], list] = {}  # span path → [calls, total seconds]
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cprofile = None
+        if cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+
+    def __enter__(self) -> Profiler:
+        global _active
+        _active = self
+        self._t0 = time.perf_counter()
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        global _active
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self.stats[(self.root,)] = [1, time.perf_counter() - self._t0]
+        _active = None
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = [(self.root,)]
+        path = stack[-1] + (name,)
+        stack.append(path)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            dt = time.perf_counter() - t0
+            stack.pop()
+            with self._lock:
+                rec = self.stats.setdefault(path, [0, 0.0])
+                rec[0] += 1
+                rec[1] += dt
+
+    # ------------------------------------------------------------------ report
+    def _self_times(self) -> dict[tuple[str, ...], float]:
+        child_total: dict[tuple[str, ...], float] = {}
+        for path, (_, total) in self.stats.items():
+            if len(path) > 1:
+                child_total[path[:-1]] = child_total.get(path[:-1], 0.0) + total
+        # children running in parallel threads can add up to more than the parent
+        return {p: max(0.0, total - child_total.get(p, 0.0)) for p, (_, total) in self.stats.items()}
+
+    def tree(self) -> dict:
+        self_s = self._self_times()
+        nodes = {
+            path: {"name": path[-1], "calls": calls, "total_s": round(total, 6),
+                   "self_s": round(self_s[path], 6), "children": []}
+            for path, (calls, total) in self.stats.items()
+        }
+        for path in sorted(nodes, key=len, reverse=True):
+            if len(path) > 1:
+                parent = nodes.setdefault(path[:-1], {"name": path[-2], "calls": 0, "total_s": 0.0,
+                                                      "self_s": 0.0, "children": []})
+                parent["children"].append(nodes[path])
+        for node in nodes.values():
+            node["children"].sort(key=lambda n: -n["total_s"])
+        return nodes[(self.root,)]
+
+    def collapsed(self) -> list[str]:
+        """flamegraph.pl input: one "root;child;leaf <self microseconds>" line per span path."""
+        return [
+            f"{';'.join(path)} {round(s * 1e6)}"
+            for path, s in sorted(self._self_times().items()) if round(s * 1e6) > 0
+        ]
+
+    def write(self, out_dir: Path | None = None) -> dict[str, Path]:
+        out_dir = Path(out_dir or DEFAULT_DIR)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{self.root}-{time.strftime('%Y%m%d-%H%M%S')}"
+        paths = {"json": out_dir / f"{stem}.json", "collapsed": out_dir / f"{stem}.collapsed"}
+        paths["json"].write_text(json.dumps(self.tree(), indent=2), encoding="utf-8")
+        paths["collapsed"].write_text("\n".join(self.collapsed()) + "\n", encoding="utf-8")
+        if self._cprofile is not None:
+            paths["pstats"] = out_dir / f"{stem}.pstats"
+            self._cprofile.dump_stats(str(paths["pstats"]))
+        return paths
+
+    def summary(self, limit: int = 8) -> str:
+        """Slowest span paths by self time, for the log line after a profiled run."""
+        top = sorted(self._self_times().items(), key=lambda kv: -kv[1])[:limit]
+        return ", ".join(f"{'/'.join(p[1:]) or p[0]}={s:.3f}s" for p, s in top)
@@ -20,9 +20,9 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from wgu_osmt_builder.common.log import configure_logger
-from wgu_osmt_builder.common.ua import user_agents
+from wgu_osmt_builder.common.log import Progress, configure_logger, log_item
 from wgu_osmt_builder.common.config import PROXIES_PATH
+from wgu_osmt_builder.common.profile import span
 
 _OSMT_HOST = "https://osmt.wgu.edu"
 
@@ -140,6 +140,7 @@ class FetchWGUData:
         return None
 
     def _random_user_agent(self) -> str:
+        from wgu_osmt_builder.common.ua import user_agents  # large literal list, only needed once fetching
         return random.choice(user_agents)
 
     # ------------------------
@@ -183,11 +184,12 @@ class FetchWGUData:
         }
 
         label = proxy["http"].split("//")[1] if proxy else "direct"
-        logger.info(f"🌐 GET {url} via {label}")
+        log_item(logger, "🌐 GET %s via %s", url, label)
 
         try:
-            r = self.session.get(url, headers=headers,
-                                 proxies=proxy, timeout=(10, 60))
+            with span("http_get"):
+                r = self.session.get(url, headers=headers,
+                                     proxies=proxy, timeout=(10, 60))
         except requests.exceptions.RequestException as ex:
             logger.warning(f"💥 Request failed for {url}: {ex}")
             return None
@@ -202,7 +204,8 @@ class FetchWGUData:
                 f"ℹ️ Non-JSON Content-Type for {url}: '{ct}'. Attempting JSON decode anyway.")
 
         try:
-            return r.json()
+            with span("json_decode"):
+                return r.json()
         except Exception as ex:
             logger.warning(f"⚠️ JSON decode error for {url}: {ex}")
             return None
@@ -212,9 +215,10 @@ class FetchWGUData:
     # ------------------------
     def _save_json(self, skill_id: str, data: dict) -> None:
         out = self._outfile(skill_id)
-        out.write_text(json.dumps(data, ensure_ascii=False,
-                       indent=4), encoding="utf-8")
-        logger.info(f"📦 Saved {skill_id}.json")
+        with span("write"):
+            out.write_text(json.dumps(data, ensure_ascii=False,
+                           indent=4), encoding="utf-8")
+        log_item(logger, "📦 Saved %s.json", skill_id)
 
     # ------------------------
     # Runner
@@ -227,16 +231,21 @@ class FetchWGUData:
 
         random.shuffle(urls)
 
-        for url in urls:
-            skill_id = self._skill_id_from_url(url)
-            if self._exists(skill_id):
-                logger.info(f"🔁 Skip {skill_id}.json (already exists)")
-                continue
-
-            data = self._fetch_json(url, skill_id)
-            if data:
-                self._save_json(skill_id, data)
-            else:
-                logger.warning(f"🚫 No data for {url}")
-
-            time.sleep(self.pause_seconds)
+        with Progress(logger, "fetch", total=len(urls)) as progress:
+            for url in urls:
+                skill_id = self._skill_id_from_url(url)
+                if self._exists(skill_id):
+                    log_item(logger, "🔁 Skip %s.json (already exists)", skill_id)
+                    progress.update(outcome="skipped")
+                    continue
+
+                data = self._fetch_json(url, skill_id)
+                if data:
+                    self._save_json(skill_id, data)
+                    progress.update(outcome="saved")
+                else:
+                    logger.warning(f"🚫 No data for {url}")
+                    progress.update(outcome="failed")
+
+                with span("pause"):
+                    time.sleep(self.pause_seconds)
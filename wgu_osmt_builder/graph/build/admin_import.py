@@ -0,0 +1,189 @@
+# wgu_osmt_builder/graph/build/admin_import.py
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Export profile for offline `neo4j-admin database import full`.
+
+Same tables as export.py, laid out for the bulk importer:
+- one ID space per label:   id:ID(RSD), :START_ID(RSD), :END_ID(Keyword)
+- typed property headers:   prefLabel:string, created:datetime, ...
+- header in its own file:   <stem>.header.csv
+- data as gzip parts:       <stem>.part-0000.csv.gz, ... (read in parallel)
+- import.sh                 the full neo4j-admin command
+- manifest.json             labels, types, parts and row counts
+
+Labels match graph/load/load_nodes.cypher (RSD, Keyword, ...), so
+constraints.cypher and stats.py work on either load path.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+import os
+import shlex
+from pathlib import Path
+
+from rdflib import Graph
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import TTL_OUT, ADMIN_IMPORT
+from wgu_osmt_builder.graph.build.export import REL_FILES, graph_tables
+from wgu_osmt_builder.graph.build.schema import (
+    CLS_RSD, CLS_KEYWORD, CLS_CATEGORY, CLS_STANDARD, CLS_OCCUPATION, CLS_COLLECTION, CLS_ALIGNMENT,
+    REL_SPECS,
+)
+
+logger = configure_logger(__name__)
+
+DEFAULT_OUT = ADMIN_IMPORT
+DEFAULT_PART_ROWS = 500_000
+
+# class → (Neo4j label / ID space, node table stem)
+NODE_TABLES = {
+    CLS_RSD:        ("RSD",        "nodes_rsd"),
+    CLS_KEYWORD:    ("Keyword",    "nodes_keyword"),
+    CLS_CATEGORY:   ("Category",   "nodes_category"),
+    CLS_STANDARD:   ("Standard",   "nodes_standard"),
+    CLS_OCCUPATION: ("Occupation", "nodes_occupation"),
+    CLS_COLLECTION: ("Collection", "nodes_collection"),
+    CLS_ALIGNMENT:  ("Alignment",  "nodes_alignment"),
+}
+
+
+def _prop_header(h: str) -> str:
+    return h if ":" in h else f"{h}:string"
+
+
+def node_header(header: list[str], id_space: str) -> tuple[list[str], list[int]]:
+    """Admin header for a node table plus the source column indexes it keeps (drops :LABEL)."""
+    out: list[str] = []
+    keep: list[int] = []
+    for i, h in enumerate(header):
+        if h == ":LABEL":
+            continue
+        out.append(f"id:ID({id_space})" if h == ":ID" else _prop_header(h))
+        keep.append(i)
+    return out, keep
+
+
+def rel_header(src_space: str, dst_space: str) -> list[str]:
+    return [f":START_ID({src_space})", f":END_ID({dst_space})", ":TYPE"]
+
+
+def _write_parts(out_dir: Path, stem: str, header: list[str], rows, rows_per_part: int) -> list[str]:
+    """Header file + gzip data parts; returns file names, header first."""
+    head = f"{stem}.header.csv"
+    with (out_dir / head).open("w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerow(header)
+    files = [head]
+    part = None
+    n = 0
+    try:
+        for row in rows:
+            if part is None or n == rows_per_part:
+                if part is not None:
+                    part.close()
+                name = f"{stem}.part-{len(files) - 1:04d}.csv.gz"
+                files.append(name)
+                part = gzip.open(out_dir / name, "wt", encoding="utf-8", newline="")
+                w = csv.writer(part)
+                n = 0
+            w.writerow(row)
+            n += 1
+    finally:
+        if part is not None:
+            part.close()
+    return files
+
+
+def import_command(manifest: dict, database: str = "$DB") -> list[str]:
+    cmd = [
+        "neo4j-admin", "database", "import", "full",
+        "--overwrite-destination=true",
+        "--ignore-empty-strings=true",
+        "--skip-bad-relationships=true",
+        "--id-type=string",
+    ]
+    for n in manifest["nodes"]:
+        cmd.append(f"--nodes={n['label']}={','.join(n['files'])}")
+    for r in manifest["relationships"]:
+        cmd.append(f"--relationships={r['type']}={','.join(r['files'])}")
+    cmd.append(database)
+    return cmd
+
+
+def _write_script(path: Path, cmd: list[str], database: str) -> None:
+    args = " \\\n  ".join([" ".join(cmd[:4])] + [shlex.quote(c) for c in cmd[4:-1]])
+    path.write_text(
+        "#!/usr/bin/env bash\n"
+        "# import.sh — offline bulk load; the database must be stopped (or not exist yet)\n"
+        "set -euo pipefail\n"
+        'cd "$(dirname "${BASH_SOURCE[0]}")"\n'
+        f'DB="${{1:-{database}}}"\n'
+        f'{args} \\\n  "$DB"\n',
+        encoding="utf-8",
+    )
+    path.chmod(0o755)
+
+
+def export_admin_import(
+    ttl_path: Path | None = None,
+    out_dir: Path | None = None,
+    graph: Graph | None = None,
+    rows_per_part: int = DEFAULT_PART_ROWS,
+    database: str = "neo4j",
+) -> Path:
+    """
+    Write the neo4j-admin import layout; returns the manifest path.
+    Stale header/part files from a previous export are removed first.
+    """
+    dst = Path(out_dir or DEFAULT_OUT)
+    if graph is not None:
+        g = graph
+    else:
+        ttl = Path(ttl_path or (TTL_OUT / "skills.ttl"))
+        if not ttl.exists():
+            raise FileNotFoundError(f"TTL not found: {ttl}")
+        g = Graph()
+        g.parse(str(ttl), format="turtle")
+        logger.info(f"📦 parsed TTL: {ttl}")
+
+    dst.mkdir(parents=True, exist_ok=True)
+    for p in list(dst.glob("*.header.csv")) + list(dst.glob("*.part-*.csv.gz")):
+        p.unlink()
+
+    tables = graph_tables(g)
+    manifest: dict = {"nodes": [], "relationships": []}
+
+    for cls, (label, stem) in NODE_TABLES.items():
+        header, rows = tables[stem]
+        adm, keep = node_header(header, label)
+        files = _write_parts(dst, stem, adm, ([r[i] for i in keep] for r in rows), rows_per_part)
+        manifest["nodes"].append({"label": label, "id_space": label, "header": adm, "files": files, "rows": len(rows)})
+        logger.info(f"📝 {label}: {len(rows):,} rows in {len(files) - 1} part(s)")
+
+    for spec in REL_SPECS:
+        src_label = NODE_TABLES[spec.src_cls][0]
+        dst_label = NODE_TABLES[spec.dst_cls][0]
+        src_name = "Occupation" if spec.src_cls == CLS_OCCUPATION else "RichSkillDescriptor"
+        stem = REL_FILES[(src_name, spec.rel_type)].removesuffix(".csv")
+        _, rows = tables[stem]
+        adm = rel_header(src_label, dst_label)
+        files = _write_parts(dst, stem, adm, rows, rows_per_part)
+        manifest["relationships"].append({
+            "type": spec.rel_type, "start": src_label, "end": dst_label,
+            "header": adm, "files": files, "rows": len(rows),
+        })
+        logger.info(f"📝 {spec.rel_type}: {len(rows):,} rows in {len(files) - 1} part(s)")
+
+    manifest["database"] = database
+    manifest["command"] = import_command(manifest, database)
+    _write_script(dst / "import.sh", import_command(manifest), database)
+    tmp = dst / ".manifest.json.tmp"
+    tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp, dst / "manifest.json")
+    logger.info(f"✅ neo4j-admin import layout → {dst} (run {dst / 'import.sh'})")
+    return dst / "manifest.json"
@@ -0,0 +1,137 @@
+# wgu_osmt_builder/graph/build/diff.py
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Delta between two graph exports (export_neo_csvs output directories).
+
+Every export table is sorted by its key (:ID for nodes, START/END/TYPE for
+relationships), so each pair of tables is compared with one streaming
+sorted-merge; neither side is loaded into memory.
+
+Output (one directory):
+- <nodes stem>.upsert.csv  — new or changed node rows (full row, same header)
+- <nodes stem>.delete.csv  — :ID of nodes that disappeared
+- <rels stem>.add.csv      — relationships only in the new export
+- <rels stem>.remove.csv   — relationships only in the old export
+- summary.json             — counts per label / type
+
+graph/load/loader.py (Loader.apply_delta, `graph-diff --apply`) replays a
+delta as UNWIND batches: rel removes → node deletes → upserts → rel adds.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Iterator
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import GRAPH_DELTA
+from wgu_osmt_builder.graph.build.admin_import import NODE_TABLES
+from wgu_osmt_builder.graph.build.export import REL_FILES
+from wgu_osmt_builder.graph.build.schema import HDR_REL
+
+logger = configure_logger(__name__)
+
+DEFAULT_OUT = GRAPH_DELTA
+SUMMARY = "summary.json"
+
+
+def _read(path: Path, key_len: int) -> tuple[list[str], Iterator[list[str]]]:
+    """Header + rows of one table, asserting key order as it streams."""
+    if not path.exists():
+        return [], iter(())
+    f = path.open("r", encoding="utf-8", newline="")
+    reader = csv.reader(f)
+    header = next(reader, [])
+
+    def rows() -> Iterator[list[str]]:
+        prev: list[str] | None = None
+        with f:
+            for r in reader:
+                k = r[:key_len]
+                if prev is not None and k < prev:
+                    raise ValueError(f"{path} is not sorted by key at {k}; re-run the graph export")
+                prev = k
+                yield r
+    return header, rows()
+
+
+def merge_diff(old: Iterator[list[str]], new: Iterator[list[str]], key_len: int) -> Iterator[tuple[str, list[str]]]:
+    """
+    Sorted-merge two row streams on their first key_len columns.
+    Yields ("old", row) for keys only in old, ("new", row) for keys only in
+    new, and ("changed", new_row) for keys in both whose rows differ.
+    """
+    x, y = next(old, None), next(new, None)
+    while x is not None or y is not None:
+        if y is None or (x is not None and x[:key_len] < y[:key_len]):
+            yield "old", x
+            x = next(old, None)
+        elif x is None or y[:key_len] < x[:key_len]:
+            yield "new", y
+            y = next(new, None)
+        else:
+            if x != y:
+                yield "changed", y
+            x, y = next(old, None), next(new, None)
+
+
+def _writer(path: Path, header: list[str]):
+    f = path.open("w", encoding="utf-8", newline="")
+    w = csv.writer(f)
+    w.writerow(header)
+    return f, w
+
+
+def diff_exports(old_dir: Path, new_dir: Path, out_dir: Path = DEFAULT_OUT) -> dict:
+    """Write the delta from old_dir to new_dir into out_dir; returns the summary."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for p in out_dir.glob("*.csv"):
+        p.unlink()
+    summary: dict = {"old": str(old_dir), "new": str(new_dir), "nodes": {}, "relationships": {}}
+
+    for label, stem in NODE_TABLES.values():
+        old_header, old_rows = _read(old_dir / f"{stem}.csv", 1)
+        header, new_rows = _read(new_dir / f"{stem}.csv", 1)
+        header = header or old_header
+        if not header:
+            continue
+        fu, wu = _writer(out_dir / f"{stem}.upsert.csv", header)
+        fd, wd = _writer(out_dir / f"{stem}.delete.csv", [":ID"])
+        n_up = n_del = 0
+        with fu, fd:
+            for kind, row in merge_diff(old_rows, new_rows, 1):
+                if kind == "old":
+                    wd.writerow(row[:1])
+                    n_del += 1
+                else:
+                    wu.writerow(row)
+                    n_up += 1
+        summary["nodes"][label] = {"upsert": n_up, "delete": n_del}
+
+    for fname in REL_FILES.values():
+        stem = fname.removesuffix(".csv")
+        _, old_rows = _read(old_dir / fname, 3)
+        _, new_rows = _read(new_dir / fname, 3)
+        fa, wa = _writer(out_dir / f"{stem}.add.csv", HDR_REL)
+        fr, wr = _writer(out_dir / f"{stem}.remove.csv", HDR_REL)
+        n_add = n_rm = 0
+        with fa, fr:
+            for kind, row in merge_diff(old_rows, new_rows, 3):
+                if kind == "old":
+                    wr.writerow(row)
+                    n_rm += 1
+                else:
+                    wa.writerow(row)
+                    n_add += 1
+        summary["relationships"][stem] = {"add": n_add, "remove": n_rm}
+
+    (out_dir / SUMMARY).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    n_nodes = sum(v["upsert"] + v["delete"] for v in summary["nodes"].values())
+    n_rels = sum(v["add"] + v["remove"] for v in summary["relationships"].values())
+    logger.info(f"🔀 graph delta: {n_nodes:,} node change(s), {n_rels:,} relationship change(s) → {out_dir}")
+    return summary
+
@@ -11,7 +11,9 @@ from typing import Iterable
 from rdflib import Graph, URIRef, Literal
 
 from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.parquet_utils import require_pyarrow, write_parquet
 from wgu_osmt_builder.common.paths import TTL_OUT, GRAPH
+from wgu_osmt_builder.common.profile import span
 from wgu_osmt_builder.graph.build.schema import (
     # namespaces, classes, props
     RDF,
@@ -141,29 +143,22 @@ def _collect_alignment_nodes(g: Graph) -> list[list[str]]:
 
 # -------------------- Relationship extractors --------------------
 
+REL_FILES: dict[tuple[str, str], str] = {
+    ("RichSkillDescriptor", "HAS_KEYWORD"):    "rels_rsd_hasKeyword.csv",
+    ("RichSkillDescriptor", "HAS_CATEGORY"):   "rels_rsd_hasCategory.csv",
+    ("RichSkillDescriptor", "HAS_STANDARD"):   "rels_rsd_hasStandard.csv",
+    ("RichSkillDescriptor", "HAS_OCCUPATION"): "rels_rsd_hasOccupation.csv",
+    ("RichSkillDescriptor", "IN_COLLECTION"):  "rels_rsd_inCollection.csv",
+    ("RichSkillDescriptor", "HAS_ALIGNMENT"):  "rels_rsd_hasAlignment.csv",
+    ("Occupation",          "PART_OF"):        "rels_occupation_partOf.csv",
+}
+
+
 def _collect_relationships(g: Graph) -> dict[str, list[list[str]]]:
     """
     Returns map: filename → rows
     """
-    out: dict[str, list[list[str]]] = {
-        "rels_rsd_hasKeyword.csv": [],
-        "rels_rsd_hasCategory.csv": [],
-        "rels_rsd_hasStandard.csv": [],
-        "rels_rsd_hasOccupation.csv": [],
-        "rels_rsd_inCollection.csv": [],
-        "rels_rsd_hasAlignment.csv": [],
-        "rels_occupation_partOf.csv": [],
-    }
-
-    name_map = {
-        ("RichSkillDescriptor", "HAS_KEYWORD"):    "rels_rsd_hasKeyword.csv",
-        ("RichSkillDescriptor", "HAS_CATEGORY"):   "rels_rsd_hasCategory.csv",
-        ("RichSkillDescriptor", "HAS_STANDARD"):   "rels_rsd_hasStandard.csv",
-        ("RichSkillDescriptor", "HAS_OCCUPATION"): "rels_rsd_hasOccupation.csv",
-        ("RichSkillDescriptor", "IN_COLLECTION"):  "rels_rsd_inCollection.csv",
-        ("RichSkillDescriptor", "HAS_ALIGNMENT"):  "rels_rsd_hasAlignment.csv",
-        ("Occupation",          "PART_OF"):        "rels_occupation_partOf.csv",
-    }
+    out: dict[str, list[list[str]]] = {fname: [] for fname in REL_FILES.values()}
 
     for spec in REL_SPECS:
         # Correct pattern: predicate must be in the P-slot
@@ -178,7 +173,7 @@ def _collect_relationships(g: Graph) -> dict[str, list[list[str]]]:
             end = localname(o)
             key = ("Occupation", spec.rel_type) if spec.src_cls == CLS_OCCUPATION else (
                 "RichSkillDescriptor", spec.rel_type)
-            fname = name_map[key]
+            fname = REL_FILES[key]
             out[fname].append([start, end, spec.rel_type])
 
     # sort deterministically
@@ -189,38 +184,56 @@ def _collect_relationships(g: Graph) -> dict[str, list[list[str]]]:
 
 # -------------------- Public API --------------------
 
-def export_neo_csvs(ttl_path: Path | None = None, out_dir: Path | None = None) -> None:
+def graph_tables(g: Graph) -> dict[str, tuple[list[str], list[list[str]]]]:
+    """
+    All entity and relationship tables: file stem → (header, rows).
+    """
+    tables: dict[str, tuple[list[str], list[list[str]]]] = {
+        "nodes_rsd":        (HDR_RSD,        _collect_rsd_nodes(g)),
+        "nodes_keyword":    (HDR_KEYWORD,    _collect_keyword_nodes(g)),
+        "nodes_category":   (HDR_CATEGORY,   _collect_category_nodes(g)),
+        "nodes_standard":   (HDR_STANDARD,   _collect_standard_nodes(g)),
+        "nodes_occupation": (HDR_OCCUPATION, _collect_occupation_nodes(g)),
+        "nodes_collection": (HDR_COLLECTION, _collect_collection_nodes(g)),
+        "nodes_alignment":  (HDR_ALIGNMENT,  _collect_alignment_nodes(g)),
+    }
+    for fname, rows in _collect_relationships(g).items():
+        tables[fname.removesuffix(".csv")] = (HDR_REL, rows)
+    return tables
+
+
+def export_neo_csvs(
+    ttl_path: Path | None = None,
+    out_dir: Path | None = None,
+    graph: Graph | None = None,
+    parquet: bool = False,
+) -> None:
     """
-    Read skills.ttl and emit Neo4j bulk-import CSVs.
+    Read skills.ttl (or use an already loaded graph) and emit Neo4j bulk-import CSVs.
+    With parquet=True the same tables are also written as <stem>.parquet (needs pyarrow).
     """
-    ttl = Path(ttl_path or (TTL_OUT / "skills.ttl"))
+    if parquet:
+        require_pyarrow()
     dst = Path(out_dir or GRAPH)
-    if not ttl.exists():
-        raise FileNotFoundError(f"TTL not found: {ttl}")
-
-    g = Graph()
-    g.parse(str(ttl), format="turtle")
-    logger.info(f"📦 parsed TTL: {ttl}")
-
-    # nodes
-    _write_csv(dst / "nodes_rsd.csv",
-               HDR_RSD,        _collect_rsd_nodes(g))
-    _write_csv(dst / "nodes_keyword.csv",
-               HDR_KEYWORD,    _collect_keyword_nodes(g))
-    _write_csv(dst / "nodes_category.csv",
-               HDR_CATEGORY,   _collect_category_nodes(g))
-    _write_csv(dst / "nodes_standard.csv",
-               HDR_STANDARD,   _collect_standard_nodes(g))
-    _write_csv(dst / "nodes_occupation.csv",
-               HDR_OCCUPATION, _collect_occupation_nodes(g))
-    _write_csv(dst / "nodes_collection.csv",
-               HDR_COLLECTION, _collect_collection_nodes(g))
-    _write_csv(dst / "nodes_alignment.csv",
-               HDR_ALIGNMENT,  _collect_alignment_nodes(g))
-
-    # relationships
-    rels = _collect_relationships(g)
-    for fname, rows in rels.items():
-        _write_csv(dst / fname, HDR_REL, rows)
+    if graph is not None:
+        g = graph
+    else:
+        ttl = Path(ttl_path or (TTL_OUT / "skills.ttl"))
+        if not ttl.exists():
+            raise FileNotFoundError(f"TTL not found: {ttl}")
+
+        g = Graph()
+        with span("parse"):
+            g.parse(str(ttl), format="turtle")
+        logger.info(f"📦 parsed TTL: {ttl}")
+
+    with span("query"):
+        tables = graph_tables(g)
+    for stem, (header, rows) in tables.items():
+        with span("csv_write"):
+            _write_csv(dst / f"{stem}.csv", header, rows)
+        if parquet:
+            with span("parquet_write"):
+                write_parquet(dst / f"{stem}.parquet", header, rows)
 
     logger.info(f"✅ graph export complete → {dst}")
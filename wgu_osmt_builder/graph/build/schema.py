@@ -85,18 +85,20 @@ class RelSpec:
     src_cls: URIRef
     pred: URIRef
     rel_type: str
-    # target can be any node type in our model; we do not enforce dst class here
+    # class the target is expected to have (what load_rels.cypher MATCHes);
+    # the CSV export does not enforce it, integrity checks and ID spaces use it
+    dst_cls: URIRef | None = None
 
 
 REL_SPECS: list[RelSpec] = [
-    RelSpec(CLS_RSD, P_HAS_KEYWORD,    "HAS_KEYWORD"),
-    RelSpec(CLS_RSD, P_HAS_CATEGORY,   "HAS_CATEGORY"),
-    RelSpec(CLS_RSD, P_HAS_STANDARD,   "HAS_STANDARD"),
-    RelSpec(CLS_RSD, P_HAS_OCCUPATION, "HAS_OCCUPATION"),
-    RelSpec(CLS_RSD, P_IN_COLLECTION,  "IN_COLLECTION"),
-    RelSpec(CLS_RSD, P_HAS_ALIGNMENT,  "HAS_ALIGNMENT"),
+    RelSpec(CLS_RSD, P_HAS_KEYWORD,    "HAS_KEYWORD",    CLS_KEYWORD),
+    RelSpec(CLS_RSD, P_HAS_CATEGORY,   "HAS_CATEGORY",   CLS_CATEGORY),
+    RelSpec(CLS_RSD, P_HAS_STANDARD,   "HAS_STANDARD",   CLS_STANDARD),
+    RelSpec(CLS_RSD, P_HAS_OCCUPATION, "HAS_OCCUPATION", CLS_OCCUPATION),
+    RelSpec(CLS_RSD, P_IN_COLLECTION,  "IN_COLLECTION",  CLS_COLLECTION),
+    RelSpec(CLS_RSD, P_HAS_ALIGNMENT,  "HAS_ALIGNMENT",  CLS_ALIGNMENT),
     # occupation hierarchy
-    RelSpec(CLS_OCCUPATION, P_PART_OF, "PART_OF"),
+    RelSpec(CLS_OCCUPATION, P_PART_OF, "PART_OF",        CLS_OCCUPATION),
 ]
 
 __all__ = [
@@ -1,16 +1,51 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+"""
+graph/build/stats.py
+Graph statistics and materialized aggregates.
+
+Offline (default): one streaming pass over the graph CSV export (or the
+tables of skills.ttl) — no database, no JVM:
+- summary, nodes by label, relationships by type (dangling rows excluded,
+  matching what load_rels.cypher's MATCH keeps)
+- keyword_frequency.csv   keyword → number of skills
+- occupation_skills.csv   occupation → number of skills (direct links, and
+                          rolled up over the :partOf subtree)
+- collection_sizes.csv    collection → number of skills
+- degree_distribution.csv label, direction, degree → number of nodes
+- stats.json              all counts above
+
+Live (--live, used by neo_load.sh): the three count queries in a single
+session — the neo4j driver when installed, otherwise one cypher-shell call.
+Env is only read in live mode:
+  wgu_osmt_skills_builder_uri, wgu_osmt_skills_builder_user,
+  wgu_osmt_skills_builder_db, NEO_PW
+"""
+
 from __future__ import annotations
+
 import os
+import csv
+import json
+import argparse
 import subprocess
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Iterator
 
 from tabulate import tabulate
 
-URI  = os.environ["wgu_osmt_skills_builder_uri"]
-USER = os.environ["wgu_osmt_skills_builder_user"]
-DB   = os.environ["wgu_osmt_skills_builder_db"]
-PW   = os.environ["NEO_PW"]  # provided by neo_load.sh
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import GRAPH, GRAPH_STATS
+from wgu_osmt_builder.graph.build.admin_import import NODE_TABLES
+from wgu_osmt_builder.graph.build.export import REL_FILES
+from wgu_osmt_builder.graph.build.schema import CLS_OCCUPATION, REL_SPECS
+from wgu_osmt_builder.index.occupations import build_occupation_index
+
+logger = configure_logger(__name__)
+
+DEFAULT_OUT = GRAPH_STATS
 
 Q_SUMMARY = """
 MATCH (n) RETURN 'nodes' AS item, count(n) AS count
@@ -32,13 +67,167 @@ RETURN type(r) AS type, count(*) AS count
 ORDER BY type
 """
 
+# rel type → aggregate file, for the "skills per X" materializations
+AGGREGATES = {
+    "HAS_KEYWORD":    "keyword_frequency.csv",
+    "HAS_OCCUPATION": "occupation_skills.csv",
+    "IN_COLLECTION":  "collection_sizes.csv",
+}
+
+Table = tuple[list[str], Iterable[list[str]]]
+
+
+# -------------------- offline --------------------
+
+def _csv_rows(path: Path) -> Iterator[list[str]]:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        yield from reader
+
+
+def csv_tables(graph_dir: Path) -> dict[str, Table]:
+    """Lazy stem → (header, rows) view of a graph export directory."""
+    tables: dict[str, Table] = {}
+    for path in sorted(graph_dir.glob("*.csv")):
+        with path.open("r", encoding="utf-8", newline="") as f:
+            header = next(csv.reader(f), [])
+        tables[path.stem] = (header, _csv_rows(path))
+    return tables
+
+
+def load_tables(graph_dir: Path = GRAPH, ttl_path: Path | None = None) -> dict[str, Table]:
+    """Graph tables from skills.ttl when ttl_path is given, else from the CSV export in graph_dir."""
+    if ttl_path is not None:
+        from rdflib import Graph
+        from wgu_osmt_builder.graph.build.export import graph_tables
+
+        g = Graph()
+        g.parse(str(ttl_path), format="turtle")
+        return graph_tables(g)
+    if not graph_dir.exists():
+        raise FileNotFoundError(f"Graph export not found: {graph_dir}")
+    return csv_tables(graph_dir)
+
+
+def compute_stats(tables: dict[str, Table]) -> dict:
+    """
+    Node tables are read first (ids and display names per label), then each
+    relationship table once; everything else is derived from those counters.
+    """
+    names: dict[str, dict[str, str]] = {}
+    for label, stem in NODE_TABLES.values():
+        _, rows = tables.get(stem, ([], ()))
+        names[label] = {r[0]: (r[2] if len(r) > 2 else "") for r in rows}
+
+    out_deg: dict[str, Counter] = {label: Counter() for label in names}
+    in_deg: dict[str, Counter] = {label: Counter() for label in names}
+    rels: dict[str, int] = {}
+    dangling: dict[str, int] = {}
+    hierarchy: dict[str, list[tuple[str, str]]] = {"PART_OF": [], "HAS_OCCUPATION": []}
+    for spec in REL_SPECS:
+        src_name = "Occupation" if spec.src_cls == CLS_OCCUPATION else "RichSkillDescriptor"
+        stem = REL_FILES[(src_name, spec.rel_type)].removesuffix(".csv")
+        src, dst = NODE_TABLES[spec.src_cls][0], NODE_TABLES[spec.dst_cls][0]
+        src_ids, dst_ids = names[src], names[dst]
+        n = bad = 0
+        for r in tables.get(stem, ([], ()))[1]:
+            if r[0] in src_ids and r[1] in dst_ids:
+                out_deg[src][r[0]] += 1
+                in_deg[dst][r[1]] += 1
+                n += 1
+                if spec.rel_type in hierarchy:
+                    hierarchy[spec.rel_type].append((r[0], r[1]))
+            else:
+                bad += 1
+        rels[spec.rel_type] = rels.get(spec.rel_type, 0) + n
+        if bad:
+            dangling[spec.rel_type] = dangling.get(spec.rel_type, 0) + bad
+
+    nodes = {label: len(ids) for label, ids in names.items()}
+    degrees: list[list] = []
+    for label, ids in names.items():
+        for direction, deg in (("out", out_deg[label]), ("in", in_deg[label])):
+            hist = Counter(deg.get(i, 0) for i in ids)
+            degrees.extend([label, direction, d, c] for d, c in sorted(hist.items()))
+
+    aggregates: dict[str, list[list]] = {}
+    for spec in REL_SPECS:
+        fname = AGGREGATES.get(spec.rel_type)
+        if fname is None:
+            continue
+        dst = NODE_TABLES[spec.dst_cls][0]
+        counts = in_deg[dst]
+        rows = [[i, name, counts.get(i, 0)] for i, name in names[dst].items()]
+        rows.sort(key=lambda r: (-r[2], r[0]))
+        aggregates[fname] = rows
+    aggregates["degree_distribution.csv"] = degrees
+
+    # occupations also get their subtree roll-up (distinct skills under each code)
+    occ = build_occupation_index(names["Occupation"], hierarchy["PART_OF"], hierarchy["HAS_OCCUPATION"])
+    rolled = dict(zip(occ["ids"].tolist(), occ["rollup"].tolist()))
+    for row in aggregates.get("occupation_skills.csv", []):
+        row.append(rolled.get(row[0], 0))
+
+    return {
+        "summary": {"nodes": sum(nodes.values()), "relationships": sum(rels.values())},
+        "nodes": dict(sorted(nodes.items())),
+        "relationships": dict(sorted(rels.items())),
+        "dangling": dangling,
+        "aggregates": aggregates,
+    }
+
+
+_AGG_HEADERS = {
+    "keyword_frequency.csv":   ["id", "prefLabel", "skills"],
+    "occupation_skills.csv":   ["id", "prefLabel", "skills", "skills_rollup"],
+    "collection_sizes.csv":    ["id", "title", "skills"],
+    "degree_distribution.csv": ["label", "direction", "degree", "nodes"],
+}
+
+
+def write_stats(stats: dict, out_dir: Path = DEFAULT_OUT) -> Path:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for fname, rows in stats["aggregates"].items():
+        with (out_dir / fname).open("w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(_AGG_HEADERS[fname])
+            w.writerows(rows)
+    doc = {k: v for k, v in stats.items() if k != "aggregates"}
+    doc["aggregates"] = sorted(stats["aggregates"])
+    path = out_dir / "stats.json"
+    path.write_text(json.dumps(doc, indent=2), encoding="utf-8")
+    logger.info(f"📊 graph stats: {doc['summary']} → {out_dir}")
+    return path
+
+
+def offline_stats(graph_dir: Path = GRAPH, ttl_path: Path | None = None, out_dir: Path | None = DEFAULT_OUT) -> dict:
+    """Stats from the CSV export, or from skills.ttl when ttl_path is given."""
+    stats = compute_stats(load_tables(graph_dir, ttl_path))
+    if out_dir is not None:
+        write_stats(stats, out_dir)
+    return stats
+
+
+# -------------------- live --------------------
+
+def _env() -> tuple[str, str, str, str]:
+    return (
+        os.environ["wgu_osmt_skills_builder_uri"],
+        os.environ["wgu_osmt_skills_builder_user"],
+        os.environ["wgu_osmt_skills_builder_db"],
+        os.environ["NEO_PW"],  # provided by neo_load.sh
+    )
+
+
 def run_cypher(cypher: str) -> str:
+    uri, user, db, pw = _env()
     cmd = [
         "cypher-shell",
-        "-a", URI,
-        "-u", USER,
-        "-p", PW,
-        "-d", DB,
+        "-a", uri,
+        "-u", user,
+        "-p", pw,
+        "-d", db,
         "--format", "plain",
         "--wrap", "false",
         "--fail-fast",
@@ -49,6 +238,7 @@ def run_cypher(cypher: str) -> str:
         raise RuntimeError(f"cypher-shell failed: {proc.stderr.strip()}")
     return proc.stdout.strip()
 
+
 def parse_plain_pairs(text: str) -> list[tuple[str, str]]:
     lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
     if not lines:
@@ -64,11 +254,39 @@ def parse_plain_pairs(text: str) -> list[tuple[str, str]]:
         out.append((k.strip().strip('"'), v.strip()))
     return out
 
-def main() -> None:
-    summary = parse_plain_pairs(run_cypher(Q_SUMMARY))
-    nodes   = parse_plain_pairs(run_cypher(Q_NODES))
-    rels    = parse_plain_pairs(run_cypher(Q_RELS))
 
+def split_plain_results(text: str) -> list[str]:
+    """Split cypher-shell plain output of several statements at each header line."""
+    blocks: list[list[str]] = []
+    for ln in text.splitlines():
+        s = ln.strip()
+        if not s:
+            continue
+        if "," in s and not s.startswith('"') and not s.split(",", 1)[0].strip().isdigit():
+            blocks.append([])
+        if blocks:
+            blocks[-1].append(s)
+    return ["\n".join(b) for b in blocks]
+
+
+def live_stats(queries: list[str]) -> list[list[tuple[str, str]]]:
+    """All queries over one connection: a driver session, else one cypher-shell call."""
+    try:
+        from neo4j import GraphDatabase
+    except ImportError:  # optional dependency
+        GraphDatabase = None
+
+    if GraphDatabase is not None:
+        uri, user, db, pw = _env()
+        with GraphDatabase.driver(uri, auth=(user, pw)) as driver, driver.session(database=db) as session:
+            return [[(str(r[0]), str(r[1])) for r in session.run(q)] for q in queries]
+    text = run_cypher(";\n".join(q.strip() for q in queries) + ";")
+    return [parse_plain_pairs(b) for b in split_plain_results(text)]
+
+
+# -------------------- render --------------------
+
+def render(summary, nodes, rels) -> None:
     print("\n📊 Summary")
     print(tabulate(summary, headers=["item", "count"], tablefmt="github"))
 
@@ -78,5 +296,24 @@ def main() -> None:
     print("\n🔗 Relationships by type")
     print(tabulate(rels, headers=["type", "count"], tablefmt="github"))
 
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Graph statistics and aggregates (offline from the CSV export, or --live)")
+    ap.add_argument("--graph-dir", type=Path, default=GRAPH, help="Graph CSV export directory")
+    ap.add_argument("--ttl", type=Path, help="Compute from skills.ttl instead of the CSV export")
+    ap.add_argument("--out-dir", type=Path, default=DEFAULT_OUT, help="Where aggregates + stats.json are written")
+    ap.add_argument("--live", action="store_true", help="Query the loaded database instead (single session)")
+    args = ap.parse_args()
+
+    if args.live:
+        summary, nodes, rels = live_stats([Q_SUMMARY, Q_NODES, Q_RELS])
+    else:
+        stats = offline_stats(args.graph_dir, args.ttl, args.out_dir)
+        summary = list(stats["summary"].items())
+        nodes = list(stats["nodes"].items())
+        rels = list(stats["relationships"].items())
+    render(summary, nodes, rels)
+
+
 if __name__ == "__main__":
     main()
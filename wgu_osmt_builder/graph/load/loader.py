@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+graph/load/loader.py
+Batched UNWIND loader for the local graph export (data/out/graph/*.csv).
+
+Replaces the row-by-row LOAD CSV + MERGE scripts for incremental loads:
+- one parameterised statement per table, sent as `UNWIND $rows` batches
+- empty CSV cells are simply not sent (no FOREACH/CASE tricks)
+- node labels load concurrently (disjoint node sets, no shared locks)
+- relationship types load in waves; types in the same wave touch disjoint
+  endpoint labels, so concurrent batches never contend for the same nodes
+- transient failures (deadlock, leader switch, connection drop) are retried
+  with exponential backoff
+- apply_delta() replays a graph/build/diff.py delta (upserts, deletes,
+  relationship adds/removes) with the same batching
+
+The driver is injectable: anything with `.session(database=...)` returning a
+context manager whose `.run(query, **params)` result has `.consume()`.
+The official `neo4j` package is only needed for the default driver.
+
+Env (same as neo_load.sh / stats.py):
+  wgu_osmt_skills_builder_uri, wgu_osmt_skills_builder_user,
+  wgu_osmt_skills_builder_db, NEO_PW (prompted when unset)
+"""
+
+from __future__ import annotations
+
+import os
+import csv
+import time
+import getpass
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import GRAPH
+from wgu_osmt_builder.graph.build.admin_import import NODE_TABLES
+from wgu_osmt_builder.graph.build.export import REL_FILES
+from wgu_osmt_builder.graph.build.schema import CLS_OCCUPATION, REL_SPECS, RelSpec
+
+try:
+    from neo4j import GraphDatabase
+    from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
+    _TRANSIENT: tuple[type[BaseException], ...] = (ServiceUnavailable, SessionExpired, TransientError)
+except ImportError:  # optional dependency
+    GraphDatabase = None
+    _TRANSIENT = ()
+
+logger = configure_logger(__name__)
+
+CONSTRAINTS = Path(__file__).with_name("constraints.cypher")
+DEFAULT_BATCH = 5000
+_TRANSIENT_NAMES = {"TransientError", "ServiceUnavailable", "SessionExpired", "DeadlockDetected"}
+
+
+def is_transient(ex: BaseException) -> bool:
+    if _TRANSIENT and isinstance(ex, _TRANSIENT):
+        return True
+    retriable = getattr(ex, "is_retriable", None)
+    if callable(retriable) and retriable():
+        return True
+    return type(ex).__name__ in _TRANSIENT_NAMES
+
+
+# -------------------- statements --------------------
+
+def node_statement(label: str, header: list[str], replace: bool = False) -> str:
+    """
+    MERGE on id. By default empty cells keep the stored value; replace=True
+    (delta upserts) makes the row authoritative, so empty cells drop the property.
+    """
+    sets = []
+    for h in header:
+        if h.startswith(":"):
+            continue
+        name, _, typ = h.partition(":")
+        keep = "null" if replace else f"n.{name}"
+        if typ == "datetime":
+            sets.append(f"SET n.{name} = CASE WHEN row.{name} IS NULL THEN {keep} ELSE datetime(row.{name}) END")
+        elif replace:
+            sets.append(f"SET n.{name} = row.{name}")
+        else:
+            sets.append(f"SET n.{name} = coalesce(row.{name}, n.{name})")
+    return "\n".join(["UNWIND $rows AS row", f"MERGE (n:{label} {{id: row.id}})", *sets])
+
+
+def rel_statement(src: str, dst: str, rel_type: str) -> str:
+    return (
+        "UNWIND $rows AS row\n"
+        f"MATCH (s:{src} {{id: row.s}})\n"
+        f"MATCH (t:{dst} {{id: row.t}})\n"
+        f"MERGE (s)-[:{rel_type}]->(t)"
+    )
+
+
+def node_delete_statement(label: str) -> str:
+    return f"UNWIND $rows AS row\nMATCH (n:{label} {{id: row.id}})\nDETACH DELETE n"
+
+
+def rel_delete_statement(src: str, dst: str, rel_type: str) -> str:
+    return (
+        "UNWIND $rows AS row\n"
+        f"MATCH (s:{src} {{id: row.s}})-[r:{rel_type}]->(t:{dst} {{id: row.t}})\n"
+        "DELETE r"
+    )
+
+
+def node_rows(path: Path) -> tuple[list[str], Iterator[dict]]:
+    """Header and {id, prop: value} rows; empty cells are left out."""
+    f = path.open("r", encoding="utf-8", newline="")
+    reader = csv.reader(f)
+    header = next(reader, [])
+    cols = [(i, h.partition(":")[0]) for i, h in enumerate(header) if not h.startswith(":")]
+    id_col = header.index(":ID") if ":ID" in header else 0
+
+    def rows() -> Iterator[dict]:
+        with f:
+            for r in reader:
+                row = {"id": r[id_col]}
+                row.update({name: r[i] for i, name in cols if i < len(r) and r[i] != ""})
+                yield row
+    return header, rows()
+
+
+def rel_rows(path: Path) -> Iterator[dict]:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for r in reader:
+            yield {"s": r[0], "t": r[1]}
+
+
+def batches(rows, size: int) -> Iterator[list]:
+    batch: list = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def rel_waves(specs: list[RelSpec]) -> list[list[RelSpec]]:
+    """Greedy grouping: specs in one wave share no endpoint label."""
+    waves: list[tuple[set, list[RelSpec]]] = []
+    for spec in specs:
+        ends = {spec.src_cls, spec.dst_cls}
+        for used, wave in waves:
+            if not used & ends:
+                used |= ends
+                wave.append(spec)
+                break
+        else:
+            waves.append((set(ends), [spec]))
+    return [w for _, w in waves]
+
+
+def _rel_file(spec: RelSpec) -> str:
+    src_name = "Occupation" if spec.src_cls == CLS_OCCUPATION else "RichSkillDescriptor"
+    return REL_FILES[(src_name, spec.rel_type)]
+
+
+# -------------------- loader --------------------
+
+class Loader:
+    def __init__(
+        self,
+        driver,
+        database: str | None = None,
+        batch_size: int = DEFAULT_BATCH,
+        workers: int = 4,
+        retries: int = 5,
+        backoff: float = 0.5,
+    ) -> None:
+        self.driver = driver
+        self.database = database
+        self.batch_size = batch_size
+        self.workers = max(1, workers)
+        self.retries = retries
+        self.backoff = backoff
+
+    def run(self, query: str, **params) -> None:
+        """One auto-commit statement, retried on transient errors."""
+        attempt = 0
+        while True:
+            try:
+                with self.driver.session(database=self.database) as session:
+                    session.run(query, **params).consume()
+                return
+            except Exception as ex:
+                if attempt >= self.retries or not is_transient(ex):
+                    raise
+                delay = self.backoff * (2 ** attempt)
+                attempt += 1
+                logger.warning(f"⚠️ transient error ({type(ex).__name__}); retry {attempt}/{self.retries} in {delay:.1f}s")
+                time.sleep(delay)
+
+    def apply_constraints(self, path: Path = CONSTRAINTS) -> int:
+        text = "\n".join(ln for ln in path.read_text(encoding="utf-8").splitlines()
+                         if not ln.strip().startswith("//"))
+        stmts = [s.strip() for s in text.split(";") if s.strip()]
+        for s in stmts:
+            self.run(s)
+        logger.info(f"🧩 Applied {len(stmts)} constraint(s)")
+        return len(stmts)
+
+    def _load_table(self, name: str, query: str, rows) -> int:
+        n = 0
+        for batch in batches(rows, self.batch_size):
+            self.run(query, rows=batch)
+            n += len(batch)
+        logger.info(f"📥 {name}: {n:,} row(s)")
+        return n
+
+    def load_nodes(self, graph_dir: Path, suffix: str = ".csv", statement=node_statement) -> dict[str, int]:
+        """One concurrent job per label; statement(label, header) builds the query."""
+        jobs = []
+        for label, stem in NODE_TABLES.values():
+            path = graph_dir / f"{stem}{suffix}"
+            if not path.exists():
+                continue
+            header, rows = node_rows(path)
+            jobs.append((label, statement(label, header), rows))
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {label: pool.submit(self._load_table, label, q, rows) for label, q, rows in jobs}
+            return {label: f.result() for label, f in futures.items()}
+
+    def load_rels(
+        self,
+        graph_dir: Path,
+        specs: list[RelSpec] | None = None,
+        suffix: str = ".csv",
+        statement=rel_statement,
+    ) -> dict[str, int]:
+        out: dict[str, int] = {}
+        for wave in rel_waves(specs or REL_SPECS):
+            jobs = []
+            for spec in wave:
+                path = graph_dir / (_rel_file(spec).removesuffix(".csv") + suffix)
+                if not path.exists():
+                    continue
+                src, dst = NODE_TABLES[spec.src_cls][0], NODE_TABLES[spec.dst_cls][0]
+                jobs.append((spec.rel_type, statement(src, dst, spec.rel_type), rel_rows(path)))
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = {t: pool.submit(self._load_table, t, q, rows) for t, q, rows in jobs}
+                out.update({t: f.result() for t, f in futures.items()})
+        return out
+
+    def load(self, graph_dir: Path = GRAPH, constraints: bool = True) -> dict[str, dict[str, int]]:
+        t0 = time.perf_counter()
+        if constraints:
+            self.apply_constraints()
+        nodes = self.load_nodes(graph_dir)
+        rels = self.load_rels(graph_dir)
+        logger.info(f"✅ Loaded {sum(nodes.values()):,} node row(s), {sum(rels.values()):,} relationship row(s) "
+                    f"in {time.perf_counter() - t0:.1f}s")
+        return {"nodes": nodes, "relationships": rels}
+
+    def apply_delta(self, delta_dir: Path) -> dict[str, dict[str, int]]:
+        """
+        Replay a graph delta (graph/build/diff.py). Removed relationships go
+        first and added ones last, so every MATCH finds its endpoints.
+        """
+        t0 = time.perf_counter()
+        res = {
+            "rels_removed": self.load_rels(delta_dir, suffix=".remove.csv", statement=rel_delete_statement),
+            "nodes_deleted": self.load_nodes(delta_dir, suffix=".delete.csv",
+                                             statement=lambda label, _h: node_delete_statement(label)),
+            "nodes_upserted": self.load_nodes(delta_dir, suffix=".upsert.csv",
+                                              statement=lambda label, h: node_statement(label, h, replace=True)),
+            "rels_added": self.load_rels(delta_dir, suffix=".add.csv"),
+        }
+        logger.info(f"✅ Applied delta {delta_dir} in {time.perf_counter() - t0:.1f}s: "
+                    + ", ".join(f"{k}={sum(v.values()):,}" for k, v in res.items()))
+        return res
+
+
+def connect(uri: str | None = None, user: str | None = None, password: str | None = None):
+    if GraphDatabase is None:
+        raise RuntimeError("The Neo4j loader needs the neo4j driver: pip install neo4j")
+    uri = uri or os.environ["wgu_osmt_skills_builder_uri"]
+    user = user or os.environ["wgu_osmt_skills_builder_user"]
+    password = password or os.getenv("NEO_PW") or getpass.getpass(f"🔐  Neo4j password for {user}: ")
+    return GraphDatabase.driver(uri, auth=(user, password))
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Load the graph CSV export into Neo4j with batched UNWIND")
+    ap.add_argument("--graph-dir", type=Path, default=GRAPH)
+    ap.add_argument("--database", default=os.getenv("wgu_osmt_skills_builder_db"))
+    ap.add_argument("--batch-size", type=int, default=DEFAULT_BATCH)
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--no-constraints", action="store_true")
+    args = ap.parse_args()
+    with connect() as driver:
+        Loader(driver, database=args.database, batch_size=args.batch_size, workers=args.workers).load(
+            args.graph_dir, constraints=not args.no_constraints)
+
+
+if __name__ == "__main__":
+    _cli()
@@ -105,6 +105,6 @@ echo
 
 # ---------------- stats (Python pretty tables via tabulate) ----------------
 echo -e "${info}  Computing graph stats ..."
-eval "$PYTHON_CMD \"$STATS\""
+eval "$PYTHON_CMD \"$STATS\" --live"
 
 echo -e "\n${ok} All done"
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+index/fulltext.py
+On-disk inverted index with BM25 ranking over RSD skill names
+(skos:prefLabel), skill statements (skos:definition) and the prefLabels of
+linked keywords, so text search is a few postings reads instead of a SPARQL
+REGEX or grep over skills.ttl.
+
+Text is analysed like validate/keywords.clean_label (NFKC, lower-case,
+whitespace collapsed) and split on non-alphanumerics. Fields are weighted
+(name 2.0, keywords 1.5, statement 1.0) into one term frequency per
+document, which is what BM25 (k1=1.2, b=0.75) scores.
+
+Layout (one directory):
+- seg-NNNNNN.npz  immutable segment: ids, names, doc lengths, sorted terms,
+                  CSR postings (ptr, doc, tf)
+- manifest.json   live segments + tombstoned doc positions per segment, the
+                  build head and the skills.ttl signature it reflects
+- state.json      per-subject projection (types, labels, statements, keyword
+                  links) that documents are rebuilt from
+
+Refresh mirrors validate/incremental.py: when a chain of build changesets
+leads from the manifest head to the latest build, only the touched RSDs
+(and RSDs linked to relabelled keywords) are re-analysed into a new segment
+and their old postings are tombstoned; otherwise the index is rebuilt.
+Segments are compacted back into one when there are more than
+MAX_SEGMENTS or a quarter of the postings belong to deleted documents.
+Document frequencies and lengths are taken over live documents only, so
+scores do not depend on how the index is segmented.
+
+IN:  wgu_osmt_builder/data/out/ttl/skills.ttl, wgu_osmt_builder/data/out/changes
+OUT: wgu_osmt_builder/data/out/index/fulltext/
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import re
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph, Literal, URIRef
+
+from wgu_osmt_builder.build.changeset import SNAPSHOT_NAME, snapshot_head
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import CHANGES, TTL_OUT, SEARCH_INDEX
+from wgu_osmt_builder.graph.build.schema import CLS_RSD, P_DEFINITION, P_HAS_KEYWORD, P_PREF_LABEL, RDF, localname
+from wgu_osmt_builder.validate.incremental import changeset_chain, lang_matches
+from wgu_osmt_builder.validate.keywords import clean_label
+
+logger = configure_logger(__name__)
+
+DEFAULT_DIR = SEARCH_INDEX
+DEFAULT_TTL = TTL_OUT / "skills.ttl"
+MANIFEST = "manifest.json"
+STATE = "state.json"
+FORMAT = 1
+
+K1 = 1.2
+B = 0.75
+FIELD_WEIGHTS = {"name": 2.0, "keywords": 1.5, "statement": 1.0}
+MAX_SEGMENTS = 8
+MAX_DELETED = 0.25
+
+_token_re = re.compile(r"[^\W_]+")
+_PREDS = {RDF.type: "t", P_PREF_LABEL: "pref", P_DEFINITION: "def", P_HAS_KEYWORD: "kw"}
+_PRED_N3 = tuple(p.n3() for p in _PREDS)
+
+
+def tokenize(text: str) -> list[str]:
+    """clean_label normalisation, then alphanumeric runs; single letters are dropped."""
+    return [t for t in _token_re.findall(clean_label(text)) if len(t) > 1 or t.isdigit()]
+
+
+# -------------------- state --------------------
+
+def _record(s, p, o, lang: str = "en") -> tuple[str, str, str] | None:
+    slot = _PREDS.get(p)
+    if slot is None or not isinstance(s, URIRef):
+        return None
+    if slot == "t":
+        return (str(s), "t", "rsd") if o == CLS_RSD else None
+    if slot == "kw":
+        return (str(s), "kw", str(o)) if isinstance(o, URIRef) else None
+    if isinstance(o, Literal) and lang_matches(o, lang):
+        return str(s), slot, str(o)
+    return None
+
+
+def _add(state: dict, rec: tuple[str, str, str]) -> None:
+    s, slot, val = rec
+    vals = state.setdefault(s, {}).setdefault(slot, [])
+    if val not in vals:
+        vals.append(val)
+
+
+def _remove(state: dict, rec: tuple[str, str, str]) -> None:
+    s, slot, val = rec
+    entry = state.get(s)
+    if not entry or val not in entry.get(slot, ()):
+        return
+    entry[slot].remove(val)
+    if not entry[slot]:
+        del entry[slot]
+    if not entry:
+        del state[s]
+
+
+def build_state(g: Graph, lang: str = "en") -> dict[str, dict]:
+    state: dict[str, dict] = {}
+    for p in _PREDS:
+        for s, _, o in g.triples((None, p, None)):
+            rec = _record(s, p, o, lang)
+            if rec:
+                _add(state, rec)
+    return state
+
+
+def document(state: dict, iri: str) -> dict[str, str] | None:
+    """Field texts of one RSD, or None when iri is not (or no longer) an RSD."""
+    entry = state.get(iri)
+    if not entry or "t" not in entry:
+        return None
+    kw = [lab for k in sorted(entry.get("kw", ())) for lab in state.get(k, {}).get("pref", ())]
+    return {
+        "name": " ".join(sorted(entry.get("pref", ()))),
+        "statement": " ".join(sorted(entry.get("def", ()))),
+        "keywords": " ".join(kw),
+    }
+
+
+# -------------------- segments --------------------
+
+def build_segment(docs: dict[str, dict[str, str]]) -> dict[str, np.ndarray]:
+    """Segment arrays for {doc id: field texts}; postings sorted by (term, doc)."""
+    ids = sorted(docs)
+    dl = np.zeros(len(ids), dtype=np.float32)
+    postings: dict[str, list[tuple[int, float]]] = {}
+    for i, doc_id in enumerate(ids):
+        tf: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for t in tokenize(docs[doc_id].get(field, "")):
+                tf[t] += weight
+        dl[i] = sum(tf.values())
+        for t, w in tf.items():
+            postings.setdefault(t, []).append((i, w))
+    terms = sorted(postings)
+    ptr = np.zeros(len(terms) + 1, dtype=np.int64)
+    np.cumsum([len(postings[t]) for t in terms], out=ptr[1:])
+    flat = [p for t in terms for p in postings[t]]
+    return {
+        "ids": np.array(ids, dtype=str),
+        "names": np.array([docs[i].get("name", "") for i in ids], dtype=str),
+        "dl": dl,
+        "terms": np.array(terms, dtype=str),
+        "ptr": ptr,
+        "doc": np.array([d for d, _ in flat], dtype=np.int32),
+        "tf": np.array([w for _, w in flat], dtype=np.float32),
+    }
+
+
+def _load_segment(path: Path) -> dict[str, np.ndarray]:
+    with np.load(path, allow_pickle=False) as z:
+        return {k: z[k] for k in z.files}
+
+
+def _write_json(path: Path, obj: dict) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(obj, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class FullTextIndex:
+    """Read side: BM25 over the live documents of every segment."""
+
+    def __init__(self, manifest: dict, segments: list[dict[str, np.ndarray]]) -> None:
+        self.manifest = manifest
+        self.segments = segments
+        self.live: list[np.ndarray] = []
+        for meta, seg in zip(manifest["segments"], segments):
+            mask = np.ones(len(seg["ids"]), dtype=bool)
+            mask[np.asarray(meta["deleted"], dtype=np.int64)] = False
+            self.live.append(mask)
+        self.n_docs = int(sum(m.sum() for m in self.live))
+        total = sum(float(seg["dl"][m].sum()) for seg, m in zip(segments, self.live))
+        self.avgdl = total / self.n_docs if self.n_docs else 0.0
+
+    @classmethod
+    def load(cls, index_dir: Path = DEFAULT_DIR) -> "FullTextIndex":
+        manifest = json.loads((index_dir / MANIFEST).read_text(encoding="utf-8"))
+        return cls(manifest, [_load_segment(index_dir / m["name"]) for m in manifest["segments"]])
+
+    def _postings(self, term: str) -> list[tuple[int, np.ndarray, np.ndarray]]:
+        """(segment, live doc positions, tf) for one term across segments."""
+        out = []
+        for s, (seg, live) in enumerate(zip(self.segments, self.live)):
+            j = int(np.searchsorted(seg["terms"], term))
+            if j == len(seg["terms"]) or seg["terms"][j] != term:
+                continue
+            doc = seg["doc"][seg["ptr"][j]:seg["ptr"][j + 1]]
+            tf = seg["tf"][seg["ptr"][j]:seg["ptr"][j + 1]]
+            keep = live[doc]
+            if keep.any():
+                out.append((s, doc[keep], tf[keep]))
+        return out
+
+    def search(self, text: str, k: int = 10) -> list[tuple[str, float]]:
+        """Top-k (RSD id, BM25 score), best first; ties by id."""
+        if not self.n_docs:
+            return []
+        scores = [np.zeros(len(seg["ids"]), dtype=np.float64) for seg in self.segments]
+        for term in dict.fromkeys(tokenize(text)):
+            hits = self._postings(term)
+            df = sum(len(doc) for _, doc, _ in hits)
+            if not df:
+                continue
+            idf = math.log(1.0 + (self.n_docs - df + 0.5) / (df + 0.5))
+            for s, doc, tf in hits:
+                norm = K1 * (1.0 - B + B * self.segments[s]["dl"][doc] / self.avgdl)
+                scores[s][doc] += idf * tf * (K1 + 1.0) / (tf + norm)
+        nz = [np.flatnonzero(sc) for sc in scores]
+        seg_of = np.concatenate([np.full(len(d), s) for s, d in enumerate(nz)])
+        doc = np.concatenate(nz)
+        if not len(doc):
+            return []
+        vals = np.concatenate([sc[d] for sc, d in zip(scores, nz)])
+        top = np.argpartition(-vals, min(k, len(vals)) - 1)[:k] if len(vals) > k else np.arange(len(vals))
+        hits = [(str(self.segments[seg_of[i]]["ids"][doc[i]]), float(vals[i])) for i in top]
+        return sorted(hits, key=lambda h: (-h[1], h[0]))
+
+    def names(self) -> dict[str, str]:
+        out: dict[str, str] = {}
+        for seg, live in zip(self.segments, self.live):
+            out.update(zip(seg["ids"][live].tolist(), seg["names"][live].tolist()))
+        return out
+
+
+# -------------------- write side --------------------
+
+def _next_name(manifest: dict) -> str:
+    manifest["next"] = manifest.get("next", 0) + 1
+    return f"seg-{manifest['next']:06d}.npz"
+
+
+def _write_segment(index_dir: Path, manifest: dict, docs: dict[str, dict[str, str]]) -> None:
+    if not docs:
+        return
+    name = _next_name(manifest)
+    tmp = index_dir / f".{name}.tmp.npz"
+    np.savez(tmp, **build_segment(docs))
+    tmp.replace(index_dir / name)
+    manifest["segments"].append({"name": name, "docs": len(docs), "deleted": []})
+
+
+def _tombstone(index_dir: Path, manifest: dict, doc_ids: set[str]) -> None:
+    if not doc_ids:
+        return
+    wanted = np.array(sorted(doc_ids), dtype=str)
+    for meta in manifest["segments"]:
+        with np.load(index_dir / meta["name"], allow_pickle=False) as z:
+            ids = z["ids"]
+        pos = np.searchsorted(ids, wanted)
+        pos = pos[pos < len(ids)]
+        hit = pos[np.isin(ids[pos], wanted)]
+        meta["deleted"] = sorted(set(meta["deleted"]) | set(hit.tolist()))
+
+
+def _needs_compaction(manifest: dict) -> bool:
+    segs = manifest["segments"]
+    total = sum(m["docs"] for m in segs)
+    deleted = sum(len(m["deleted"]) for m in segs)
+    return len(segs) > MAX_SEGMENTS or (total and deleted / total > MAX_DELETED)
+
+
+def _rewrite(index_dir: Path, manifest: dict, state: dict) -> None:
+    """Replace every segment with one built from the state."""
+    old = [m["name"] for m in manifest["segments"]]
+    manifest["segments"] = []
+    docs = {localname(URIRef(iri)): d for iri in state if (d := document(state, iri)) is not None}
+    _write_segment(index_dir, manifest, docs)
+    manifest["compacted"] = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    _save(index_dir, manifest, state)
+    for name in old:
+        (index_dir / name).unlink(missing_ok=True)
+
+
+def _save(index_dir: Path, manifest: dict, state: dict) -> None:
+    # state first: a manifest never points past the state it was derived from
+    _write_json(index_dir / STATE, state)
+    _write_json(index_dir / MANIFEST, manifest)
+
+
+def _delta_records(path: Path, lang: str) -> list[tuple[str, str, str]]:
+    g = Graph()
+    if path.exists():
+        with path.open("r", encoding="utf-8") as f:
+            rows = [ln for ln in f if any(p in ln for p in _PRED_N3)]
+        if rows:
+            g.parse(data="".join(rows), format="nt")
+    return [rec for s, p, o in g if (rec := _record(s, p, o, lang))]
+
+
+def apply_changeset(state: dict, cs_dir: Path, lang: str = "en") -> set[str]:
+    """Apply one changeset to the state in place; returns the RSD IRIs whose document may have changed."""
+    touched: set[str] = set()
+    for added, name in ((False, "delete.nt"), (True, "add.nt")):
+        for rec in _delta_records(cs_dir / name, lang):
+            (_add if added else _remove)(state, rec)
+            touched.add(rec[0])
+    relabelled = {s for s in touched if "t" not in state.get(s, {})}
+    if relabelled:  # keywords (or removed RSDs): re-analyse the RSDs that link them
+        touched |= {iri for iri, e in state.items() if relabelled.intersection(e.get("kw", ()))}
+    return touched
+
+
+def _ttl_sig(ttl_path: Path) -> list[int]:
+    st = ttl_path.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _ttl_head(ttl_path: Path) -> str | None:
+    snap_dir = ttl_path.parent / ".snapshot"
+    snap = snap_dir / SNAPSHOT_NAME
+    if not snap.exists() or snap.stat().st_mtime_ns < ttl_path.stat().st_mtime_ns:
+        return None
+    return snapshot_head(snap_dir)
+
+
+def refresh_search_index(
+    ttl_path: Path = DEFAULT_TTL,
+    index_dir: Path = DEFAULT_DIR,
+    changes_dir: Path = CHANGES,
+    graph: Graph | None = None,
+    force_full: bool = False,
+    lang: str | None = None,
+) -> dict:
+    """
+    Bring the index up to date with skills.ttl. Labels are read in lang
+    (LANGMATCHES, untagged always kept); None keeps the index's current
+    language ("en" for a new index), and a different one forces a full rebuild.
+    Returns {"mode": "noop"|"incremental"|"full", "segments": n, "docs": n}.
+    """
+    index_dir.mkdir(parents=True, exist_ok=True)
+    sig = _ttl_sig(ttl_path)
+    try:
+        manifest = json.loads((index_dir / MANIFEST).read_text(encoding="utf-8"))
+        state = json.loads((index_dir / STATE).read_text(encoding="utf-8"))
+        if manifest.get("format") != FORMAT:
+            raise ValueError(manifest.get("format"))
+    except (OSError, ValueError):
+        manifest, state = None, None
+    if lang is None:
+        lang = (manifest or {}).get("lang", "en")
+
+    mode, dirs = "full", []
+    if manifest is not None and not force_full and manifest.get("lang") == lang:
+        if sig == manifest.get("ttl"):
+            mode = "noop"
+        else:
+            chain = changeset_chain(changes_dir, manifest.get("head"))
+            summary = chain[0][-1] / "summary.json" if chain and chain[0] else None
+            if summary is not None and summary.exists() and sig[1] <= summary.stat().st_mtime_ns:
+                dirs = chain[0]
+                mode = "incremental"
+
+    if mode == "noop":
+        pass
+    elif mode == "full":
+        if graph is None:
+            graph = Graph()
+            graph.parse(str(ttl_path), format="turtle")
+        old = manifest["segments"] if manifest else []
+        state = build_state(graph, lang)
+        manifest = {"format": FORMAT, "lang": lang, "next": (manifest or {}).get("next", 0), "segments": old}
+        manifest.update(head=_ttl_head(ttl_path), ttl=sig)
+        _rewrite(index_dir, manifest, state)
+        logger.info(f"🔎 Full search index rebuild: {manifest['segments'][0]['docs'] if manifest['segments'] else 0:,} document(s)")
+    else:
+        was_rsd = {iri for iri, e in state.items() if "t" in e}
+        touched: set[str] = set()
+        for d in dirs:
+            touched |= apply_changeset(state, d, lang)
+        doc_ids = {localname(URIRef(iri)): iri for iri in touched}
+        _tombstone(index_dir, manifest, set(doc_ids))
+        live = {i: d for i, iri in doc_ids.items() if (d := document(state, iri)) is not None}
+        _write_segment(index_dir, manifest, live)
+        manifest.update(head=json.loads((changes_dir / "latest.json").read_text(encoding="utf-8"))["head"], ttl=sig)
+        if _needs_compaction(manifest):
+            _rewrite(index_dir, manifest, state)
+        else:
+            _save(index_dir, manifest, state)
+        removed = sum(1 for i, iri in doc_ids.items() if iri in was_rsd and i not in live)
+        logger.info(f"🔎 Applied {len(dirs)} changeset(s) to the search index: {len(live):,} document(s) re-indexed, "
+                    f"{removed:,} removed, {len(manifest['segments'])} segment(s)")
+
+    docs = sum(m["docs"] - len(m["deleted"]) for m in manifest["segments"])
+    return {"mode": mode, "segments": len(manifest["segments"]), "docs": docs}
+
+
+# -------------------- bench / cli --------------------
+
+def synthetic_docs(n: int, seed: int = 0) -> dict[str, dict[str, str]]:
+    from wgu_osmt_builder.validate.keyword_dupes import synthetic_vocabulary
+
+    vocab = synthetic_vocabulary(max(n // 2, 100), seed)
+    rng = np.random.default_rng(seed)
+    zipf = 1.0 / np.arange(1, len(vocab) + 1)
+    zipf /= zipf.sum()
+    pick = lambda m: " ".join(vocab[j] for j in rng.choice(len(vocab), size=m, p=zipf))  # noqa: E731
+    return {f"rsd-{i:07d}": {"name": pick(2), "statement": pick(12), "keywords": pick(4)} for i in range(n)}
+
+
+def _bench(n: int, queries: int = 200) -> None:
+    docs = synthetic_docs(n)
+    t0 = time.perf_counter()
+    seg = build_segment(docs)
+    t1 = time.perf_counter()
+    index = FullTextIndex({"segments": [{"name": "bench", "docs": n, "deleted": []}]}, [seg])
+    rng = np.random.default_rng(1)
+    qs = [docs[f"rsd-{i:07d}"]["name"] for i in rng.integers(0, n, size=queries)]
+    lat = []
+    for q in qs:
+        q0 = time.perf_counter()
+        index.search(q, 10)
+        lat.append(time.perf_counter() - q0)
+    lat_ms = np.array(lat) * 1000
+    print(json.dumps({
+        "docs": n,
+        "terms": int(len(seg["terms"])),
+        "postings": int(len(seg["doc"])),
+        "build_s": round(t1 - t0, 3),
+        "query_ms_p50": round(float(np.percentile(lat_ms, 50)), 3),
+        "query_ms_p99": round(float(np.percentile(lat_ms, 99)), 3),
+    }, indent=2))
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="BM25 full-text search over RSD names, statements and keywords")
+    ap.add_argument("query", nargs="*", help="Search text")
+    ap.add_argument("-k", type=int, default=10)
+    ap.add_argument("--ttl", type=Path, default=DEFAULT_TTL)
+    ap.add_argument("--index-dir", type=Path, default=DEFAULT_DIR)
+    ap.add_argument("--changes-dir", type=Path, default=CHANGES)
+    ap.add_argument("--update", action="store_true", help="Refresh from skills.ttl / changesets first")
+    ap.add_argument("--full", action="store_true", help="Force a full rebuild")
+    ap.add_argument("--lang", help="Label language (default: the index's current one, else en)")
+    ap.add_argument("--bench", type=int, metavar="N", help="Synthetic build + query benchmark with N documents")
+    args = ap.parse_args()
+
+    if args.bench:
+        _bench(args.bench)
+        return
+    if args.update or args.full or not (args.index_dir / MANIFEST).exists():
+        print(json.dumps(refresh_search_index(args.ttl, args.index_dir, args.changes_dir,
+                                              force_full=args.full, lang=args.lang)))
+    if args.query:
+        index = FullTextIndex.load(args.index_dir)
+        names = index.names()
+        for rsd_id, score in index.search(" ".join(args.query), args.k):
+            print(f"{score:8.3f}  {rsd_id}  {names.get(rsd_id, '')}")
+
+
+if __name__ == "__main__":
+    _cli()
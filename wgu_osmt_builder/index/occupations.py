@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+index/occupations.py
+Precomputed closure of the BLS occupation hierarchy (:partOf) with
+rolled-up skill counts, so subtree questions never recurse at query time.
+
+- closure table:   (ancestor, descendant, distance) for every pair, self included
+- Euler intervals: preorder tin/tout over the tree reduction of :partOf
+                   (each node hangs under its deepest listed parent), so
+                   "a is an ancestor of d" is tin[a] <= tin[d] < tout[a]
+- skills:          RSD links sorted by the occupation's tin, so the skills
+                   under any occupation are one contiguous slice (bisect)
+- roll-ups:        distinct RSDs linked to each occupation, directly and
+                   anywhere in its subtree
+
+BLS records may list every ancestor as a parent, not only the direct one;
+the tree reduction handles both. If two listed parents are unrelated (a
+true DAG), intervals are not exact for that node and `tree` is False in
+the index; ancestors()/descendants() always read the closure table.
+
+IN:  wgu_osmt_builder/data/out/ttl/skills.ttl (or an already loaded graph)
+OUT: wgu_osmt_builder/data/out/index/occupations.npz
+     wgu_osmt_builder/data/out/index/occupation-closure.csv
+     wgu_osmt_builder/data/out/index/occupation-rollups.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+from rdflib import Graph, URIRef
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import INDEX, TTL_OUT
+from wgu_osmt_builder.graph.build.schema import (
+    RDF, CLS_OCCUPATION, CLS_RSD, P_HAS_OCCUPATION, P_PART_OF, localname,
+)
+
+logger = configure_logger(__name__)
+
+DEFAULT_DIR = INDEX
+NPZ_NAME = "occupations.npz"
+
+
+def occupation_key(code: str) -> str:
+    """'15-1252' or 'bls-15-1252' → the exported node id 'bls-15-1252'."""
+    return code if code.startswith("bls-") else f"bls-{code}"
+
+
+# -------------------- build --------------------
+
+def _ancestor_sets(ids: list[str], parents: dict[str, set[str]]) -> dict[str, set[str]]:
+    """Strict ancestors per node; cycles are broken at the first back edge."""
+    anc: dict[str, set[str]] = {}
+    for root in ids:
+        if root in anc:
+            continue
+        stack: list[tuple[str, list[str]]] = [(root, sorted(parents.get(root, ())))]
+        on_path = {root}
+        while stack:
+            node, todo = stack[-1]
+            while todo and (todo[-1] in anc or todo[-1] in on_path):  # done, or a back edge
+                todo.pop()
+            if todo:
+                nxt = todo.pop()
+                on_path.add(nxt)
+                stack.append((nxt, sorted(parents.get(nxt, ()))))
+                continue
+            acc: set[str] = set()
+            for p in parents.get(node, ()):
+                if p in anc:
+                    acc.add(p)
+                    acc |= anc[p]
+            anc[node] = acc
+            on_path.discard(node)
+            stack.pop()
+    return anc
+
+
+def build_occupation_index(
+    occupations: Iterable[str],
+    part_of: Iterable[tuple[str, str]],
+    skill_links: Iterable[tuple[str, str]],
+) -> dict[str, np.ndarray]:
+    """
+    Index arrays from occupation ids, (child, parent) :partOf pairs and
+    (rsd, occupation) :hasOccupation pairs. Pairs naming unknown
+    occupations are ignored.
+    """
+    ids = sorted(set(occupations))
+    known = set(ids)
+    parents: dict[str, set[str]] = {}
+    for child, parent in part_of:
+        if child in known and parent in known and child != parent:
+            parents.setdefault(child, set()).add(parent)
+    anc = _ancestor_sets(ids, parents)
+
+    # tree reduction: the deepest listed parent; a tree iff it covers every other parent
+    tree = True
+    tparent: dict[str, str | None] = {}
+    for node in ids:
+        ps = [p for p in parents.get(node, ()) if p in anc[node]]
+        if not ps:
+            tparent[node] = None
+            continue
+        best = max(ps, key=lambda p: (len(anc[p]), p))
+        tparent[node] = best
+        if any(p != best and p not in anc[best] for p in ps):
+            tree = False
+
+    children: dict[str | None, list[str]] = {}
+    for node in ids:
+        children.setdefault(tparent[node], []).append(node)
+
+    # preorder Euler intervals
+    pos = {node: i for i, node in enumerate(ids)}
+    n = len(ids)
+    tin = np.zeros(n, dtype=np.int32)
+    tout = np.zeros(n, dtype=np.int32)
+    depth = np.zeros(n, dtype=np.int32)
+    parent = np.full(n, -1, dtype=np.int32)
+    clock = 0
+    stack: list[tuple[str, int, bool]] = [(r, 0, False) for r in reversed(children.get(None, []))]
+    while stack:
+        node, d, done = stack.pop()
+        i = pos[node]
+        if done:
+            tout[i] = clock
+            continue
+        tin[i], depth[i] = clock, d
+        clock += 1
+        if tparent[node] is not None:
+            parent[i] = pos[tparent[node]]
+        stack.append((node, d, True))
+        for c in reversed(children.get(node, [])):
+            stack.append((c, d + 1, False))
+
+    # closure table (self rows at distance 0); distance measured on the tree reduction
+    anc_rows, desc_rows, dist_rows = [], [], []
+    for node in ids:
+        i = pos[node]
+        anc_rows.append(i)
+        desc_rows.append(i)
+        dist_rows.append(0)
+        for a in anc[node]:
+            anc_rows.append(pos[a])
+            desc_rows.append(i)
+            dist_rows.append(int(depth[i] - depth[pos[a]]))
+    c_anc = np.array(anc_rows, dtype=np.int32)
+    c_desc = np.array(desc_rows, dtype=np.int32)
+    c_dist = np.array(dist_rows, dtype=np.int32)
+    order = np.lexsort((c_desc, c_anc))
+    c_anc, c_desc, c_dist = c_anc[order], c_desc[order], c_dist[order]
+    c_ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(c_anc, minlength=n), out=c_ptr[1:])
+
+    # skill links, sorted by the linked occupation's tin
+    links = sorted({(r, o) for r, o in skill_links if o in known})
+    rsd_ids = np.array(sorted({r for r, _ in links}), dtype=str)
+    l_occ = np.array([pos[o] for _, o in links], dtype=np.int32)
+    l_rsd = np.searchsorted(rsd_ids, np.array([r for r, _ in links], dtype=str)).astype(np.int32)
+    order = np.argsort(tin[l_occ], kind="stable") if len(links) else np.zeros(0, dtype=np.int64)
+    l_occ, l_rsd = l_occ[order], l_rsd[order]
+
+    # roll-ups: distinct RSDs per occupation, direct and over the subtree (via the closure)
+    direct = np.zeros(n, dtype=np.int32)
+    rollup = np.zeros(n, dtype=np.int32)
+    if len(links):
+        direct = np.bincount(np.unique(l_occ.astype(np.int64) * len(rsd_ids) + l_rsd) // len(rsd_ids),
+                             minlength=n).astype(np.int32)
+        # every (rsd, linked occupation) pair expands to (rsd, each ancestor-or-self)
+        by_desc = np.argsort(c_desc, kind="stable")
+        d_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(c_desc, minlength=n), out=d_ptr[1:])
+        lens = d_ptr[l_occ + 1] - d_ptr[l_occ]
+        starts = np.repeat(d_ptr[l_occ] - np.cumsum(lens) + lens, lens) + np.arange(int(lens.sum()))
+        up = c_anc[by_desc][starts].astype(np.int64)
+        key = np.unique(up * len(rsd_ids) + np.repeat(l_rsd, lens))
+        rollup = np.bincount(key // len(rsd_ids), minlength=n).astype(np.int32)
+
+    return {
+        "ids": np.array(ids, dtype=str),
+        "tin": tin, "tout": tout, "depth": depth, "parent": parent,
+        "closure_anc": c_anc, "closure_desc": c_desc, "closure_dist": c_dist, "closure_ptr": c_ptr,
+        "rsd_ids": rsd_ids, "link_occ": l_occ, "link_rsd": l_rsd,
+        "direct": direct, "rollup": rollup,
+        "tree": np.array(tree),
+    }
+
+
+def graph_occupation_inputs(g: Graph) -> tuple[list[str], list[tuple[str, str]], list[tuple[str, str]]]:
+    occs = {s for s in g.subjects(RDF.type, CLS_OCCUPATION) if isinstance(s, URIRef)}
+    rsds = {s for s in g.subjects(RDF.type, CLS_RSD) if isinstance(s, URIRef)}
+    part_of = [(localname(s), localname(o)) for s, o in g.subject_objects(P_PART_OF)
+               if s in occs and isinstance(o, URIRef)]
+    links = [(localname(s), localname(o)) for s, o in g.subject_objects(P_HAS_OCCUPATION)
+             if s in rsds and isinstance(o, URIRef)]
+    return [localname(o) for o in occs], part_of, links
+
+
+def write_occupation_index(arrays: dict[str, np.ndarray], out_dir: Path = DEFAULT_DIR) -> Path:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / NPZ_NAME
+    tmp = out_dir / f".{NPZ_NAME}.tmp.npz"
+    np.savez(tmp, **arrays)
+    tmp.replace(path)
+
+    ids = arrays["ids"].tolist()
+    with (out_dir / "occupation-closure.csv").open("w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["ancestor", "descendant", "distance"])
+        w.writerows(zip((ids[i] for i in arrays["closure_anc"]), (ids[i] for i in arrays["closure_desc"]),
+                        arrays["closure_dist"].tolist()))
+    with (out_dir / "occupation-rollups.csv").open("w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["id", "parent", "depth", "skills_direct", "skills_rollup"])
+        for i, node in enumerate(ids):
+            p = int(arrays["parent"][i])
+            w.writerow([node, ids[p] if p >= 0 else "", int(arrays["depth"][i]),
+                        int(arrays["direct"][i]), int(arrays["rollup"][i])])
+    logger.info(json.dumps({
+        "occupation_index": str(path),
+        "occupations": len(ids),
+        "closure_rows": int(len(arrays["closure_anc"])),
+        "tree": bool(arrays["tree"]),
+    }))
+    return path
+
+
+def build_from_graph(g: Graph, out_dir: Path = DEFAULT_DIR) -> Path:
+    return write_occupation_index(build_occupation_index(*graph_occupation_inputs(g)), out_dir)
+
+
+# -------------------- query --------------------
+
+class OccupationIndex:
+    def __init__(self, arrays: dict[str, np.ndarray]) -> None:
+        self.a = arrays
+        self.ids: list[str] = arrays["ids"].tolist()
+        self.tree = bool(arrays["tree"])
+        self._pos = {node: i for i, node in enumerate(self.ids)}
+        self._link_tin = arrays["tin"][arrays["link_occ"]]
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_DIR / NPZ_NAME) -> "OccupationIndex":
+        with np.load(path, allow_pickle=False) as z:
+            return cls({k: z[k] for k in z.files})
+
+    def _i(self, code: str) -> int:
+        return self._pos[occupation_key(code)]
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        """O(1) on a tree (interval test); O(log n) closure lookup otherwise."""
+        a, d = self._i(ancestor), self._i(descendant)
+        if self.tree:
+            return bool(self.a["tin"][a] <= self.a["tin"][d] < self.a["tout"][a])
+        lo, hi = self.a["closure_ptr"][a], self.a["closure_ptr"][a + 1]
+        j = lo + np.searchsorted(self.a["closure_desc"][lo:hi], d)
+        return bool(j < hi and self.a["closure_desc"][j] == d)
+
+    def descendants(self, code: str, include_self: bool = False) -> list[str]:
+        i = self._i(code)
+        lo, hi = self.a["closure_ptr"][i], self.a["closure_ptr"][i + 1]
+        return [self.ids[j] for j in self.a["closure_desc"][lo:hi].tolist() if include_self or j != i]
+
+    def ancestors(self, code: str) -> list[str]:
+        """Nearest first."""
+        i = self._i(code)
+        sel = (self.a["closure_desc"] == i) & (self.a["closure_anc"] != i)
+        order = np.argsort(self.a["closure_dist"][sel], kind="stable")
+        return [self.ids[j] for j in self.a["closure_anc"][sel][order].tolist()]
+
+    def skills_under(self, code: str) -> list[str]:
+        """Distinct RSD ids linked anywhere in the subtree; one bisect on a tree."""
+        i = self._i(code)
+        if self.tree:
+            lo = np.searchsorted(self._link_tin, self.a["tin"][i], side="left")
+            hi = np.searchsorted(self._link_tin, self.a["tout"][i], side="left")
+            rsd = self.a["link_rsd"][lo:hi]
+        else:
+            desc = set(self.a["closure_desc"][self.a["closure_ptr"][i]:self.a["closure_ptr"][i + 1]].tolist())
+            rsd = self.a["link_rsd"][np.isin(self.a["link_occ"], list(desc))]
+        return self.a["rsd_ids"][np.unique(rsd)].tolist()
+
+    def rollup(self, code: str) -> tuple[int, int]:
+        """(direct, rolled-up) distinct skill counts."""
+        i = self._i(code)
+        return int(self.a["direct"][i]), int(self.a["rollup"][i])
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Build or query the occupation closure index")
+    ap.add_argument("code", nargs="?", help="Occupation code to query (e.g. 15-0000)")
+    ap.add_argument("--ttl", type=Path, default=TTL_OUT / "skills.ttl")
+    ap.add_argument("--out-dir", type=Path, default=DEFAULT_DIR)
+    ap.add_argument("--build", action="store_true", help="(Re)build from --ttl first")
+    args = ap.parse_args()
+
+    path = args.out_dir / NPZ_NAME
+    if args.build or not path.exists():
+        g = Graph()
+        g.parse(str(args.ttl), format="turtle")
+        build_from_graph(g, args.out_dir)
+    if args.code:
+        idx = OccupationIndex.load(path)
+        direct, rolled = idx.rollup(args.code)
+        print(json.dumps({
+            "id": occupation_key(args.code),
+            "ancestors": idx.ancestors(args.code),
+            "descendants": len(idx.descendants(args.code)),
+            "skills_direct": direct,
+            "skills_rollup": rolled,
+        }, indent=2))
+    else:
+        print(f"✅ occupation index → {path}")
+
+
+if __name__ == "__main__":
+    _cli()
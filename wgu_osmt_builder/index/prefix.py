@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+index/prefix.py
+Type-ahead over the preferred labels of RSDs, keywords, occupations and
+categories: a sorted array of normalised keys searched by bisection, with
+frequency ranking and entity type, stored as flat files that every process
+memory-maps (np.load(mmap_mode="r") / np.memmap), so N readers share one
+copy through the page cache.
+
+Keys are clean_label(label), plus one key per later word start, so "anal"
+finds "data analysis". Rank = 2 × frequency (+1 when the key is the label
+start); frequency is the number of relationships the entity takes part in
+(skills per keyword / category / occupation, collections per RSD).
+
+A prefix selects the key range [lo, hi): lo = first key ≥ prefix, hi =
+first key ≥ prefix + 0xFF (never a byte of UTF-8). Short prefixes have huge
+ranges, so every prefix whose range is wider than SCAN keys gets its top
+HOT_K entries precomputed at build time; narrower ranges are ranked with one
+argpartition over the mapped ranks.
+
+Files (one build directory, <out>/<manifest["build"]>/):
+- keys.bin / keys.off.npy      sorted UTF-8 keys, int64 offsets (n_keys + 1)
+- key_entry.npy / key_rank.npy entry index and rank per key
+- text.bin / text.off.npy      "label<TAB>id" per entry
+- entry_kind.npy               uint8 index into manifest["kinds"]
+- hot.bin / hot.off.npy / hot_top.npy   wide prefixes → top entries
+<out>/manifest.json names the current build plus counts, kinds, build time.
+Renaming it into place is the only switch-over, so a reader always maps ten
+files from one build.
+
+IN:  wgu_osmt_builder/data/out/ttl/skills.ttl (or the graph CSV export)
+OUT: wgu_osmt_builder/data/out/index/prefix/
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import GRAPH, TTL_OUT, PREFIX_INDEX
+from wgu_osmt_builder.graph.build.admin_import import NODE_TABLES
+from wgu_osmt_builder.graph.build.schema import CLS_CATEGORY, CLS_KEYWORD, CLS_OCCUPATION, CLS_RSD
+from wgu_osmt_builder.graph.build.stats import load_tables
+from wgu_osmt_builder.validate.keywords import clean_label
+
+logger = configure_logger(__name__)
+
+DEFAULT_DIR = PREFIX_INDEX
+MANIFEST = "manifest.json"
+FORMAT = 2  # 2: arrays live in a per-build subdirectory named by the manifest
+
+KINDS = {CLS_RSD: "skill", CLS_KEYWORD: "keyword", CLS_OCCUPATION: "occupation", CLS_CATEGORY: "category"}
+SCAN = 2048   # widest range ranked at query time
+HOT_K = 50    # entries kept per precomputed wide prefix
+
+
+# -------------------- build --------------------
+
+def _flat(strings: list[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    off = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum([len(s) for s in strings], out=off[1:])
+    return np.frombuffer(b"".join(strings), dtype=np.uint8), off
+
+
+def _top(rank: np.ndarray, entry: np.ndarray, lo: int, hi: int, k: int) -> list[int]:
+    """Best k distinct entries among keys [lo, hi), rank desc then key order."""
+    r = rank[lo:hi]
+    take = min(len(r), 2 * k)  # an entry can own several keys in a range
+    cand = np.argpartition(-r, take - 1)[:take] if len(r) > take else np.arange(len(r))
+    cand = cand[np.lexsort((cand, -r[cand]))]
+    out: list[int] = []
+    for e in entry[lo + cand].tolist():
+        if e not in out:
+            out.append(e)
+            if len(out) == k:
+                break
+    return out
+
+
+def build_prefix_index(tables: dict) -> dict:
+    """Index arrays from graph tables (stem → (header, rows)), e.g. csv_tables() or graph_tables()."""
+    degree: Counter = Counter()
+    for stem, (header, rows) in tables.items():
+        if stem.startswith("rels_"):
+            for r in rows:
+                degree[r[0]] += 1
+                degree[r[1]] += 1
+
+    kinds = list(KINDS.values())
+    texts: list[bytes] = []
+    entry_kind: list[int] = []
+    keys: list[tuple[bytes, int, int]] = []  # (key, entry, rank)
+    for cls, kind in KINDS.items():
+        _, rows = tables.get(NODE_TABLES[cls][1], ([], ()))
+        for r in rows:
+            label = r[2] if len(r) > 2 else ""
+            key = clean_label(label)
+            if not key:
+                continue
+            e = len(texts)
+            texts.append(f"{label}\t{r[0]}".encode("utf-8"))
+            entry_kind.append(kinds.index(kind))
+            freq = degree.get(r[0], 0)
+            keys.append((key.encode("utf-8"), e, 2 * freq + 1))
+            words = key.split(" ")
+            for i in range(1, len(words)):
+                keys.append((" ".join(words[i:]).encode("utf-8"), e, 2 * freq))
+    keys.sort()
+
+    key_bin, key_off = _flat([k for k, _, _ in keys])
+    text_bin, text_off = _flat(texts)
+    key_entry = np.array([e for _, e, _ in keys], dtype=np.int32)
+    key_rank = np.array([r for _, _, r in keys], dtype=np.int64)
+
+    # wide prefixes: walk prefix lengths; ranges at one length are disjoint, so this is O(n · depth)
+    hot: list[bytes] = []
+    hot_top: list[list[int]] = []
+    raw = [k for k, _, _ in keys]
+    frontier = [(b"", 0, len(raw))]
+    while frontier:
+        nxt = []
+        for prefix, lo, hi in frontier:
+            if hi - lo <= SCAN:
+                continue
+            if prefix:
+                hot.append(prefix)
+                hot_top.append(_top(key_rank, key_entry, lo, hi, HOT_K))
+            depth = len(prefix)
+            i = lo
+            while i < hi:
+                if len(raw[i]) <= depth:
+                    i += 1
+                    continue
+                p = raw[i][:depth + 1]
+                j = i
+                while j < hi and raw[j][:depth + 1] == p:
+                    j += 1
+                nxt.append((p, i, j))
+                i = j
+        frontier = nxt
+    order = sorted(range(len(hot)), key=lambda i: hot[i])
+    hot_bin, hot_off = _flat([hot[i] for i in order])
+    top = np.full((len(hot), HOT_K), -1, dtype=np.int32)
+    for row, i in enumerate(order):
+        top[row, :len(hot_top[i])] = hot_top[i]
+
+    return {
+        "keys.bin": key_bin, "keys.off.npy": key_off,
+        "key_entry.npy": key_entry, "key_rank.npy": key_rank,
+        "text.bin": text_bin, "text.off.npy": text_off,
+        "entry_kind.npy": np.array(entry_kind, dtype=np.uint8),
+        "hot.bin": hot_bin, "hot.off.npy": hot_off, "hot_top.npy": top,
+        MANIFEST: {
+            "format": FORMAT, "built": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "kinds": kinds,
+            "entries": len(texts), "keys": len(keys), "hot": len(hot),
+        },
+    }
+
+
+def write_prefix_index(files: dict, out_dir: Path = DEFAULT_DIR) -> Path:
+    """
+    Write the arrays into a fresh build directory, then rename the manifest
+    that points at it into place. Readers that mapped an older build keep
+    those inodes; builds older than the one just replaced are removed.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    build = f"build-{time.time_ns()}"
+    build_dir = out_dir / f".{build}.tmp"
+    build_dir.mkdir()
+    for name, arr in files.items():
+        if name == MANIFEST:
+            continue
+        if name.endswith(".npy"):
+            with (build_dir / name).open("wb") as f:
+                np.save(f, arr)
+        else:
+            (build_dir / name).write_bytes(arr.tobytes())
+    build_dir.rename(out_dir / build)
+
+    try:
+        previous = json.loads((out_dir / MANIFEST).read_text(encoding="utf-8")).get("build")
+    except (OSError, ValueError):
+        previous = None
+    files[MANIFEST]["build"] = build
+    tmp = out_dir / f".{MANIFEST}.tmp"
+    tmp.write_text(json.dumps(files[MANIFEST], indent=2), encoding="utf-8")
+    tmp.replace(out_dir / MANIFEST)
+
+    for old in out_dir.glob("build-*"):
+        if old.name not in (build, previous):
+            shutil.rmtree(old, ignore_errors=True)
+    logger.info(json.dumps({"prefix_index": str(out_dir), **{k: files[MANIFEST][k] for k in ("entries", "keys", "hot")}}))
+    return out_dir
+
+
+def build_from_source(ttl_path: Path | None = None, graph_dir: Path = GRAPH, out_dir: Path = DEFAULT_DIR) -> dict:
+    """Build from skills.ttl when ttl_path is given, else from the graph CSV export; returns the manifest."""
+    files = build_prefix_index(load_tables(graph_dir, ttl_path))
+    write_prefix_index(files, out_dir)
+    return files[MANIFEST]
+
+
+# -------------------- query --------------------
+
+class PrefixIndex:
+    """Read-only, memory-mapped view of a prefix index directory."""
+
+    def __init__(self, index_dir: Path = DEFAULT_DIR) -> None:
+        self.manifest = json.loads((index_dir / MANIFEST).read_text(encoding="utf-8"))
+        if self.manifest.get("format") != FORMAT:
+            raise ValueError(f"Unsupported prefix index format: {self.manifest.get('format')!r}")
+        self.kinds: list[str] = self.manifest["kinds"]
+        index_dir = index_dir / self.manifest["build"]  # every file below comes from this one build
+
+        def npy(name: str) -> np.ndarray:
+            return np.load(index_dir / name, mmap_mode="r")
+
+        def blob(name: str) -> memoryview:
+            path = index_dir / name
+            return memoryview(np.memmap(path, dtype=np.uint8, mode="r")) if path.stat().st_size else memoryview(b"")
+
+        self._keys, self._key_off = blob("keys.bin"), npy("keys.off.npy")
+        self._text, self._text_off = blob("text.bin"), npy("text.off.npy")
+        self._hot, self._hot_off = blob("hot.bin"), npy("hot.off.npy")
+        self.key_entry, self.key_rank = npy("key_entry.npy"), npy("key_rank.npy")
+        self.entry_kind, self.hot_top = npy("entry_kind.npy"), npy("hot_top.npy")
+
+    @staticmethod
+    def _bisect(blob: memoryview, off: np.ndarray, target: bytes) -> int:
+        lo, hi = 0, len(off) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if bytes(blob[off[mid]:off[mid + 1]]) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _range(self, prefix: bytes) -> tuple[int, int]:
+        return (self._bisect(self._keys, self._key_off, prefix),
+                self._bisect(self._keys, self._key_off, prefix + b"\xff"))
+
+    def entry(self, e: int) -> dict:
+        label, _, node_id = bytes(self._text[self._text_off[e]:self._text_off[e + 1]]).decode("utf-8").partition("\t")
+        return {"label": label, "id": node_id, "kind": self.kinds[self.entry_kind[e]]}
+
+    def suggest(self, prefix: str, k: int = 10, kinds: list[str] | None = None) -> list[dict]:
+        """Top-k entries whose label (or a later word of it) starts with prefix."""
+        key = clean_label(prefix).encode("utf-8")
+        if not key:
+            return []
+        want = None if kinds is None else {self.kinds.index(x) for x in kinds}
+        lo, hi = self._range(key)
+        if hi - lo > SCAN:
+            h = self._bisect(self._hot, self._hot_off, key)
+            if h < len(self._hot_off) - 1 and bytes(self._hot[self._hot_off[h]:self._hot_off[h + 1]]) == key:
+                top = [e for e in self.hot_top[h].tolist() if e >= 0]
+                if want is not None:
+                    top = [e for e in top if self.entry_kind[e] in want]
+                if len(top) >= k or want is None:
+                    return [self.entry(e) for e in top[:k]]
+        if want is None:
+            return [self.entry(e) for e in _top(self.key_rank, self.key_entry, lo, hi, k)]
+        entries = np.asarray(self.key_entry[lo:hi])
+        keep = np.flatnonzero(np.isin(self.entry_kind[entries], list(want)))
+        if not len(keep):
+            return []
+        rank = np.asarray(self.key_rank[lo:hi])[keep]
+        return [self.entry(e) for e in _top(rank, entries[keep], 0, len(keep), k)]
+
+
+def _bench(n: int, queries: int = 2000) -> None:
+    from wgu_osmt_builder.validate.keyword_dupes import synthetic_vocabulary
+
+    vocab = synthetic_vocabulary(n)
+    rng = np.random.default_rng(0)
+    tables = {
+        "nodes_keyword": ([], [[f"kw-{i}", "Keyword", lab] for i, lab in enumerate(vocab)]),
+        "rels_rsd_hasKeyword": ([], [[f"rsd-{j}", f"kw-{i}", "HAS_KEYWORD"]
+                                     for j, i in enumerate(rng.zipf(1.3, size=4 * n) % n)]),
+    }
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as d:
+        t0 = time.perf_counter()
+        files = build_prefix_index(tables)
+        write_prefix_index(files, Path(d))
+        t1 = time.perf_counter()
+        index = PrefixIndex(Path(d))
+        prefixes = [vocab[i][:rng.integers(1, 6)] for i in rng.integers(0, n, size=queries)]
+        lat = []
+        for p in prefixes:
+            q0 = time.perf_counter()
+            index.suggest(p, 10)
+            lat.append(time.perf_counter() - q0)
+        lat_us = np.array(lat) * 1e6
+        print(json.dumps({
+            "labels": n,
+            **{k: files[MANIFEST][k] for k in ("keys", "hot")},
+            "bytes": sum(p.stat().st_size for p in Path(d).iterdir()),
+            "build_s": round(t1 - t0, 3),
+            "suggest_us_p50": round(float(np.percentile(lat_us, 50)), 1),
+            "suggest_us_p99": round(float(np.percentile(lat_us, 99)), 1),
+        }, indent=2))
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Build or query the prefix autocomplete index")
+    ap.add_argument("prefix", nargs="?", help="Text typed so far")
+    ap.add_argument("-k", type=int, default=10)
+    ap.add_argument("--kind", action="append", choices=list(KINDS.values()), help="Restrict to entity type(s)")
+    ap.add_argument("--ttl", type=Path, help=f"Build from skills.ttl (e.g. {TTL_OUT / 'skills.ttl'}) instead of the CSV export")
+    ap.add_argument("--graph-dir", type=Path, default=GRAPH)
+    ap.add_argument("--index-dir", type=Path, default=DEFAULT_DIR)
+    ap.add_argument("--build", action="store_true", help="(Re)build first")
+    ap.add_argument("--bench", type=int, metavar="N", help="Synthetic build + query benchmark with N labels")
+    args = ap.parse_args()
+
+    if args.bench:
+        _bench(args.bench)
+        return
+    if args.build or not (args.index_dir / MANIFEST).exists():
+        build_from_source(args.ttl, args.graph_dir, args.index_dir)
+    if args.prefix:
+        for hit in PrefixIndex(args.index_dir).suggest(args.prefix, args.k, args.kind):
+            print(f"{hit['kind']:<10}  {hit['label']}  ({hit['id']})")
+
+
+if __name__ == "__main__":
+    _cli()
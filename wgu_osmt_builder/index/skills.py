@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+index/skills.py
+Precomputed lookup index of the built corpus, so services answer skill
+queries without loading skills.ttl into rdflib per process.
+
+- skills:      RSD id → record (labels, dates, linked keyword labels,
+               category labels, occupation / collection / standard ids)
+- keywords:    clean_label(keyword) → RSD ids
+- occupations: occupation id → RSD ids (direct links; subtree queries use
+               index/occupations.py when occupations.npz sits next to it)
+- collections: collection id → RSD ids (the bare identifier also resolves)
+
+Posting lists are sorted, so pagination is a slice. The file is written
+atomically (tmp + replace); readers either see the old or the new build.
+
+IN:  wgu_osmt_builder/data/out/ttl/skills.ttl (or the graph CSV export)
+OUT: wgu_osmt_builder/data/out/index/skills.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import GRAPH, TTL_OUT, SKILLS_INDEX
+from wgu_osmt_builder.graph.build.admin_import import NODE_TABLES
+from wgu_osmt_builder.graph.build.export import REL_FILES
+from wgu_osmt_builder.graph.build.schema import CLS_COLLECTION, CLS_OCCUPATION, CLS_RSD, REL_SPECS
+from wgu_osmt_builder.graph.build.stats import load_tables
+from wgu_osmt_builder.index.occupations import NPZ_NAME as OCCUPATIONS_NPZ, OccupationIndex, occupation_key
+from wgu_osmt_builder.validate.keywords import clean_label
+
+logger = configure_logger(__name__)
+
+DEFAULT_PATH = SKILLS_INDEX
+FORMAT = 1
+
+# rel type → record field; label fields store the target's display name instead of its id
+_FIELDS = {
+    "HAS_KEYWORD":    ("keywords", True),
+    "HAS_CATEGORY":   ("categories", True),
+    "HAS_STANDARD":   ("standards", False),
+    "HAS_OCCUPATION": ("occupations", False),
+    "IN_COLLECTION":  ("collections", False),
+}
+_RSD_COLUMNS = ["id", "label", "prefLabel", "identifier", "status", "created", "issued", "modified"]
+
+
+# -------------------- build --------------------
+
+def build_skills_index(tables: dict, source: str = "") -> dict:
+    """Index document from graph tables (stem → (header, rows)), e.g. csv_tables() or graph_tables()."""
+    nodes: dict = {}
+    for cls, (_, stem) in NODE_TABLES.items():
+        _, rows = tables.get(stem, ([], ()))
+        nodes[cls] = {r[0]: r for r in rows}
+
+    skills: dict[str, dict] = {}
+    for rid, row in nodes[CLS_RSD].items():
+        rec = {k: v for k, v in zip(_RSD_COLUMNS, row) if k != "label"}
+        rec.update({field: [] for field, _ in _FIELDS.values()})
+        skills[rid] = rec
+
+    postings: dict[str, dict[str, list[str]]] = {"keywords": {}, "occupations": {}, "collections": {}}
+    for spec in REL_SPECS:
+        if spec.rel_type not in _FIELDS or spec.src_cls == CLS_OCCUPATION:
+            continue
+        field, as_label = _FIELDS[spec.rel_type]
+        targets = nodes[spec.dst_cls]
+        stem = REL_FILES[("RichSkillDescriptor", spec.rel_type)].removesuffix(".csv")
+        for r in tables.get(stem, ([], ()))[1]:
+            rec, target = skills.get(r[0]), targets.get(r[1])
+            if rec is None or target is None:
+                continue  # dangling, as a Neo4j MATCH would drop it
+            name = target[2] if len(target) > 2 else ""
+            rec[field].append(name if as_label else r[1])
+            if field == "keywords":
+                postings["keywords"].setdefault(clean_label(name), []).append(r[0])
+            elif field in postings:
+                postings[field].setdefault(r[1], []).append(r[0])
+
+    for rec in skills.values():
+        for field, _ in _FIELDS.values():
+            rec[field] = sorted(set(rec[field]))
+    for table in postings.values():
+        for key, ids in table.items():
+            table[key] = sorted(set(ids))
+
+    return {
+        "format": FORMAT,
+        "built": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "source": source,
+        "skills": dict(sorted(skills.items())),
+        **postings,
+        "names": {
+            "occupations": {i: r[2] for i, r in nodes[CLS_OCCUPATION].items()},
+            "collections": {i: r[2] for i, r in nodes[CLS_COLLECTION].items()},
+        },
+        "aliases": {"collections": {r[3]: i for i, r in nodes[CLS_COLLECTION].items() if len(r) > 3 and r[3]}},
+    }
+
+
+def write_skills_index(doc: dict, path: Path = DEFAULT_PATH) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(doc, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+    logger.info(json.dumps({
+        "skills_index": str(path),
+        "skills": len(doc["skills"]),
+        "keywords": len(doc["keywords"]),
+        "occupations": len(doc["occupations"]),
+        "collections": len(doc["collections"]),
+    }))
+    return path
+
+
+def build_from_source(ttl_path: Path | None = None, graph_dir: Path = GRAPH, out_path: Path = DEFAULT_PATH) -> Path:
+    """Rebuild from skills.ttl when ttl_path is given, else from the graph CSV export."""
+    tables = load_tables(graph_dir, ttl_path)
+    source = str(ttl_path if ttl_path is not None else graph_dir)
+    return write_skills_index(build_skills_index(tables, source), out_path)
+
+
+# -------------------- query --------------------
+
+class SkillsIndex:
+    def __init__(self, doc: dict, occupations: OccupationIndex | None = None) -> None:
+        if doc.get("format") != FORMAT:
+            raise ValueError(f"Unsupported skills index format: {doc.get('format')!r}")
+        self.doc = doc
+        self.skills: dict[str, dict] = doc["skills"]
+        self.occupations = occupations
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_PATH) -> "SkillsIndex":
+        doc = json.loads(path.read_text(encoding="utf-8"))
+        occ_path = path.parent / OCCUPATIONS_NPZ
+        return cls(doc, OccupationIndex.load(occ_path) if occ_path.exists() else None)
+
+    @property
+    def built(self) -> str:
+        return self.doc.get("built", "")
+
+    def skill(self, rsd_id: str) -> dict | None:
+        return self.skills.get(rsd_id) or self.skills.get(f"rsd-{rsd_id}")
+
+    def by_keyword(self, keyword: str) -> list[str]:
+        return self.doc["keywords"].get(clean_label(keyword), [])
+
+    def by_occupation(self, code: str, subtree: bool = False) -> list[str]:
+        key = occupation_key(code)
+        if subtree and self.occupations is not None:
+            try:
+                return [i for i in self.occupations.skills_under(key) if i in self.skills]
+            except KeyError:
+                pass
+        return self.doc["occupations"].get(key, [])
+
+    def by_collection(self, collection: str) -> list[str]:
+        key = self.doc["aliases"]["collections"].get(collection, collection)
+        return self.doc["collections"].get(key, [])
+
+    def name(self, kind: str, node_id: str) -> str:
+        return self.doc["names"][kind].get(node_id, "")
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Build the skills lookup index (skills.json)")
+    ap.add_argument("--ttl", type=Path, help=f"Build from skills.ttl (e.g. {TTL_OUT / 'skills.ttl'}) instead of the CSV export")
+    ap.add_argument("--graph-dir", type=Path, default=GRAPH)
+    ap.add_argument("--out", type=Path, default=DEFAULT_PATH)
+    args = ap.parse_args()
+    path = build_from_source(args.ttl, args.graph_dir, args.out)
+    print(f"✅ skills index: {len(SkillsIndex.load(path).skills)} skills → {path}")
+
+
+if __name__ == "__main__":
+    _cli()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+serve/loadtest.py
+Load test for the skills query service: N keep-alive client threads replay a
+mix of id / keyword / occupation / collection lookups drawn from the index
+and report throughput and latency percentiles as JSON.
+
+Without --url an in-process server is started on a free port over --index.
+
+  python -m wgu_osmt_builder.serve.loadtest --requests 20000 --concurrency 8
+  python -m wgu_osmt_builder.serve.loadtest --url http://127.0.0.1:8765 --duration 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+import numpy as np
+
+from wgu_osmt_builder.index.skills import DEFAULT_PATH, SkillsIndex
+from wgu_osmt_builder.serve.server import start_server
+
+
+def request_mix(index: SkillsIndex, n: int, seed: int = 0) -> list[str]:
+    """n request targets: half skill ids, the rest list lookups with random pages."""
+    rng = random.Random(seed)
+    skills = list(index.skills)
+    lists = [("keywords", list(index.doc["keywords"])),
+             ("occupations", list(index.doc["occupations"])),
+             ("collections", list(index.doc["collections"]))]
+    lists = [(route, keys) for route, keys in lists if keys]
+    out: list[str] = []
+    for _ in range(n):
+        if not lists or rng.random() < 0.5:
+            out.append(f"/skills/{quote(rng.choice(skills), safe='')}")
+        else:
+            route, keys = rng.choice(lists)
+            out.append(f"/{route}/{quote(rng.choice(keys), safe='')}?offset={rng.choice((0, 0, 20))}&limit=20")
+    return out
+
+
+def run_load(url: str, targets: list[str], concurrency: int = 8, duration: float | None = None) -> dict:
+    """Replay targets (round-robin per worker; until duration when given) and summarize."""
+    parts = urlsplit(url)
+    latencies: list[list[float]] = [[] for _ in range(concurrency)]
+    errors = [0] * concurrency
+    stop_at = time.perf_counter() + duration if duration else None
+
+    def worker(w: int) -> None:
+        conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+        mine = targets[w::concurrency] or targets
+        i = 0
+        while True:
+            if stop_at is None and i >= len(mine):
+                break
+            if stop_at is not None and time.perf_counter() >= stop_at:
+                break
+            t0 = time.perf_counter()
+            try:
+                conn.request("GET", mine[i % len(mine)])
+                res = conn.getresponse()
+                res.read()
+                if res.status >= 500:
+                    errors[w] += 1
+            except (OSError, http.client.HTTPException):
+                errors[w] += 1
+                conn.close()
+                conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+            latencies[w].append(time.perf_counter() - t0)
+            i += 1
+        conn.close()
+
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(w,)) for w in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+
+    lat = np.concatenate([np.array(x) for x in latencies]) * 1000 if any(latencies) else np.zeros(1)
+    n = sum(len(x) for x in latencies)
+    return {
+        "requests": n,
+        "errors": sum(errors),
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "rps": round(n / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(float(lat.mean()), 3),
+            "p50": round(float(np.percentile(lat, 50)), 3),
+            "p90": round(float(np.percentile(lat, 90)), 3),
+            "p99": round(float(np.percentile(lat, 99)), 3),
+            "max": round(float(lat.max()), 3),
+        },
+    }
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Load-test the skills query service")
+    ap.add_argument("--url", help="Running service (default: start one in-process on a free port)")
+    ap.add_argument("--index", type=Path, default=DEFAULT_PATH, help="Skills index used for the request mix")
+    ap.add_argument("--requests", type=int, default=10000, help="Distinct request targets to generate")
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--duration", type=float, help="Run for this many seconds instead of one pass")
+    ap.add_argument("--cache-size", type=int, default=4096, help="LRU size of the in-process server (0 disables)")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    index = SkillsIndex.load(args.index)
+    targets = request_mix(index, args.requests, args.seed)
+    server = None
+    url = args.url
+    if url is None:
+        server = start_server(args.index, port=0, cache_size=args.cache_size, reload_interval=0)
+        host, port = server.server_address[:2]
+        url = f"http://{host}:{port}"
+    try:
+        report = run_load(url, targets, args.concurrency, args.duration)
+        if server is not None:
+            report["cache"] = server.cache.stats()
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+    print(json.dumps({"url": url, **report}, indent=2))
+
+
+if __name__ == "__main__":
+    _cli()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+serve/server.py
+Read-only local HTTP/JSON query service over the skills lookup index
+(index/skills.py), for apps that would otherwise load skills.ttl into
+rdflib in every process.
+
+Routes (GET):
+  /health                           build time, generation, counts, cache stats
+  /skills/<id>                      one skill record ("rsd-" prefix optional)
+  /keywords/<label>                 skills tagged with a keyword (clean_label match)
+  /occupations/<code>[?subtree=1]   skills linked to an occupation, or anywhere under it
+  /collections/<id>                 skills in a collection (id or bare identifier)
+
+List routes take ?offset=&limit= (limit capped at MAX_LIMIT) and answer
+{"query", "total", "offset", "limit", "items"}; items are full skill
+records, or ids only with ?ids=1.
+
+Encoded responses are kept in an LRU keyed by (index generation, path).
+A reloader thread polls the index file and its source (skills.ttl, or the
+graph CSV export): a newer source is re-indexed, a replaced index file is
+loaded and swapped in, and the generation bump retires cached responses.
+
+IN:  wgu_osmt_builder/data/out/index/skills.json (+ occupations.npz if present)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.index.skills import DEFAULT_PATH, SkillsIndex, build_from_source
+
+logger = configure_logger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 500
+DEFAULT_CACHE = 4096
+
+
+class LRUCache:
+    """Thread-safe LRU of encoded responses."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE) -> None:
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+# -------------------- hot reload --------------------
+
+def _signature(path: Path | None) -> tuple[int, int] | None:
+    """(latest mtime_ns, total size) of a file, or of the *.csv files in a directory."""
+    if path is None or not path.exists():
+        return None
+    files = sorted(path.glob("*.csv")) if path.is_dir() else [path]
+    stats = [f.stat() for f in files]
+    return (max((s.st_mtime_ns for s in stats), default=0), sum(s.st_size for s in stats))
+
+
+class IndexHolder:
+    """
+    The live SkillsIndex plus its generation. check() is one reload step:
+    re-index when the source changed and is newer than the index, then swap
+    in the index file when it changed on disk.
+    """
+
+    def __init__(self, index_path: Path = DEFAULT_PATH, ttl_path: Path | None = None, graph_dir: Path | None = None) -> None:
+        self.index_path = index_path
+        self.ttl_path = ttl_path
+        self.graph_dir = graph_dir
+        self.index: SkillsIndex | None = None
+        self.generation = 0
+        self._index_sig: tuple[int, int] | None = None
+        self._source_sig: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    @property
+    def source(self) -> Path | None:
+        return self.ttl_path if self.ttl_path is not None else self.graph_dir
+
+    def _rebuild(self) -> None:
+        t0 = time.perf_counter()
+        build_from_source(self.ttl_path, self.graph_dir, self.index_path)
+        logger.info(f"🔁 re-indexed {self.source} in {time.perf_counter() - t0:.2f}s")
+
+    def check(self) -> bool:
+        """Returns True when a new index was swapped in."""
+        with self._lock:
+            src_sig = _signature(self.source)
+            idx_sig = _signature(self.index_path)
+            if src_sig is not None and src_sig != self._source_sig:
+                if idx_sig is None or src_sig[0] > idx_sig[0]:
+                    self._rebuild()
+                    idx_sig = _signature(self.index_path)
+                self._source_sig = src_sig
+            if idx_sig is None:
+                if self.index is None:
+                    raise FileNotFoundError(f"Skills index not found: {self.index_path} (run `serve --build`)")
+                return False
+            if idx_sig == self._index_sig and self.index is not None:
+                return False
+            self.index = SkillsIndex.load(self.index_path)
+            self._index_sig = idx_sig
+            self.generation += 1
+            logger.info(f"📚 skills index generation {self.generation}: {len(self.index.skills):,} skills ({self.index.built})")
+            return True
+
+    def watch(self, interval: float) -> threading.Thread:
+        def loop() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    self.check()
+                except Exception as e:  # keep serving the previous generation
+                    logger.error(f"❌ reload failed: {e}")
+
+        t = threading.Thread(target=loop, name="skills-index-reload", daemon=True)
+        t.start()
+        return t
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+# -------------------- queries --------------------
+
+def _int(params: dict, name: str, default: int) -> int:
+    try:
+        return max(0, int(params.get(name, [default])[0]))
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+
+
+def query(index: SkillsIndex, path: str, params: dict) -> tuple[int, dict]:
+    """(HTTP status, JSON body) for one request path + parsed query string."""
+    parts = [unquote(p) for p in path.strip("/").split("/", 1)]
+    route, arg = parts[0], (parts[1] if len(parts) > 1 else "")
+    if route == "skills" and arg:
+        rec = index.skill(arg)
+        if rec is None:
+            return HTTPStatus.NOT_FOUND, {"error": f"unknown skill: {arg}"}
+        return HTTPStatus.OK, rec
+
+    if route == "keywords" and arg:
+        ids = index.by_keyword(arg)
+    elif route == "occupations" and arg:
+        ids = index.by_occupation(arg, subtree=params.get("subtree", ["0"])[0] in ("1", "true"))
+    elif route == "collections" and arg:
+        ids = index.by_collection(arg)
+    else:
+        return HTTPStatus.NOT_FOUND, {"error": f"no route: {path}"}
+
+    try:
+        offset = _int(params, "offset", 0)
+        limit = min(_int(params, "limit", DEFAULT_LIMIT), MAX_LIMIT)
+    except ValueError as e:
+        return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+    page = ids[offset:offset + limit]
+    items = page if params.get("ids", ["0"])[0] in ("1", "true") else [index.skills[i] for i in page]
+    return HTTPStatus.OK, {"query": {route: arg}, "total": len(ids), "offset": offset, "limit": limit, "items": items}
+
+
+class SkillsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], holder: IndexHolder, cache_size: int = DEFAULT_CACHE) -> None:
+        super().__init__(address, SkillsHandler)
+        self.holder = holder
+        self.cache = LRUCache(cache_size)
+        self._generation = holder.generation
+
+    def respond(self, target: str) -> tuple[int, bytes]:
+        holder = self.holder
+        if holder.generation != self._generation:
+            self.cache.clear()
+            self._generation = holder.generation
+        key = (holder.generation, target)
+        hit = self.cache.get(key)
+        if hit is not None:
+            return hit
+        url = urlsplit(target)
+        if url.path.rstrip("/") == "/health":
+            index = holder.index
+            body = {
+                "built": index.built, "generation": holder.generation, "source": index.doc.get("source", ""),
+                "skills": len(index.skills), "keywords": len(index.doc["keywords"]),
+                "occupations": len(index.doc["occupations"]), "collections": len(index.doc["collections"]),
+                "cache": self.cache.stats(),
+            }
+            return HTTPStatus.OK, json.dumps(body).encode("utf-8")  # never cached
+        status, body = query(holder.index, url.path, parse_qs(url.query))
+        res = (int(status), json.dumps(body, ensure_ascii=False).encode("utf-8"))
+        if status == HTTPStatus.OK:
+            self.cache.put(key, res)
+        return res
+
+
+class SkillsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive for clients that reuse connections
+    disable_nagle_algorithm = True  # headers and body go out as two writes; avoid the delayed-ACK stall
+    server: SkillsServer
+
+    def do_GET(self) -> None:
+        try:
+            status, payload = self.server.respond(self.path)
+        except Exception as e:
+            logger.error(f"❌ {self.path}: {e}")
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, json.dumps({"error": str(e)}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format % args)
+
+
+def start_server(
+    index_path: Path = DEFAULT_PATH,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    ttl_path: Path | None = None,
+    graph_dir: Path | None = None,
+    cache_size: int = DEFAULT_CACHE,
+    reload_interval: float = 2.0,
+) -> SkillsServer:
+    """Load (or build) the index and start serving on a background thread; port 0 picks a free port."""
+    holder = IndexHolder(index_path, ttl_path, graph_dir)
+    holder.check()
+    server = SkillsServer((host, port), holder, cache_size)
+    if reload_interval > 0:
+        holder.watch(reload_interval)
+    threading.Thread(target=server.serve_forever, name="skills-server", daemon=True).start()
+    return server
+
+
+def serve(**kwargs) -> None:
+    """start_server() in the foreground until interrupted."""
+    server = start_server(**kwargs)
+    host, port = server.server_address[:2]
+    logger.info(f"🌐 serving skills on http://{host}:{port} (GET /health)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.holder.stop()
+        server.shutdown()
+        server.server_close()
@@ -9,8 +9,9 @@ Extract Alignment labels → newline-delimited text.
 from __future__ import annotations
 import argparse
 from pathlib import Path
-from rdflib import Graph, Namespace
+from rdflib import Graph, Literal, Namespace
 from wgu_osmt_builder.common.paths import TTL_OUT, REPORTS
+from wgu_osmt_builder.common.profile import span
 
 DEFAULT_TTL = TTL_OUT / "skills.ttl"
 DEFAULT_OUT = REPORTS / "alignment-labels.txt"
@@ -22,32 +23,34 @@ PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
 PREFIX skos:<http://www.w3.org/2004/02/skos/core#>
 SELECT DISTINCT ?lab WHERE {
   ?s rdf:type :Alignment .
-  { ?s skos:prefLabel ?lab } {FILTER(LANGMATCHES(LANG(?lab), "%LANG%") || LANG(?lab) = "")}
-  %ALT%
+  { ?s skos:prefLabel ?lab } %ALT%
+  FILTER(LANGMATCHES(LANG(?lab), "%LANG%") || LANG(?lab) = "")
 }
 """
 
 
-def extract_alignment_labels(ttl_path: Path, out_path: Path, lang: str = "en", include_alt: bool = False) -> int:
-    g = Graph()
-    g.parse(str(ttl_path), format="turtle")
-
-    alt_block = ""
-    if include_alt:
-        alt_block = """
-        UNION {
-          ?s rdf:type :Alignment .
-          ?s skos:altLabel ?lab .
-          FILTER(LANGMATCHES(LANG(?lab), "%LANG%") || LANG(?lab) = "")
-        }
-        """
+def alignment_labels(g: Graph, lang: str = "en", include_alt: bool = False) -> set[Literal]:
+    alt_block = "UNION { ?s skos:altLabel ?lab }" if include_alt else ""
     q = Q_TMPL.replace("%ALT%", alt_block).replace("%LANG%", lang)
+    return {row[0] for row in g.query(q)}
+
 
-    labels = sorted(str(row[0]) for row in g.query(q))
+def write_alignment_labels(labels: set[Literal], out_path: Path) -> int:
+    out = sorted(str(lab) for lab in labels)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(labels) +
-                        ("\n" if labels else ""), encoding="utf-8")
-    return len(labels)
+    out_path.write_text("\n".join(out) +
+                        ("\n" if out else ""), encoding="utf-8")
+    return len(out)
+
+
+def extract_alignment_labels(ttl_path: Path, out_path: Path, lang: str = "en", include_alt: bool = False) -> int:
+    g = Graph()
+    with span("parse"):
+        g.parse(str(ttl_path), format="turtle")
+    with span("query"):
+        labels = alignment_labels(g, lang=lang, include_alt=include_alt)
+    with span("write"):
+        return write_alignment_labels(labels, out_path)
 
 
 def _cli() -> None:
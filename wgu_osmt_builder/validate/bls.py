@@ -12,9 +12,10 @@ OUT: wgu_osmt_builder/data/out/reports/bls-labels.txt
 from __future__ import annotations
 import argparse
 from pathlib import Path
-from rdflib import Graph
+from rdflib import Graph, Literal
 
 from wgu_osmt_builder.common.paths import TTL_OUT, REPORTS
+from wgu_osmt_builder.common.profile import span
 
 DEFAULT_TTL = TTL_OUT / "skills.ttl"
 DEFAULT_OUT = REPORTS / "bls-labels.txt"
@@ -31,16 +32,24 @@ SELECT DISTINCT ?lab WHERE {
 }
 """
 
-def extract_bls_pref_labels(ttl_path: Path, out_path: Path, lang: str = "en") -> int:
-    g = Graph()
-    g.parse(str(ttl_path), format="turtle")
-
+def bls_pref_labels(g: Graph, lang: str = "en") -> set[Literal]:
     q = Q_TMPL.replace("%LANG%", lang).replace("%NS%", NS_BASE)
-    labels = sorted(str(row[0]) for row in g.query(q))
+    return {row[0] for row in g.query(q)}
 
+def write_bls_pref_labels(labels: set[Literal], out_path: Path) -> int:
+    out = sorted(str(lab) for lab in labels)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(labels) + ("\n" if labels else ""), encoding="utf-8")
-    return len(labels)
+    out_path.write_text("\n".join(out) + ("\n" if out else ""), encoding="utf-8")
+    return len(out)
+
+def extract_bls_pref_labels(ttl_path: Path, out_path: Path, lang: str = "en") -> int:
+    g = Graph()
+    with span("parse"):
+        g.parse(str(ttl_path), format="turtle")
+    with span("query"):
+        labels = bls_pref_labels(g, lang=lang)
+    with span("write"):
+        return write_bls_pref_labels(labels, out_path)
 
 def _cli() -> None:
     ap = argparse.ArgumentParser(description="Extract BLS prefLabels from skills.ttl")
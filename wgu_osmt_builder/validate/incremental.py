@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+validate/incremental.py
+Maintain the four label reports from build changesets instead of
+re-querying the whole graph.
+
+State (under <reports>/.state):
+- subjects.json — per-subject projection: relevant types + prefLabel/altLabel
+                  literals (N3), i.e. everything a report row depends on
+- labels.json   — per-report label multiset {n3: refcount}, plus the build
+                  head it reflects and the ttl signature it was taken from
+
+Refresh:
+- ttl unchanged since the state was saved → nothing to do
+- a chain of changesets (build/changeset.py) leads from the state head to
+  the latest head → apply only the rdf:type / prefLabel / altLabel rows of
+  their delete.nt/add.nt to the touched subjects, adjust refcounts
+- anything else (no state, options changed, chain broken, ttl rebuilt
+  without --changeset) → full rebuild from skills.ttl
+
+Only reports whose label set changed are rewritten; output is identical to
+validate/{alignments,bls,keywords,rsd}.py.
+
+IN:  wgu_osmt_builder/data/out/ttl/skills.ttl, wgu_osmt_builder/data/out/changes
+OUT: wgu_osmt_builder/data/out/reports/*.txt
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+from collections import Counter
+from pathlib import Path
+
+from rdflib import Graph, Literal, URIRef
+from rdflib.util import from_n3
+
+from wgu_osmt_builder.build.changeset import LATEST, SNAPSHOT_NAME, snapshot_head
+from wgu_osmt_builder.common.log import configure_logger
+from wgu_osmt_builder.common.paths import TTL_OUT, REPORTS, CHANGES
+from wgu_osmt_builder.graph.build.schema import BASE, RDF, SKOS, CLS_ALIGNMENT, CLS_KEYWORD, CLS_RSD
+from wgu_osmt_builder.validate.alignments import write_alignment_labels
+from wgu_osmt_builder.validate.bls import write_bls_pref_labels
+from wgu_osmt_builder.validate.keywords import write_keyword_labels
+from wgu_osmt_builder.validate.rsd import write_rsd_pref_labels
+from wgu_osmt_builder.validate.shards import REPORT_FILES
+
+logger = configure_logger(__name__)
+
+DEFAULT_TTL = TTL_OUT / "skills.ttl"
+STATE_DIR = ".state"
+
+WRITERS = {
+    "alignments": write_alignment_labels,
+    "bls": write_bls_pref_labels,
+    "keywords": write_keyword_labels,
+    "rsd": write_rsd_pref_labels,
+}
+
+_TYPES = {CLS_ALIGNMENT: "Alignment", CLS_KEYWORD: "Keyword", CLS_RSD: "RichSkillDescriptor"}
+_PREDS = {RDF.type: "t", SKOS.prefLabel: "pref", SKOS.altLabel: "alt"}
+_PRED_N3 = tuple(p.n3() for p in _PREDS)
+_BLS = f"{BASE}bls-"
+
+
+# -------------------- projection --------------------
+
+def lang_matches(lit: Literal, lang: str) -> bool:
+    """SPARQL LANGMATCHES(LANG(lit), lang) || LANG(lit) = ''."""
+    tag = (lit.language or "").lower()
+    want = lang.lower()
+    return not tag or tag == want or tag.startswith(want + "-") or want == "*"
+
+
+def _record(s: URIRef, p: URIRef, o, lang: str) -> tuple[str, str, str] | None:
+    """The (subject, slot, value) a triple contributes to the state, if any."""
+    slot = _PREDS.get(p)
+    if slot is None or not isinstance(s, URIRef):
+        return None
+    if slot == "t":
+        name = _TYPES.get(o)
+        return (str(s), "t", name) if name else None
+    if isinstance(o, Literal) and lang_matches(o, lang):
+        return str(s), slot, o.n3()
+    return None
+
+
+def project(iri: str, entry: dict | None, include_alt: bool) -> dict[str, set[str]]:
+    """Report → labels (N3) that one subject contributes."""
+    if not entry:
+        return {}
+    types = set(entry.get("t", ()))
+    pref = set(entry.get("pref", ()))
+    out: dict[str, set[str]] = {}
+    if "Alignment" in types:
+        out["alignments"] = pref | (set(entry.get("alt", ())) if include_alt else set())
+    if iri.startswith(_BLS) and pref:
+        out["bls"] = pref
+    if "Keyword" in types:
+        out["keywords"] = pref
+    if "RichSkillDescriptor" in types:
+        out["rsd"] = pref
+    return {k: v for k, v in out.items() if v}
+
+
+def _add(state: dict, rec: tuple[str, str, str]) -> None:
+    s, slot, val = rec
+    vals = state.setdefault(s, {}).setdefault(slot, [])
+    if val not in vals:
+        vals.append(val)
+
+
+def _remove(state: dict, rec: tuple[str, str, str]) -> None:
+    s, slot, val = rec
+    entry = state.get(s)
+    if not entry or val not in entry.get(slot, ()):
+        return
+    entry[slot].remove(val)
+    if not entry[slot]:
+        del entry[slot]
+    if not entry:
+        del state[s]
+
+
+def build_state(g: Graph, lang: str) -> dict[str, dict]:
+    state: dict[str, dict] = {}
+    for p in _PREDS:
+        for s, _, o in g.triples((None, p, None)):
+            rec = _record(s, p, o, lang)
+            if rec:
+                _add(state, rec)
+    return state
+
+
+def multisets(state: dict[str, dict], include_alt: bool) -> dict[str, Counter]:
+    ms = {k: Counter() for k in REPORT_FILES}
+    for iri, entry in state.items():
+        for rep, labs in project(iri, entry, include_alt).items():
+            ms[rep].update(labs)
+    return ms
+
+
+# -------------------- changesets --------------------
+
+def _ttl_sig(ttl_path: Path) -> list[int]:
+    st = ttl_path.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _latest(changes_dir: Path) -> tuple[Path, str] | None:
+    ptr = changes_dir / LATEST
+    if not ptr.exists():
+        return None
+    meta = json.loads(ptr.read_text(encoding="utf-8"))
+    return changes_dir / meta["dir"], meta["head"]
+
+
+def _built_by(ttl_path: Path, cs_dir: Path) -> bool:
+    """True when ttl_path is not newer than the changeset written after it."""
+    summary = cs_dir / "summary.json"
+    return summary.exists() and ttl_path.stat().st_mtime_ns <= summary.stat().st_mtime_ns
+
+
+def _ttl_head(ttl_path: Path) -> str | None:
+    """
+    Build id of skills.ttl, taken from the snapshot that build --changeset
+    writes right after the merge. None if the ttl is newer (built without it).
+    """
+    snap_dir = ttl_path.parent / ".snapshot"
+    snap = snap_dir / SNAPSHOT_NAME
+    if not snap.exists() or snap.stat().st_mtime_ns < ttl_path.stat().st_mtime_ns:
+        return None
+    return snapshot_head(snap_dir)
+
+
+def changeset_chain(changes_dir: Path, start: str | None) -> tuple[list[Path], str] | None:
+    """
+    Changeset dirs leading from build head `start` to the latest head, oldest
+    first, plus that latest head. None when no such chain exists.
+    """
+    found = _latest(changes_dir)
+    if found is None or start is None:
+        return None
+    latest = found[1]
+    if start == latest:
+        return [], latest
+    by_base: dict[str, tuple[Path, str]] = {}
+    for summary in changes_dir.glob("*/summary.json"):
+        meta = json.loads(summary.read_text(encoding="utf-8"))
+        if meta["base"] == meta["head"]:
+            continue
+        # newest wins when a base was rebuilt more than once
+        prev = by_base.get(meta["base"])
+        if prev is None or summary.parent.name > prev[0].name:
+            by_base[meta["base"]] = (summary.parent, meta["head"])
+    chain: list[Path] = []
+    head = start
+    while head != latest:
+        step = by_base.get(head)
+        if step is None or len(chain) > len(by_base):
+            return None
+        chain.append(step[0])
+        head = step[1]
+    return chain, latest
+
+
+def _delta_rows(path: Path) -> Graph:
+    """Parse only the rows the reports depend on out of an N-Triples file."""
+    g = Graph()
+    if path.exists():
+        with path.open("r", encoding="utf-8") as f:
+            rows = [ln for ln in f if any(p in ln for p in _PRED_N3)]
+        if rows:
+            g.parse(data="".join(rows), format="nt")
+    return g
+
+
+def apply_changeset(state: dict, ms: dict[str, Counter], cs_dir: Path, lang: str, include_alt: bool) -> int:
+    """Apply one changeset in place; returns the number of subjects touched."""
+    recs: list[tuple[bool, tuple[str, str, str]]] = []
+    for added, name in ((False, "delete.nt"), (True, "add.nt")):
+        for s, p, o in _delta_rows(cs_dir / name):
+            rec = _record(s, p, o, lang)
+            if rec:
+                recs.append((added, rec))
+
+    touched = {rec[0] for _, rec in recs}
+    before = {iri: project(iri, state.get(iri), include_alt) for iri in touched}
+    for added, rec in recs:
+        (_add if added else _remove)(state, rec)
+    for iri in touched:
+        after = project(iri, state.get(iri), include_alt)
+        for rep in REPORT_FILES:
+            old, new = before[iri].get(rep, set()), after.get(rep, set())
+            ms[rep].subtract(old - new)
+            ms[rep].update(new - old)
+    for c in ms.values():
+        for k in [k for k, n in c.items() if n <= 0]:
+            del c[k]
+    return len(touched)
+
+
+# -------------------- refresh --------------------
+
+def _load_state(state_dir: Path) -> tuple[dict, dict] | None:
+    try:
+        meta = json.loads((state_dir / "labels.json").read_text(encoding="utf-8"))
+        subjects = json.loads((state_dir / "subjects.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return meta, subjects
+
+
+def _save_state(state_dir: Path, meta: dict, subjects: dict) -> None:
+    state_dir.mkdir(parents=True, exist_ok=True)
+    for name, obj in (("subjects.json", subjects), ("labels.json", meta)):
+        tmp = state_dir / f".{name}.tmp"
+        tmp.write_text(json.dumps(obj, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, state_dir / name)
+
+
+def _write_reports(ms: dict[str, Counter], out_dir: Path, names: list[str]) -> dict[str, int]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    return {k: WRITERS[k]({from_n3(n3) for n3 in ms[k]}, out_dir / REPORT_FILES[k]) for k in names}
+
+
+def refresh_reports(
+    ttl_path: Path,
+    out_dir: Path,
+    lang: str = "en",
+    include_alt: bool = False,
+    changes_dir: Path = CHANGES,
+    force_full: bool = False,
+) -> dict:
+    """
+    Bring all four label reports up to date.
+    Returns {"mode": "noop"|"incremental"|"full", "written": {report: n}, "subjects": n}.
+    """
+    state_dir = out_dir / STATE_DIR
+    sig = _ttl_sig(ttl_path)
+    loaded = None if force_full else _load_state(state_dir)
+
+    mode = "full"
+    dirs: list[Path] = []
+    if loaded is not None:
+        meta, subjects = loaded
+        head = meta.get("head")
+        if meta.get("lang") == lang and meta.get("include_alt") == include_alt:
+            if sig == meta.get("ttl"):
+                mode = "noop"
+            else:
+                chain = changeset_chain(changes_dir, head)
+                if chain and chain[0] and _built_by(ttl_path, chain[0][-1]):
+                    dirs, head = chain
+                    mode = "incremental"
+
+    if mode == "full":
+        g = Graph()
+        g.parse(str(ttl_path), format="turtle")
+        subjects = build_state(g, lang)
+        ms = multisets(subjects, include_alt)
+        changed = list(REPORT_FILES)
+        head = _ttl_head(ttl_path)
+        logger.info(f"🧮 Full report rebuild: {len(subjects):,} subject(s)")
+    else:
+        ms = {k: Counter(meta["labels"].get(k, {})) for k in REPORT_FILES}
+        before = {k: set(c) for k, c in ms.items()}
+        touched = 0
+        for d in dirs:
+            touched += apply_changeset(subjects, ms, d, lang, include_alt)
+        changed = [k for k in REPORT_FILES
+                   if set(ms[k]) != before[k] or not (out_dir / REPORT_FILES[k]).exists()]
+        if dirs:
+            logger.info(f"🧮 Applied {len(dirs)} changeset(s): {touched:,} subject(s) touched, rewrote {changed or 'nothing'}")
+
+    written = _write_reports(ms, out_dir, changed)
+    if mode == "noop":
+        return {"mode": mode, "written": written, "subjects": len(subjects)}
+    _save_state(state_dir, {
+        "head": head,
+        "ttl": sig,
+        "lang": lang,
+        "include_alt": include_alt,
+        "labels": {k: dict(sorted(c.items())) for k, c in ms.items()},
+    }, subjects)
+    return {"mode": mode, "written": written, "subjects": len(subjects)}
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Refresh label reports incrementally from build changesets")
+    ap.add_argument("--ttl", type=Path, default=DEFAULT_TTL)
+    ap.add_argument("--out-dir", type=Path, default=REPORTS)
+    ap.add_argument("--changes-dir", type=Path, default=CHANGES)
+    ap.add_argument("--lang", default="en")
+    ap.add_argument("--alt", action="store_true", help="include skos:altLabel for alignments")
+    ap.add_argument("--full", action="store_true", help="ignore saved state and rebuild")
+    args = ap.parse_args()
+    res = refresh_reports(args.ttl, args.out_dir, lang=args.lang, include_alt=args.alt,
+                          changes_dir=args.changes_dir, force_full=args.full)
+    print(f"✅ reports ({res['mode']}): {res['written']} → {args.out_dir}")
+
+
+if __name__ == "__main__":
+    _cli()
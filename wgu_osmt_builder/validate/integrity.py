@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+validate/integrity.py
+Referential-integrity and data-quality checks over skills.ttl.
+
+One scan of the graph fills four indexes (types, labels, identifiers,
+object-property edges); every check is then a lookup against them, so no
+check issues its own SPARQL query.
+
+Checks (mirroring what the Neo4j load silently drops or rejects):
+- dangling_refs         REL_SPECS edge whose target is not typed with the
+                        class load_rels.cypher MATCHes on
+- untyped_nodes         BASE-namespace subject without rdf:type
+- missing_labels        typed node with no prefLabel (Collection: dct:title)
+- slug_collisions       node carrying several distinct prefLabels in one
+                        language (different source labels → same slug IRI)
+- duplicate_identifiers same natural key (identifier / notation / code) on
+                        more than one node of a class (constraints.cypher)
+
+IN:  wgu_osmt_builder/data/out/ttl/skills.ttl
+OUT: wgu_osmt_builder/data/out/reports/integrity.json
+"""
+
+from __future__ import annotations
+import argparse
+import json
+from collections import defaultdict
+from pathlib import Path
+
+from rdflib import Graph, Literal, URIRef
+
+from wgu_osmt_builder.common.paths import TTL_OUT, REPORTS
+from wgu_osmt_builder.common.profile import span
+from wgu_osmt_builder.graph.build.schema import (
+    BASE, RDF,
+    CLS_RSD, CLS_STANDARD, CLS_OCCUPATION, CLS_COLLECTION, CLS_ALIGNMENT,
+    P_PREF_LABEL, P_TITLE, P_IDENTIFIER, P_NOTATION,
+    localname, REL_SPECS,
+)
+from wgu_osmt_builder.validate.incremental import lang_matches
+
+DEFAULT_TTL = TTL_OUT / "skills.ttl"
+DEFAULT_OUT = REPORTS / "integrity.json"
+
+CHECKS = ("dangling_refs", "untyped_nodes", "missing_labels", "slug_collisions", "duplicate_identifiers")
+
+# expected target class per edge (what load_rels.cypher MATCHes)
+TARGET_CLASS = {spec.pred: spec.dst_cls for spec in REL_SPECS}
+
+# natural-key property per class (constraints.cypher)
+NATURAL_KEY = {
+    CLS_RSD: P_IDENTIFIER,
+    CLS_STANDARD: P_NOTATION,
+    CLS_OCCUPATION: P_IDENTIFIER,
+    CLS_COLLECTION: P_IDENTIFIER,
+    CLS_ALIGNMENT: P_IDENTIFIER,
+}
+
+LABEL_PROP = {c: P_PREF_LABEL for c in TARGET_CLASS.values()} | {CLS_RSD: P_PREF_LABEL, CLS_COLLECTION: P_TITLE}
+
+
+def scan(g: Graph, lang: str = "en") -> dict[str, dict]:
+    """Build the indexes in a single pass over g."""
+    types: dict[URIRef, set[URIRef]] = defaultdict(set)
+    labels: dict[tuple[URIRef, URIRef], dict[str | None, set[str]]] = defaultdict(lambda: defaultdict(set))
+    keys: dict[tuple[URIRef, URIRef], set[str]] = defaultdict(set)
+    edges: list[tuple[URIRef, URIRef, URIRef]] = []
+    subjects: set[URIRef] = set()
+
+    label_props = set(LABEL_PROP.values())
+    key_props = set(NATURAL_KEY.values())
+    edge_props = set(TARGET_CLASS)
+
+    for s, p, o in g:
+        if not isinstance(s, URIRef):
+            continue
+        subjects.add(s)
+        if p == RDF.type:
+            types[s].add(o)
+        elif p in edge_props:
+            if isinstance(o, URIRef):
+                edges.append((s, p, o))
+        else:
+            if isinstance(o, Literal):
+                if p in label_props and lang_matches(o, lang):
+                    labels[(s, p)][o.language].add(str(o))
+                if p in key_props:
+                    keys[(s, p)].add(str(o))
+
+    return {"types": types, "labels": labels, "keys": keys, "edges": edges, "subjects": subjects}
+
+
+def _result(items: list[dict], limit: int) -> dict:
+    return {"count": len(items), "examples": items[:limit]}
+
+
+def check_integrity(g: Graph, lang: str = "en", limit: int = 20) -> dict:
+    """All checks over one scan; returns {summary, checks{name: {count, examples}}}."""
+    idx = scan(g, lang=lang)
+    types, labels, keys, edges, subjects = idx["types"], idx["labels"], idx["keys"], idx["edges"], idx["subjects"]
+    src_class = {spec.pred: spec.src_cls for spec in REL_SPECS}
+
+    dangling = []
+    for s, p, o in sorted(edges):
+        if src_class.get(p) not in types.get(s, ()):
+            continue  # the exporter skips edges from untyped sources; reported below
+        want = TARGET_CLASS[p]
+        have = types.get(o, set())
+        if want not in have:
+            dangling.append({
+                "source": localname(s),
+                "predicate": localname(p),
+                "target": localname(o),
+                "expected": localname(want),
+                "found": sorted(localname(t) for t in have) or None,
+            })
+
+    untyped = [{"node": localname(s)} for s in sorted(subjects)
+               if str(s).startswith(str(BASE)) and not types.get(s)]
+
+    missing = []
+    collisions = []
+    seen_keys: dict[tuple[URIRef, str], list[URIRef]] = defaultdict(list)
+    for s in sorted(types):
+        for cls in sorted(types[s] & set(LABEL_PROP)):
+            prop = LABEL_PROP[cls]
+            by_lang = labels.get((s, prop))
+            if not by_lang:
+                missing.append({"node": localname(s), "class": localname(cls), "property": localname(prop)})
+            else:
+                for lg, vals in sorted(by_lang.items(), key=lambda kv: kv[0] or ""):
+                    if len(vals) > 1:
+                        collisions.append({"node": localname(s), "class": localname(cls), "lang": lg, "labels": sorted(vals)})
+            key_prop = NATURAL_KEY.get(cls)
+            if key_prop is not None:
+                for v in keys.get((s, key_prop), ()):
+                    seen_keys[(cls, v)].append(s)
+
+    dupes = [{"class": localname(cls), "key": v, "nodes": sorted(localname(n) for n in nodes)}
+             for (cls, v), nodes in sorted(seen_keys.items()) if len(nodes) > 1]
+
+    checks = {
+        "dangling_refs": _result(dangling, limit),
+        "untyped_nodes": _result(untyped, limit),
+        "missing_labels": _result(missing, limit),
+        "slug_collisions": _result(collisions, limit),
+        "duplicate_identifiers": _result(dupes, limit),
+    }
+    return {
+        "summary": {k: v["count"] for k, v in checks.items()},
+        "triples": len(g),
+        "checks": checks,
+    }
+
+
+def write_integrity_report(report: dict, out_path: Path) -> int:
+    """Write the report; returns the total number of findings."""
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    return sum(report["summary"].values())
+
+
+def extract_integrity_report(ttl_path: Path, out_path: Path, lang: str = "en", limit: int = 20) -> int:
+    g = Graph()
+    with span("parse"):
+        g.parse(str(ttl_path), format="turtle")
+    with span("query"):
+        report = check_integrity(g, lang=lang, limit=limit)
+    with span("write"):
+        return write_integrity_report(report, out_path)
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Referential-integrity and data-quality checks")
+    ap.add_argument("--ttl", type=Path, default=DEFAULT_TTL)
+    ap.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    ap.add_argument("--lang", default="en")
+    ap.add_argument("--limit", type=int, default=20, help="examples kept per check")
+    ap.add_argument("--strict", action="store_true", help="exit 1 when any check has findings")
+    args = ap.parse_args()
+    n = extract_integrity_report(args.ttl, args.out, lang=args.lang, limit=args.limit)
+    print(f"✅ integrity findings: {n} → {args.out}")
+    if args.strict and n:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    _cli()
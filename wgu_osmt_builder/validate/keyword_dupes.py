@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+validate/keyword_dupes.py
+Cluster near-duplicate Keyword labels (plurals, punctuation variants,
+reordered words) with character-shingle MinHash + LSH, all in NumPy.
+
+Pipeline:
+1. normalise: clean_label, punctuation → space, naive singular, sort tokens
+2. shingle:   rolling hash over every k-byte window (vectorised)
+3. minhash:   multiply-shift hash family, min per label via reduceat
+4. LSH:       band signatures, sort by band key, candidate = same bucket
+5. verify:    signature agreement ≥ threshold, then connected components
+
+Roughly linear in the number of labels; no pairwise comparison.
+
+IN:  wgu_osmt_builder/data/out/ttl/skills.ttl
+OUT: wgu_osmt_builder/data/out/reports/keyword-near-duplicates.json
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph
+
+from wgu_osmt_builder.common.paths import TTL_OUT, REPORTS
+from wgu_osmt_builder.validate.keywords import clean_label, keyword_labels, unique_valid_labels
+
+DEFAULT_TTL = TTL_OUT / "skills.ttl"
+DEFAULT_OUT = REPORTS / "keyword-near-duplicates.json"
+
+_punct_re = re.compile(r"[\W_]+")
+
+# shingle-hash budget per block (rows × permutation chunk stays ~128 MB)
+_BLOCK_SHINGLES = 1 << 20
+_PERM_CHUNK = 16
+
+
+def normalize_for_shingles(label: str) -> str:
+    s = _punct_re.sub(" ", clean_label(label))
+    tokens = []
+    for t in s.split():
+        if len(t) > 3 and t.endswith("s") and not t.endswith("ss"):
+            t = t[:-1]
+        tokens.append(t)
+    return " ".join(sorted(tokens))
+
+
+def _shingle_hashes(texts: list[str], k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    All k-byte shingles of every text as uint64 values, plus the start offset
+    of each text's shingles. Texts shorter than k are padded so every text
+    owns at least one shingle.
+    """
+    enc = [t.encode("utf-8").ljust(k) for t in texts]
+    lengths = np.fromiter((len(b) for b in enc), dtype=np.int64, count=len(enc))
+    buf = np.frombuffer(b"".join(enc), dtype=np.uint8).astype(np.uint64)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    n_sh = lengths - k + 1
+
+    # polynomial rolling value over every window, then keep in-text windows
+    h = np.zeros(len(buf) - k + 1, dtype=np.uint64)
+    for j in range(k):
+        h = h * np.uint64(257) + buf[j:len(buf) - k + 1 + j]
+    keep = np.repeat(starts, n_sh) + (np.arange(n_sh.sum()) - np.repeat(np.cumsum(n_sh) - n_sh, n_sh))
+    offsets = np.concatenate(([0], np.cumsum(n_sh)[:-1]))
+    return h[keep], offsets
+
+
+def minhash_signatures(texts: list[str], num_perm: int = 64, k: int = 3, seed: int = 1) -> np.ndarray:
+    """MinHash signature matrix, shape (len(texts), num_perm), dtype uint32."""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+    sig = np.empty((len(texts), num_perm), dtype=np.uint32)
+
+    i = 0
+    while i < len(texts):
+        # grow the block until the shingle budget is reached
+        j, budget = i, 0
+        while j < len(texts) and (budget < _BLOCK_SHINGLES or j == i):
+            budget += max(len(texts[j]), k)
+            j += 1
+        sh, offsets = _shingle_hashes(texts[i:j], k)
+        sh = sh[:, None]
+        with np.errstate(over="ignore"):
+            for p in range(0, num_perm, _PERM_CHUNK):
+                hv = (sh * a[None, p:p + _PERM_CHUNK] + b[None, p:p + _PERM_CHUNK]) >> np.uint64(32)
+                sig[i:j, p:p + _PERM_CHUNK] = np.minimum.reduceat(hv, offsets, axis=0)
+        i = j
+    return sig
+
+
+def _components(n: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Connected-component label per node (min node index) via min-propagation."""
+    lab = np.arange(n, dtype=np.int64)
+    while len(a):
+        m = np.minimum(lab[a], lab[b])
+        before = lab.copy()
+        np.minimum.at(lab, a, m)
+        np.minimum.at(lab, b, m)
+        lab = lab[lab]
+        if np.array_equal(lab, before):
+            break
+    return lab
+
+
+def lsh_clusters(sig: np.ndarray, bands: int = 16, threshold: float = 0.7, seed: int = 2) -> np.ndarray:
+    """
+    Component id per row; rows sharing an id are near duplicates.
+    Candidates share at least one band bucket; a candidate edge is kept
+    when the estimated Jaccard (signature agreement) ≥ threshold.
+    """
+    n, num_perm = sig.shape
+    rows = num_perm // bands
+    rng = np.random.default_rng(seed)
+    mult = rng.integers(1, 2**63, size=rows, dtype=np.uint64) | np.uint64(1)
+
+    src: list[np.ndarray] = []
+    dst: list[np.ndarray] = []
+    with np.errstate(over="ignore"):
+        for band in range(bands):
+            cols = sig[:, band * rows:(band + 1) * rows].astype(np.uint64)
+            key = (cols * mult[None, :]).sum(axis=1, dtype=np.uint64)
+            order = np.argsort(key, kind="stable")
+            k_sorted = key[order]
+            new_group = np.concatenate(([True], k_sorted[1:] != k_sorted[:-1]))
+            group_start = np.maximum.accumulate(np.where(new_group, np.arange(n), 0))
+            members = ~new_group
+            if members.any():
+                src.append(order[group_start[members]])
+                dst.append(order[members])
+
+    if not src:
+        return np.arange(n, dtype=np.int64)
+    a = np.concatenate(src)
+    b = np.concatenate(dst)
+    pairs = np.unique(np.stack([a, b], axis=1), axis=0)
+    a, b = pairs[:, 0], pairs[:, 1]
+    agree = (sig[a] == sig[b]).mean(axis=1)
+    ok = agree >= threshold
+    return _components(n, a[ok], b[ok])
+
+
+def find_near_duplicates(
+    labels: list[str],
+    threshold: float = 0.7,
+    num_perm: int = 64,
+    bands: int = 16,
+    k: int = 3,
+) -> list[list[str]]:
+    """Clusters (size ≥ 2) of near-duplicate labels, largest first."""
+    if not labels:
+        return []
+    texts = [normalize_for_shingles(lab) for lab in labels]
+    comp = lsh_clusters(minhash_signatures(texts, num_perm=num_perm, k=k), bands=bands, threshold=threshold)
+    order = np.argsort(comp, kind="stable")
+    c_sorted = comp[order]
+    cuts = np.flatnonzero(np.diff(c_sorted)) + 1
+    clusters = [sorted(labels[i] for i in grp) for grp in np.split(order, cuts) if len(grp) > 1]
+    clusters.sort(key=lambda c: (-len(c), c[0]))
+    return clusters
+
+
+def extract_keyword_near_duplicates(ttl_path: Path, out_path: Path, lang: str = "en", threshold: float = 0.7) -> int:
+    g = Graph()
+    g.parse(str(ttl_path), format="turtle")
+
+    labels = unique_valid_labels(str(lab) for lab in keyword_labels(g, lang=lang))
+
+    clusters = find_near_duplicates(labels, threshold=threshold)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(
+        [{"size": len(c), "labels": c} for c in clusters], indent=2, ensure_ascii=False),
+        encoding="utf-8")
+    return len(clusters)
+
+
+# -------------------- benchmark --------------------
+
+def synthetic_vocabulary(n: int, seed: int = 0) -> list[str]:
+    """Deterministic vocabulary with ~25% plural/punctuation/reorder variants."""
+    rng = np.random.default_rng(seed)
+    syll = ["da", "ta", "net", "work", "sec", "ur", "ity", "ana", "ly", "sis", "cloud", "ops",
+            "mod", "el", "ing", "lead", "er", "ship", "pro", "ject", "risk", "man", "age", "ment"]
+    words = sorted({"".join(rng.choice(syll, size=rng.integers(2, 4))) for _ in range(20000)})
+    base_n = int(n * 0.75)
+    idx = rng.integers(0, len(words), size=(base_n, 3))
+    n_tok = rng.integers(1, 4, size=base_n)
+    base = [" ".join(words[j] for j in row[:t]) for row, t in zip(idx, n_tok)]
+    variants = []
+    for s in rng.choice(base, size=n - base_n):
+        kind = rng.integers(0, 3)
+        if kind == 0:
+            variants.append(s + "s")
+        elif kind == 1:
+            variants.append(s.replace(" ", "-") + ".")
+        else:
+            variants.append(" ".join(reversed(s.split())))
+    return base + variants
+
+
+def _bench(n: int) -> None:
+    labels = synthetic_vocabulary(n)
+    t0 = time.perf_counter()
+    texts = [normalize_for_shingles(lab) for lab in labels]
+    t1 = time.perf_counter()
+    sig = minhash_signatures(texts)
+    t2 = time.perf_counter()
+    comp = lsh_clusters(sig)
+    t3 = time.perf_counter()
+    n_clusters = int((np.bincount(comp) > 1).sum())
+    print(json.dumps({
+        "labels": n,
+        "normalize_s": round(t1 - t0, 3),
+        "minhash_s": round(t2 - t1, 3),
+        "lsh_s": round(t3 - t2, 3),
+        "labels_per_s": round(n / (t3 - t0)),
+        "clusters": n_clusters,
+    }))
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(
+        description="Cluster near-duplicate Keyword labels (MinHash/LSH)")
+    ap.add_argument("--ttl", type=Path, default=DEFAULT_TTL)
+    ap.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    ap.add_argument("--lang", default="en")
+    ap.add_argument("--threshold", type=float, default=0.7, help="min estimated Jaccard to link two labels")
+    ap.add_argument("--bench", type=int, metavar="N", help="benchmark on N synthetic labels instead")
+    args = ap.parse_args()
+    if args.bench:
+        _bench(args.bench)
+        return
+    n = extract_keyword_near_duplicates(args.ttl, args.out, lang=args.lang, threshold=args.threshold)
+    print(f"✅ keyword near-duplicate clusters: {n} → {args.out}")
+
+
+if __name__ == "__main__":
+    _cli()
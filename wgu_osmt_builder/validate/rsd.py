@@ -12,8 +12,9 @@ OUT: wgu_osmt_builder/data/out/reports/rsd-pref-labels.txt
 from __future__ import annotations
 import argparse
 from pathlib import Path
-from rdflib import Graph
+from rdflib import Graph, Literal
 from wgu_osmt_builder.common.paths import TTL_OUT, REPORTS
+from wgu_osmt_builder.common.profile import span
 
 DEFAULT_TTL = TTL_OUT / "skills.ttl"
 DEFAULT_OUT = REPORTS / "rsd-pref-labels.txt"
@@ -30,15 +31,26 @@ SELECT DISTINCT ?lab WHERE {
 """
 
 
-def extract_rsd_pref_labels(ttl_path: Path, out_path: Path, lang: str = "en") -> int:
-    g = Graph()
-    g.parse(str(ttl_path), format="turtle")
+def rsd_pref_labels(g: Graph, lang: str = "en") -> set[Literal]:
+    return {row[0] for row in g.query(Q.replace("%LANG%", lang))}
 
-    labels = sorted(str(row[0]) for row in g.query(Q.replace("%LANG%", lang)))
+
+def write_rsd_pref_labels(labels: set[Literal], out_path: Path) -> int:
+    out = sorted(str(lab) for lab in labels)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(labels) +
-                        ("\n" if labels else ""), encoding="utf-8")
-    return len(labels)
+    out_path.write_text("\n".join(out) +
+                        ("\n" if out else ""), encoding="utf-8")
+    return len(out)
+
+
+def extract_rsd_pref_labels(ttl_path: Path, out_path: Path, lang: str = "en") -> int:
+    g = Graph()
+    with span("parse"):
+        g.parse(str(ttl_path), format="turtle")
+    with span("query"):
+        labels = rsd_pref_labels(g, lang=lang)
+    with span("write"):
+        return write_rsd_pref_labels(labels, out_path)
 
 
 def _cli() -> None:
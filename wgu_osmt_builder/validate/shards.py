@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+validate/shards.py
+Run label reports over sharded TTL output (see build/shard.py).
+
+Each shard is parsed and queried in its own worker; the per-shard label sets
+are unioned before the usual clean/sort/write step, so the reports match a
+run over the monolithic skills.ttl.
+
+IN:  wgu_osmt_builder/data/out/ttl/shards/{manifest.json,*.ttl}
+OUT: wgu_osmt_builder/data/out/reports/*.txt
+"""
+
+from __future__ import annotations
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from rdflib import Graph, Literal
+
+from wgu_osmt_builder.build.assemble import resolve_workers
+from wgu_osmt_builder.build.shard import select_shards
+from wgu_osmt_builder.common.paths import TTL_OUT, REPORTS
+from wgu_osmt_builder.validate.alignments import alignment_labels, write_alignment_labels
+from wgu_osmt_builder.validate.bls import bls_pref_labels, write_bls_pref_labels
+from wgu_osmt_builder.validate.keywords import keyword_labels, write_keyword_labels
+from wgu_osmt_builder.validate.rsd import rsd_pref_labels, write_rsd_pref_labels
+
+DEFAULT_SHARDS = TTL_OUT / "shards"
+
+REPORT_FILES = {
+    "alignments": "alignment-labels.txt",
+    "bls": "bls-labels.txt",
+    "keywords": "keyword-labels.txt",
+    "rsd": "rsd-pref-labels.txt",
+}
+
+
+def _shard_labels(ttl_path: str, selected: list[str], lang: str, include_alt: bool) -> dict[str, set[Literal]]:
+    g = Graph()
+    g.parse(ttl_path, format="turtle")
+    out: dict[str, set[Literal]] = {}
+    if "alignments" in selected:
+        out["alignments"] = alignment_labels(g, lang=lang, include_alt=include_alt)
+    if "bls" in selected:
+        out["bls"] = bls_pref_labels(g, lang=lang)
+    if "keywords" in selected:
+        out["keywords"] = keyword_labels(g, lang=lang)
+    if "rsd" in selected:
+        out["rsd"] = rsd_pref_labels(g, lang=lang)
+    return out
+
+
+def extract_reports_from_shards(
+    shard_dir: Path,
+    out_dir: Path,
+    selected: list[str],
+    names: list[str] | None = None,
+    lang: str = "en",
+    include_alt: bool = False,
+    workers: int = 1,
+) -> dict[str, int]:
+    paths = select_shards(shard_dir, names)
+    merged: dict[str, set[Literal]] = {k: set() for k in selected}
+
+    n = min(resolve_workers(workers), len(paths)) or 1
+    if n > 1:
+        with ProcessPoolExecutor(max_workers=n) as pool:
+            futures = [pool.submit(_shard_labels, str(p), selected, lang, include_alt) for p in paths]
+            results = [f.result() for f in futures]
+    else:
+        results = [_shard_labels(str(p), selected, lang, include_alt) for p in paths]
+
+    for res in results:
+        for k, labels in res.items():
+            merged[k].update(labels)
+
+    writers = {
+        "alignments": write_alignment_labels,
+        "bls": write_bls_pref_labels,
+        "keywords": write_keyword_labels,
+        "rsd": write_rsd_pref_labels,
+    }
+    out_dir.mkdir(parents=True, exist_ok=True)
+    return {k: writers[k](merged[k], out_dir / REPORT_FILES[k]) for k in selected}
+
+
+def _cli() -> None:
+    ap = argparse.ArgumentParser(description="Extract label reports from TTL shards")
+    ap.add_argument("--shards-dir", type=Path, default=DEFAULT_SHARDS)
+    ap.add_argument("--shard", action="append", help="Shard name to include (repeatable; default: all)")
+    ap.add_argument("--out-dir", type=Path, default=REPORTS)
+    ap.add_argument("--lang", default="en")
+    ap.add_argument("--alt", action="store_true", help="include skos:altLabel")
+    ap.add_argument("--workers", type=int, default=0, help="0 = one per CPU")
+    args = ap.parse_args()
+    totals = extract_reports_from_shards(
+        args.shards_dir, args.out_dir, list(REPORT_FILES), names=args.shard,
+        lang=args.lang, include_alt=args.alt, workers=args.workers)
+    print(f"✅ shard reports: {totals} → {args.out_dir}")
+
+
+if __name__ == "__main__":
+    _cli()